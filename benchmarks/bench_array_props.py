@@ -0,0 +1,76 @@
+"""
+Assigning a series of planned loads to a collection prop: the per-member Python constraints of a list valued
+collection prop compared to an array prop, whose vectorised constraints check all members in one call, and the
+rendering of a violation reason that lists the offending members or indices. Requires numpy.
+
+Run: python benchmarks/bench_array_props.py [loads]
+"""
+import sys
+
+import numpy as np
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.array_values import create_array_prop, is_not_negative_array_constraint, \
+    prop_constraint_array_range_functional
+from multilevel_py.constraints import PropValueConstraint, is_float_constraint, \
+    prop_constraint_collection_member_functional, is_not_negative_constraint
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import ConstraintViolationException
+
+LOADS = 100000
+
+
+def eval_at_most_500(value) -> str:
+    return "" if value <= 500.0 else "The value must not be > 500"
+
+
+at_most_500_constraint = PropValueConstraint(name="at_most_500", eval_value_func=eval_at_most_500, eval_on_init=True)
+
+
+@silenced
+def build_plans():
+    ListPlan = Clabject(name="ListPlan")
+    ListPlan.define_props([create_clabject_prop(
+        n='loads', t=1, f='*', i_f=False, coll_desc=(0, LOADS * 10, is_float_constraint),
+        c=[prop_constraint_collection_member_functional(is_not_negative_constraint),
+           prop_constraint_collection_member_functional(at_most_500_constraint)])])
+    ArrayPlan = Clabject(name="ArrayPlan")
+    ArrayPlan.define_props([create_array_prop(
+        n='loads', t=1, f='*', i_f=False, coll_desc=(0, LOADS * 10, is_float_constraint), dtype=np.float64,
+        c=[is_not_negative_array_constraint, prop_constraint_array_range_functional(0.0, 500.0)])])
+    return ListPlan(name="list_plan", init_props={'loads': []}), ArrayPlan(name="array_plan", init_props={'loads': []})
+
+
+def assign(plan, loads):
+    def run():
+        plan.loads = loads
+    return run
+
+
+def render_violation(plan, loads):
+    def run():
+        try:
+            plan.loads = loads
+        except ConstraintViolationException as ex:
+            return str(ex)
+    return run
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else LOADS
+    list_plan, array_plan = build_plans()
+    loads = [float(i % 500) for i in range(number)]
+    violating_loads = [-1.0 if i % 100 == 0 else load for i, load in enumerate(loads)]
+    cases = [
+        ("valid list of loads", assign, loads, loads),
+        ("valid float64 array of loads", assign, loads, np.array(loads)),
+        ("1% negative loads, rendered", render_violation, violating_loads, violating_loads),
+    ]
+    rows = []
+    for case, runner, list_value, array_value in cases:
+        list_seconds = best_of(runner(list_plan, list_value), number=3, repeat=3)
+        array_seconds = best_of(runner(array_plan, array_value), number=3, repeat=3)
+        rows.append([case, "{:.2f}".format(list_seconds * 1e3), "{:.2f}".format(array_seconds * 1e3),
+                     "{:.0f}".format(list_seconds / array_seconds)])
+    print("Assignments of {N} loads".format(N=number))
+    print_table(["case", "member constraints ms", "array constraints ms", "speedup"], rows)
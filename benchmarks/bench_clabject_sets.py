@@ -0,0 +1,41 @@
+"""
+Membership tests and set operations over many clabjects: python sets of clabjects, which hash and compare through
+MetaClabject.__hash__/__eq__, compared to ClabjectIdSets, which work on the integer clabject ids.
+
+Run: python benchmarks/bench_clabject_sets.py
+"""
+from bench_common import best_of, print_table, silenced
+from bench_lightweight_instances import build_model
+
+from multilevel_py.registry import ClabjectIdSet
+
+RECORD_NUMBER = 20000
+
+
+@silenced
+def build_records(number: int) -> list:
+    ParameterisedWeightLoad = build_model()[0]
+    return [ParameterisedWeightLoad(name="RealisedWeightLoad" + str(i), init_props={"actual_value": 180.0},
+                                    lightweight=True) for i in range(number)]
+
+
+if __name__ == "__main__":
+    records = build_records(RECORD_NUMBER)
+    first, second = records[:RECORD_NUMBER * 2 // 3], records[RECORD_NUMBER // 3:]
+    py_first, py_second = set(first), set(second)
+    id_first, id_second = ClabjectIdSet(first), ClabjectIdSet(second)
+    cases = [
+        ("build", lambda: set(first), lambda: ClabjectIdSet(first)),
+        ("membership of all records", lambda: [r in py_first for r in records],
+         lambda: [r in id_first for r in records]),
+        ("intersection", lambda: py_first & py_second, lambda: id_first & id_second),
+        ("union", lambda: py_first | py_second, lambda: id_first | id_second),
+    ]
+    rows = []
+    for case, py_func, id_func in cases:
+        py_seconds = best_of(py_func, number=10, silence=False)
+        id_seconds = best_of(id_func, number=10, silence=False)
+        rows.append([case, "{:.2f}".format(py_seconds * 1e3), "{:.2f}".format(id_seconds * 1e3),
+                     "{:.1f}".format(py_seconds / id_seconds)])
+    print("Sets of {N} lightweight clabjects".format(N=RECORD_NUMBER))
+    print_table(["operation", "set ms", "ClabjectIdSet ms", "speedup"], rows)
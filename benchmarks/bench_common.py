@@ -0,0 +1,35 @@
+import io
+import sys
+import timeit
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+
+def silenced(func):
+    """
+    Wrap func such that the console output of clabject creation does not distort the measurement
+    """
+    def wrapper(*args, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def best_of(func, number: int, repeat: int = 5, silence: bool = True) -> float:
+    """
+    Returns:
+        the best average runtime of func in seconds out of repeat runs of number calls each, silence=False avoids
+        the overhead of redirecting the console output for functions that do not create clabjects
+    """
+    timer = timeit.Timer(silenced(func) if silence else func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def print_table(header: list, rows: list) -> None:
+    widths = [max(len(str(v)) for v in col) for col in zip(header, *rows)]
+    fmt = "  ".join("{:>" + str(w) + "}" for w in widths)
+    print(fmt.format(*header))
+    for row in rows:
+        print(fmt.format(*row))
@@ -0,0 +1,60 @@
+"""
+Evaluation of deterministic constraints on recurring values with and without the constraint memo, e.g. unit symbols
+and association targets as they recur when weight loads are loaded. A memo hit costs a dict lookup, so isinstance and
+ml instance of checks, which are cheaper than that, bypass the memo, and value in set checks pay for the comparison of
+the expected set with its snapshot.
+
+Run: python benchmarks/bench_constraint_memo.py
+"""
+import re
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import PropValueConstraint, constraint_memo, is_str_constraint, \
+    prop_constraint_ml_instance_of_th_order_functional, prop_constraint_value_in_set_functional
+
+NUMBER = 20000
+UNITS = ["kilogram", "pound", "stone", "gram", "ounce", "tonne", "carat", "grain"]
+LEVELS = 6
+
+
+@silenced
+def build_units():
+    from multilevel_py.core import Clabject
+    chain = [Clabject(name="Quantity")]
+    for level in range(1, LEVELS - 1):
+        chain.append(chain[-1](name="QuantityLevel" + str(level)))
+    return chain[0], [chain[-1](name=symbol, lightweight=True) for symbol in UNITS]
+
+
+def eval_symbol_func(value) -> str:
+    if not re.fullmatch(r"[a-z]+(/[a-z]+)?", value):
+        return "{VALUE} is not a unit symbol".format(VALUE=value)
+    return ""
+
+
+if __name__ == "__main__":
+    Quantity, units = build_units()
+    is_symbol = PropValueConstraint(name="is_unit_symbol", eval_value_func=eval_symbol_func, eval_on_init=True,
+                                    deterministic=True)
+    cases = [
+        ("isinstance, valid", is_str_constraint, UNITS),
+        ("isinstance, violated", is_str_constraint, units),
+        ("value in set, violated", prop_constraint_value_in_set_functional(set(UNITS)), [u.upper() for u in UNITS]),
+        ("ml instance of, {L} levels".format(L=LEVELS), prop_constraint_ml_instance_of_th_order_functional(Quantity),
+         units),
+        ("regex", is_symbol, UNITS),
+    ]
+    rows = []
+    for case, constraint, values in cases:
+        def evaluate_all():
+            for value in values:
+                constraint.evaluate(value)
+        direct = best_of(evaluate_all, number=NUMBER // len(values), silence=False)
+        constraint_memo.enable(maxsize=1024)
+        memoised = best_of(evaluate_all, number=NUMBER // len(values), silence=False)
+        info = constraint_memo.info()
+        constraint_memo.disable()
+        rows.append([case, "{:.3f}".format(direct / len(values) * 1e6), "{:.3f}".format(memoised / len(values) * 1e6),
+                     "{:.1f}".format(direct / memoised), str(info.hits), str(info.misses), str(info.bypasses)])
+    print_table(["constraint", "direct us", "memo us", "speedup", "hits", "misses", "bypasses"], rows)
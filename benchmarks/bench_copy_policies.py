@@ -0,0 +1,54 @@
+"""
+Instantiating many lightweight instances of a class whose props hold a large parameter dict and a large default
+list, which most instances never change, under each copy policy. Reports the bytes copied per instantiation, see
+clabject_prop.track_copies, with and without a read of the inherited values by every instance.
+
+Run: python benchmarks/bench_copy_policies.py [instances]
+"""
+import sys
+import time
+
+from bench_common import print_table, silenced
+
+from multilevel_py.clabject_prop import track_copies
+from multilevel_py.core import Clabject, create_clabject_prop
+
+INSTANCES = 2000
+PARAMETERS = 1000
+
+
+@silenced
+def build_class(copy_policy: str):
+    Meta = Clabject(name="CopyPolicyMeta")
+    Meta.define_props([
+        create_clabject_prop(n='parameters', t=1, f='*', i_f=False, copy_policy=copy_policy),
+        create_clabject_prop(n='history', t=2, f='*', i_f=False, d=[[i] for i in range(PARAMETERS)],
+                             copy_policy=copy_policy)])
+    return Meta(name="CopyPolicyClass",
+                init_props={'parameters': {"p" + str(i): [float(i)] for i in range(PARAMETERS)}})
+
+
+@silenced
+def instantiate(Cls, number: int, read: bool):
+    instances, _ = Cls.instantiate_many([{}] * number, lightweight=True)
+    if read:
+        for instance in instances:
+            instance.parameters, instance.history
+    return instances
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else INSTANCES
+    rows = []
+    for copy_policy in ("share", "copy", "copy_on_write", "deepcopy"):
+        row = [copy_policy]
+        for read in (False, True):
+            Cls = build_class(copy_policy)
+            start = time.perf_counter()
+            with track_copies() as report:
+                instantiate(Cls, number, read)
+            seconds = time.perf_counter() - start
+            row += ["{:.0f}".format(report.bytes_per_instantiation / 1024), "{:.3f}".format(seconds)]
+        rows.append(row)
+    print("{N} instances, {P} parameters and history entries".format(N=number, P=PARAMETERS))
+    print_table(["copy policy", "KiB/instantiation", "s", "KiB/instantiation after reads", "s (reads)"], rows)
@@ -0,0 +1,63 @@
+"""
+Queries for all n-th order instances of a clabject: a recursive scan through the instances, as viz.py walks the
+hierarchy, compared to the descendant index that is maintained on instantiation.
+The hierarchy has three class levels below its top clabject and lightweight leaves at the fourth level.
+
+Run: python benchmarks/bench_descendant_index.py [leaves]
+"""
+import resource
+import sys
+import time
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.core import Clabject
+
+LEAVES = 1000000
+FAN_OUT = 10
+
+
+def scan_descendants(clabject, order: int) -> list:
+    if order == 1:
+        return list(clabject.instances)
+    return [descendant for instance in clabject.instances for descendant in scan_descendants(instance, order - 1)]
+
+
+def scan_count(clabject) -> int:
+    return sum(1 + scan_count(instance) for instance in clabject.instances)
+
+
+@silenced
+def build_hierarchy(leaves: int):
+    Top = Clabject(name="Top")
+    parents = [Top]
+    for level in (1, 2):
+        parents = [parent(name=parent.__name__ + "_" + str(i)) for parent in parents for i in range(FAN_OUT)]
+    leaves_per_parent = leaves // len(parents)
+    for parent in parents:
+        parent.instantiate_many([{}] * leaves_per_parent, lightweight=True)
+    return Top, parents
+
+
+if __name__ == "__main__":
+    leaves = int(sys.argv[1]) if len(sys.argv) > 1 else LEAVES
+    start = time.perf_counter()
+    Top, parents = build_hierarchy(leaves)
+    print("Built a hierarchy of {N} leaves in {S:.1f} s, peak RSS {M} MiB".format(
+        N=Top.count_descendants(order=3), S=time.perf_counter() - start,
+        M=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024))
+    cases = [
+        ("count all descendants", lambda: scan_count(Top), lambda: Top.count_descendants(), 5),
+        ("2nd order instances of Top", lambda: scan_descendants(Top, 2), lambda: Top.descendants(order=2), 5),
+        ("leaves below a 2nd level clabject", lambda: scan_descendants(Top.instances[0], 2),
+         lambda: Top.instances[0].descendants(order=2), 5),
+        ("all leaves", lambda: scan_descendants(Top, 3), lambda: Top.descendants(order=3), 1),
+    ]
+    rows = []
+    for case, scan, lookup, number in cases:
+        assert scan() == lookup()
+        scan_seconds = best_of(scan, number=number, repeat=3, silence=False)
+        lookup_seconds = best_of(lookup, number=number, repeat=3, silence=False)
+        rows.append([case, "{:.3f}".format(scan_seconds * 1e3), "{:.3f}".format(lookup_seconds * 1e3),
+                     "{:.0f}".format(scan_seconds / lookup_seconds)])
+    print_table(["query", "scan ms", "index ms", "speedup"], rows)
@@ -0,0 +1,81 @@
+"""
+Cost of the instance of th order constraints: the former hop by hop walk along instance_of() with name based
+comparisons compared to the lookup in the ancestor ids that clabjects store on creation.
+
+Run: python benchmarks/bench_instance_of_checks.py
+"""
+import math
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import prop_constraint_ml_instance_of_th_order_functional, \
+    prop_constraint_is_th_order_instance_of_clabject_set_functional
+from multilevel_py.core import Clabject
+
+NUMBER = 20000
+LEVELS = 6
+
+
+def legacy_ml_instance_of(value, expected_clabject_type, min_inst_steps=1, max_inst_steps=math.inf) -> str:
+    """
+    Replica of the former check of prop_constraint_ml_instance_of_th_order_functional
+    """
+    inst_steps = 0
+    current_clab = value
+    while inst_steps < min_inst_steps:
+        if current_clab == Clabject or current_clab == expected_clabject_type:
+            return "Instantiation order of given clabject is to low."
+        current_clab = current_clab.instance_of()
+        inst_steps += 1
+    while current_clab != Clabject and inst_steps <= max_inst_steps:
+        if current_clab == expected_clabject_type:
+            return ""
+        current_clab = current_clab.instance_of()
+        inst_steps += 1
+    return "Instantiation order of given clabject value is to high"
+
+
+def legacy_in_clabject_set(value, expected_values: set, order: int) -> bool:
+    """
+    Replica of the former check of prop_constraint_is_th_order_instance_of_clabject_set_functional
+    """
+    for _ in range(order):
+        value = value.instance_of()
+    return value in expected_values
+
+
+@silenced
+def build_chain(levels: int) -> list:
+    """
+    Returns:
+        a chain of clabjects, each one an instance of its predecessor, the last one is a lightweight instance
+    """
+    chain = [Clabject(name="Level0")]
+    for level in range(1, levels):
+        chain.append(chain[-1](name="Level" + str(level), lightweight=(level == levels - 1)))
+    return chain
+
+
+if __name__ == "__main__":
+    chain = build_chain(LEVELS)
+    leaf, top = chain[-1], chain[0]
+    any_order = prop_constraint_ml_instance_of_th_order_functional(top)
+    exact_order = prop_constraint_ml_instance_of_th_order_functional(chain[-2], instantiation_order=1)
+    in_set = prop_constraint_is_th_order_instance_of_clabject_set_functional({chain[-2], top}, order=1)
+    cases = [
+        ("direct instance of", lambda: legacy_ml_instance_of(leaf, chain[-2], 1, 1),
+         lambda: exact_order.eval_value_func(leaf)),
+        ("instance of any order, {L} levels".format(L=LEVELS), lambda: legacy_ml_instance_of(leaf, top),
+         lambda: any_order.eval_value_func(leaf)),
+        ("not an instance", lambda: legacy_ml_instance_of(top, chain[-2], 1, 1),
+         lambda: exact_order.eval_value_func(top)),
+        ("1st order instance of set", lambda: legacy_in_clabject_set(leaf, {chain[-2], top}, 1),
+         lambda: in_set.eval_value_func(leaf)),
+    ]
+    rows = []
+    for case, legacy_func, func in cases:
+        legacy = best_of(legacy_func, number=NUMBER, silence=False)
+        indexed = best_of(func, number=NUMBER, silence=False)
+        rows.append([case, "{:.2f}".format(legacy * 1e6), "{:.2f}".format(indexed * 1e6),
+                     "{:.1f}".format(legacy / indexed)])
+    print_table(["check", "walk us", "ancestor ids us", "speedup"], rows)
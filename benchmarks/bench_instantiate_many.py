@@ -0,0 +1,31 @@
+"""
+Throughput of realising weight load records one call per row and in bulk via instantiate_many.
+
+Run: python benchmarks/bench_instantiate_many.py
+"""
+from bench_common import best_of, print_table
+from bench_lightweight_instances import build_model
+
+RECORD_NUMBER = 2000
+
+
+def realise_per_call(ParameterisedWeightLoad, lightweight: bool):
+    for i in range(RECORD_NUMBER):
+        ParameterisedWeightLoad(name="RealisedWeightLoad" + str(i), declare_as_instance=True,
+                                init_props={"actual_value": 180.0 + i}, lightweight=lightweight)
+
+
+def realise_in_bulk(ParameterisedWeightLoad, lightweight: bool):
+    rows = [{"actual_value": 180.0 + i} for i in range(RECORD_NUMBER)]
+    ParameterisedWeightLoad.instantiate_many(rows, declare_as_instance=True, lightweight=lightweight)
+
+
+if __name__ == "__main__":
+    rows = []
+    for lightweight in (False, True):
+        for realise in (realise_per_call, realise_in_bulk):
+            seconds = best_of(lambda: realise(build_model()[0], lightweight), number=1, repeat=3)
+            rows.append(["lightweight" if lightweight else "class", realise.__name__,
+                         "{:.0f}".format(RECORD_NUMBER / seconds)])
+    print("Realisation of {N} weight load records".format(N=RECORD_NUMBER))
+    print_table(["materialised as", "mode", "records/s"], rows)
@@ -0,0 +1,71 @@
+"""
+Per-step cost of an instantiation in relation to the number of props defined on the instantiated clabject.
+
+Run: python benchmarks/bench_instantiation_step.py
+"""
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_str_constraint, is_int_constraint
+from multilevel_py.core import Clabject, create_clabject_prop
+
+PROP_NUMBERS = [10, 30, 60, 120, 240]
+CHAIN_DEPTH = 12
+
+
+@silenced
+def build_meta(prop_number: int):
+    """
+    A clabject with prop_number props of mixed kind: already instantiated simple and collection props as well as
+    props that are due at later steps
+    """
+    Meta = Clabject(name="BenchMeta")
+    props = []
+    for i in range(prop_number):
+        kind = i % 3
+        if kind == 0:
+            props.append(create_clabject_prop(n="simple_" + str(i), t=0, f='*', c=[is_str_constraint], v="value"))
+        elif kind == 1:
+            props.append(create_clabject_prop(
+                n="coll_" + str(i), t=0, f='*', coll_desc=(0, 100, is_int_constraint), v=list(range(20))))
+        else:
+            props.append(create_clabject_prop(n="later_" + str(i), t=3, f='*', c=[is_int_constraint]))
+    Meta.define_props(props)
+    return Meta
+
+
+@silenced
+def build_chain(prop_number: int, depth: int):
+    """
+    A chain of depth clabjects, each step initialises a single prop, all other props are due at the bottom
+    """
+    Top = Clabject(name="ChainTop")
+    props = [create_clabject_prop(n="level_" + str(i), t=i + 1, f='*', c=[is_int_constraint])
+             for i in range(depth)]
+    props += [create_clabject_prop(n="bottom_" + str(i), t=depth + 1, f='*', c=[is_int_constraint])
+              for i in range(prop_number)]
+    Top.define_props(props)
+    chain = [Top]
+    for i in range(depth):
+        chain.append(chain[-1](name="Chain_" + str(i), init_props={"level_" + str(i): i}))
+    return chain
+
+
+if __name__ == "__main__":
+    print("Instantiation of a clabject with n props")
+    rows = []
+    for prop_number in PROP_NUMBERS:
+        Meta = build_meta(prop_number)
+        per_step = best_of(lambda: Meta(name="BenchCls"), number=200)
+        rows.append([prop_number, "{:.1f}".format(per_step * 1e6), "{:.2f}".format(per_step * 1e6 / prop_number)])
+    print_table(["props", "us/step", "us/step/prop"], rows)
+
+    print()
+    print("Instantiation along a chain of {D} clabjects".format(D=CHAIN_DEPTH))
+    rows = []
+    for prop_number in PROP_NUMBERS:
+        chain = build_chain(prop_number, CHAIN_DEPTH)
+        Bottom = chain[CHAIN_DEPTH // 2]
+        next_level = "level_" + str(CHAIN_DEPTH // 2)
+        per_step = best_of(lambda: Bottom(name="ChainCls", init_props={next_level: 1}), number=200)
+        rows.append([prop_number, "{:.1f}".format(per_step * 1e6)])
+    print_table(["props", "us/step at depth " + str(CHAIN_DEPTH // 2)], rows)
@@ -0,0 +1,65 @@
+"""
+Feeding the records of a large source into a collection prop: a list value, which is materialised and validated
+member by member on assignment, compared to a lazy collection, whose validation is deferred to a chunk-wise
+iteration, with and without a cache of its members. Reports the time and the peak of traced memory of the
+assignment and of one pass over the members.
+
+Run: python benchmarks/bench_lazy_collections.py [records]
+"""
+import sys
+import time
+import tracemalloc
+from math import inf
+
+from bench_common import print_table, silenced
+
+from multilevel_py.collection_values import LazyCollection
+from multilevel_py.constraints import is_int_constraint
+from multilevel_py.core import Clabject, create_clabject_prop
+
+RECORDS = 1000000
+
+
+@silenced
+def build_log():
+    Log = Clabject(name="Log")
+    Log.define_props([create_clabject_prop(n='records', t=1, f='*', i_f=False,
+                                           coll_desc=(0, inf, is_int_constraint))])
+    return Log(name="log", init_props={'records': []})
+
+
+def records(number: int):
+    return (i * 7 % 1000 for i in range(number))
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    log = build_log()
+    cases = [
+        ("list", lambda: list(records(number))),
+        ("lazy", lambda: LazyCollection(lambda: records(number))),
+        ("lazy, cached", lambda: LazyCollection(lambda: records(number), cache=True)),
+    ]
+    rows = []
+    for case, value_factory in cases:
+        def assign():
+            log.records = value_factory()
+        _, assign_seconds, assign_peak = measure(assign)
+        total, pass_seconds, pass_peak = measure(lambda: sum(log.records))
+        _, second_pass_seconds, _ = measure(lambda: sum(log.records))
+        rows.append([case, "{:.3f}".format(assign_seconds), "{:.1f}".format(assign_peak / 2 ** 20),
+                     "{:.3f}".format(pass_seconds), "{:.1f}".format(pass_peak / 2 ** 20),
+                     "{:.3f}".format(second_pass_seconds)])
+        log.records = []
+    print("{N} records".format(N=number))
+    print_table(["value", "assignment s", "assignment MiB", "1st pass s", "1st pass MiB", "2nd pass s"], rows)
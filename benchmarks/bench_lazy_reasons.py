@@ -0,0 +1,87 @@
+"""
+Cost of failed checks whose message is never read: violation reasons and structural exceptions that were formatted
+eagerly, replicated below, compared to the lazy reasons and exceptions that format on demand. The probes test the
+reason for truth or catch the exception, as fail-fast validation, hasattr() and getattr() with default do.
+
+Run: python benchmarks/bench_lazy_reasons.py
+"""
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_int_constraint, prop_constraint_value_in_set_functional
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import UninitialisedPropException, UnduePropInstantiationException
+
+NUMBER = 20000
+
+
+def legacy_isinstance_reason(value, expected_type) -> str:
+    """
+    Replica of the former reason of prop_constraint_py_isinstance_functional
+    """
+    if not isinstance(value, expected_type):
+        return "{VALUE} is not of the expected type {TYPE}".format(VALUE=str(value), TYPE=expected_type.__name__)
+    return ""
+
+
+def legacy_in_set_reason(value, expected_set) -> str:
+    """
+    Replica of the former reason of prop_constraint_value_in_set_functional
+    """
+    if value in expected_set:
+        return ""
+    return "The Value {VAL} is not in the expected set {SET}".format(VAL=value, SET=expected_set)
+
+
+class LegacyUninitialisedPropException(Exception):
+    def __init__(self, prop_name: str):
+        ex_msg = "Property '{PROP}' has to be instantiated at this level.".format(PROP=prop_name)
+        super(LegacyUninitialisedPropException, self).__init__(self, ex_msg)
+
+
+class LegacyUnduePropInstantiationException(Exception):
+    def __init__(self, prop_name: str, later_steps_number: int):
+        ex_msg = "Propery {PROP} is not due to be instantiated. It's has to be instantiated at {STEPS}.".format(
+            PROP=prop_name, STEPS=str(later_steps_number))
+        super(LegacyUnduePropInstantiationException, self).__init__(self, ex_msg)
+
+
+def raise_and_catch(exception_class, *args):
+    def probe():
+        try:
+            raise exception_class(*args)
+        except exception_class:
+            return False
+    return probe
+
+
+@silenced
+def build_weight_load():
+    WeightLoad = Clabject(name="WeightLoad")
+    WeightLoad.define_props([create_clabject_prop(n='planned_value', t=1, f='*', c=[is_int_constraint])])
+    return WeightLoad
+
+
+if __name__ == "__main__":
+    WeightLoad = build_weight_load()
+    series = [float(i) for i in range(100)]
+    units = {"kg", "lb", "t", "g", "oz", "st"}
+    in_units = prop_constraint_value_in_set_functional(units)
+    cases = [
+        ("isinstance of a 100 float series", lambda: bool(legacy_isinstance_reason(series, int)),
+         lambda: bool(is_int_constraint.eval_value_func(series))),
+        ("value in set", lambda: bool(legacy_in_set_reason("lbs", units)),
+         lambda: bool(in_units.eval_value_func("lbs"))),
+        ("raise UninitialisedPropException", raise_and_catch(LegacyUninitialisedPropException, "planned_value"),
+         raise_and_catch(UninitialisedPropException, "planned_value")),
+        ("raise UnduePropInstantiationException",
+         raise_and_catch(LegacyUnduePropInstantiationException, "planned_value", 2),
+         raise_and_catch(UnduePropInstantiationException, "planned_value", 2)),
+    ]
+    rows = []
+    for case, eager_func, lazy_func in cases:
+        eager = best_of(eager_func, number=NUMBER, silence=False)
+        lazy = best_of(lazy_func, number=NUMBER, silence=False)
+        rows.append([case, "{:.3f}".format(eager * 1e6), "{:.3f}".format(lazy * 1e6), "{:.1f}".format(eager / lazy)])
+    hasattr_probe = best_of(lambda: hasattr(WeightLoad, "actual_value"), number=NUMBER, silence=False)
+    rows.append(["hasattr on an undefined prop", "-", "{:.3f}".format(hasattr_probe * 1e6), "-"])
+    print_table(["probe", "eager us", "lazy us", "speedup"], rows)
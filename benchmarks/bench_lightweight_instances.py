@@ -0,0 +1,58 @@
+"""
+Throughput of realising records, i.e. of creating declared instances, as classes and as lightweight instances.
+The records are realised weight loads and deadlifts as in examples/deadlift_chain.py.
+
+Run: python benchmarks/bench_lightweight_instances.py
+"""
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_float_constraint, prop_constraint_ml_instance_of_th_order_functional
+from multilevel_py.core import Clabject, create_clabject_prop
+
+RECORD_NUMBER = 2000
+
+
+@silenced
+def build_model():
+    """
+    Returns:
+        ParameterisedWeightLoad and ParameterisedDeadlift, the clabjects that are realised by the records
+    """
+    WeightLoad = Clabject(name="WeightLoad")
+    WeightLoad.define_props([
+        create_clabject_prop(n='planned_value', t=1, f='*', i_f=False, c=[is_float_constraint]),
+        create_clabject_prop(n='actual_value', t=2, f='*', i_f=True, c=[is_float_constraint])])
+    ParameterisedWeightLoad = WeightLoad(name='ParameterisedWeightLoad', init_props={'planned_value': 180.0})
+
+    is_weight_load = prop_constraint_ml_instance_of_th_order_functional(ParameterisedWeightLoad, instantiation_order=1)
+
+    def describe(obj) -> str:
+        return "Deadlift of " + str(obj.weight_load.actual_value)
+
+    Deadlift = Clabject(name="Deadlift")
+    Deadlift.define_props([
+        create_clabject_prop(n='weight_load', t=2, f='*', i_f=True, i_assoc=True, c=[is_weight_load]),
+        create_clabject_prop(n='describe', t=1, f='*', i_f=True, i_m=True, c=[])])
+    ParameterisedDeadlift = Deadlift(name="ParameterisedDeadlift", init_props={'describe': describe})
+    return ParameterisedWeightLoad, ParameterisedDeadlift
+
+
+def realise_records(ParameterisedWeightLoad, ParameterisedDeadlift, number: int, lightweight: bool):
+    for i in range(number):
+        weight_load = ParameterisedWeightLoad(name="RealisedWeightLoad" + str(i), declare_as_instance=True,
+                                              init_props={"actual_value": 180.0 + i}, lightweight=lightweight)
+        ParameterisedDeadlift(name="RealisedDeadlift" + str(i), declare_as_instance=True,
+                              init_props={"weight_load": weight_load}, lightweight=lightweight)
+
+
+if __name__ == "__main__":
+    rows = []
+    for lightweight in (False, True):
+        def run():
+            realise_records(*build_model(), number=RECORD_NUMBER, lightweight=lightweight)
+        seconds = best_of(run, number=1, repeat=3)
+        records_per_second = 2 * RECORD_NUMBER / seconds
+        rows.append(["lightweight" if lightweight else "class", 2 * RECORD_NUMBER,
+                     "{:.0f}".format(records_per_second)])
+    print("Realisation of weight load and deadlift records")
+    print_table(["materialised as", "records", "records/s"], rows)
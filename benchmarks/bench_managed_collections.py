@@ -0,0 +1,76 @@
+"""
+Growing the child plans of a composite plan one child at a time: the assignment of the grown list, which validates
+every member again, and the former append_childs workaround of examples/plan_chain_common.py, which validated
+[child] by hand before an unchecked append, compared to appending to the managed list of the collection prop.
+
+Run: python benchmarks/bench_managed_collections.py [children]
+"""
+import sys
+import time
+from math import inf
+
+from bench_common import print_table, silenced
+
+from multilevel_py.constraints import prop_constraint_py_isinstance_functional, \
+    prop_constraint_collection_member_functional
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import ConstraintViolationException
+
+CHILDREN = 100000
+# the quadratic assignment is only measured up to this number of children
+ASSIGNMENT_LIMIT = 10000
+
+
+class PlanElement:
+    pass
+
+
+@silenced
+def build_composite_plan():
+    CompositePlan = Clabject(name="CompositePlan")
+    CompositePlan.define_props([create_clabject_prop(n="child_plans", t=1, f='*', i_f=False, c=[],
+                                                     coll_desc=(1, inf, None), d=[])])
+    CompositePlan.add_prop_constraint(prop_name="child_plans", constraint=prop_constraint_collection_member_functional(
+        prop_constraint_py_isinstance_functional(PlanElement)))
+    return CompositePlan(name="composite_plan", init_props={})
+
+
+def grow_by_assignment(plan, children):
+    for child in children:
+        plan.child_plans = plan.child_plans + [child]
+
+
+def grow_by_checked_append(plan, children):
+    # replica of the former append_childs
+    for child in children:
+        violations = plan.check_prop_constraints(prop_name="child_plans", potential_value=[child], init_only=True)
+        if violations:
+            raise ConstraintViolationException(violated_constraints=violations)
+        list.append(plan.child_plans, child)
+
+
+def grow_managed(plan, children):
+    for child in children:
+        plan.child_plans.append(child)
+
+
+def timed(grow, number: int) -> float:
+    plan = build_composite_plan()
+    children = [PlanElement() for _ in range(number)]
+    start = time.perf_counter()
+    grow(plan, children)
+    seconds = time.perf_counter() - start
+    assert len(plan.child_plans) == number
+    return seconds
+
+
+if __name__ == "__main__":
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else CHILDREN
+    rows = []
+    number = 1000
+    while number <= largest:
+        assignment = "{:.3f}".format(timed(grow_by_assignment, number)) if number <= ASSIGNMENT_LIMIT else "-"
+        rows.append([str(number), assignment, "{:.3f}".format(timed(grow_by_checked_append, number)),
+                     "{:.3f}".format(timed(grow_managed, number))])
+        number *= 10
+    print_table(["children", "assignment s", "checked append s", "managed append s"], rows)
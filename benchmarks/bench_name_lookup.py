@@ -0,0 +1,46 @@
+"""
+Resolution of clabjects by name: a walk through the hierarchy below its root, as loaders resolved association
+targets before, compared to the name registry.
+
+Run: python benchmarks/bench_name_lookup.py [clabjects]
+"""
+import sys
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.core import Clabject, lookup
+
+CLABJECTS = 100000
+NUMBER = 1000
+
+
+def walk_lookup(root, name: str):
+    pending = [root]
+    while pending:
+        clabject = pending.pop()
+        if clabject.__name__ == name:
+            return clabject
+        pending.extend(clabject.instances)
+    return None
+
+
+@silenced
+def build_hierarchy(number: int):
+    DslRoot = Clabject(name="DslRoot")
+    Exercise = DslRoot(name="Exercise")
+    Exercise.instantiate_many([{}] * number, names=["Exercise_" + str(i) for i in range(number)], lightweight=True)
+    return DslRoot
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else CLABJECTS
+    DslRoot = build_hierarchy(number)
+    rows = []
+    for name in ("Exercise", "Exercise_" + str(number // 2), "Exercise_" + str(number - 1)):
+        assert walk_lookup(DslRoot, name) is lookup(name, namespace=DslRoot)
+        walk = best_of(lambda: walk_lookup(DslRoot, name), number=3, silence=False)
+        registry = best_of(lambda: lookup(name, namespace=DslRoot), number=NUMBER, silence=False)
+        rows.append([name, "{:.2f}".format(walk * 1e6), "{:.2f}".format(registry * 1e6),
+                     "{:.0f}".format(walk / registry)])
+    print("Lookups in a hierarchy of {N} clabjects".format(N=number))
+    print_table(["name", "walk us", "registry us", "speedup"], rows)
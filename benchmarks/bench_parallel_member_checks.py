@@ -0,0 +1,61 @@
+"""
+Member constraints on a large collection evaluated sequentially compared to the chunked evaluation on a thread and
+a process pool. The GIL releasing check verifies the checksum of a 64 KiB attachment per member with hashlib, the
+pure Python check sums the digits of a number per member, so it holds the GIL.
+
+Run: python benchmarks/bench_parallel_member_checks.py [members] [workers]
+"""
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from bench_common import best_of, print_table
+
+from multilevel_py.constraints import PropValueConstraint, prop_constraint_collection_member_functional
+
+MEMBERS = 4000
+WORKERS = os.cpu_count() or 1
+
+
+def eval_checksum_func(attachment) -> str:
+    payload, checksum = attachment
+    return "" if hashlib.sha256(payload).digest()[:4] == checksum else "The checksum does not match"
+
+
+def eval_digit_sum_func(number) -> str:
+    digit_sum = 0
+    for _ in range(200):
+        digit_sum = sum(int(digit) for digit in str(number + digit_sum))
+    return "" if digit_sum >= 0 else "The digit sum is negative"
+
+
+has_valid_checksum_constraint = PropValueConstraint(name="has_valid_checksum", eval_value_func=eval_checksum_func,
+                                                    eval_on_init=True)
+digit_sum_constraint = PropValueConstraint(name="digit_sum", eval_value_func=eval_digit_sum_func, eval_on_init=True)
+
+
+def attachments(number: int) -> list:
+    payload = os.urandom(64 * 1024)
+    checksum = hashlib.sha256(payload).digest()[:4]
+    return [(payload, checksum)] * number
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else MEMBERS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else WORKERS
+    cases = [("checksums, GIL released", has_valid_checksum_constraint, attachments(number)),
+             ("digit sums, pure Python", digit_sum_constraint, list(range(number)))]
+    rows = []
+    with ThreadPoolExecutor(max_workers=workers) as threads, ProcessPoolExecutor(max_workers=workers) as processes:
+        for case, member_constraint, members in cases:
+            row = [case]
+            for executor in (None, threads, processes):
+                constraint = prop_constraint_collection_member_functional(
+                    member_constraint, executor=executor, chunk_size=max(1, number // (4 * workers)))
+                constraint.parallel_threshold = 0
+                assert constraint.evaluate(members).ok
+                row.append("{:.1f}".format(best_of(lambda: constraint.evaluate(members), number=1, repeat=3) * 1e3))
+            rows.append(row)
+    print("{N} members, {W} workers".format(N=number, W=workers))
+    print_table(["member constraint", "sequential ms", "thread pool ms", "process pool ms"], rows)
@@ -0,0 +1,48 @@
+"""
+Lookup of descendants by prop value with MetaClabject.query: scans compared to hash and sorted prop indexes.
+The descendants are weight loads with a unit symbol and a planned value.
+
+Run: python benchmarks/bench_prop_queries.py [weight loads]
+"""
+import sys
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_float_constraint, is_str_constraint
+from multilevel_py.core import Clabject, create_clabject_prop
+
+WEIGHT_LOADS = 100000
+
+
+@silenced
+def build_weight_loads(number: int, index_kind: str = None):
+    WeightLoad = Clabject(name="WeightLoad")
+    WeightLoad.define_props([
+        create_clabject_prop(n='symbol', t=1, f='*', i_f=True, c=[is_str_constraint]),
+        create_clabject_prop(n='planned_value', t=1, f='*', i_f=False, c=[is_float_constraint])])
+    if index_kind:
+        WeightLoad.create_index("symbol", kind="hash")
+        WeightLoad.create_index("planned_value", kind=index_kind)
+    rows = [{'symbol': "kg" if i % 100 == 0 else "lb", 'planned_value': float(i % 1000)} for i in range(number)]
+    WeightLoad.instantiate_many(rows, lightweight=True)
+    return WeightLoad
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else WEIGHT_LOADS
+    models = [(kind or "scan", build_weight_loads(number, kind)) for kind in (None, "hash", "sorted")]
+    queries = [
+        ("symbol == 'kg'", dict(symbol="kg")),
+        ("planned_value == 150", dict(planned_value=150.0)),
+        ("planned_value > 995", dict(planned_value__gt=995.0)),
+        ("symbol == 'kg' and planned_value > 500", dict(symbol="kg", planned_value__gt=500.0)),
+    ]
+    rows = []
+    for query, lookups in queries:
+        row = [query]
+        for kind, WeightLoad in models:
+            row.append("{:.3f}".format(best_of(lambda: WeightLoad.query(**lookups), number=3, repeat=3,
+                                               silence=False) * 1e3))
+        rows.append(row)
+    print("Queries over {N} weight loads".format(N=number))
+    print_table(["query"] + ["{K} ms".format(K=kind) for kind, _ in models], rows)
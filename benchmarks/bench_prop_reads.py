@@ -0,0 +1,42 @@
+"""
+Cost of reading props of a clabject: published prop attributes compared to the MetaClabject.__getattr__ fallback,
+a method prop that reads sibling props and negative hasattr() probes.
+
+Run: python benchmarks/bench_prop_reads.py
+"""
+from datetime import timedelta
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_timedelta_constraint
+from multilevel_py.core import Clabject, MetaClabject, create_clabject_prop
+
+NUMBER = 100000
+
+
+@silenced
+def build_set_plan_element():
+    """
+    A simple plan element as in examples/plan_chain_common.py
+    """
+    SimplePlanElement = Clabject(name="SimplePlanElement")
+    SimplePlanElement.define_props([
+        create_clabject_prop(n="exercise_duration", t=1, f='*', i_f=False, c=[is_timedelta_constraint]),
+        create_clabject_prop(n="rest_duration", t=1, f='*', i_f=False, c=[is_timedelta_constraint]),
+        create_clabject_prop(n="calc_train_duration", t=0, f='*', i_m=True, c=[],
+                             v=lambda obj: obj.exercise_duration + obj.rest_duration)])
+    return SimplePlanElement(name="ExerciseSet", init_props={"exercise_duration": timedelta(seconds=30),
+                                                             "rest_duration": timedelta(seconds=90)})
+
+
+if __name__ == "__main__":
+    ExerciseSet = build_set_plan_element()
+    cases = [
+        ("published attribute", lambda: ExerciseSet.exercise_duration),
+        ("__getattr__ fallback", lambda: MetaClabject.__getattr__(ExerciseSet, "exercise_duration")),
+        ("method prop reading two props", lambda: ExerciseSet.calc_train_duration()),
+        ("hasattr of undefined name", lambda: hasattr(ExerciseSet, "undefined")),
+        ("hasattr of undefined dunder", lambda: hasattr(ExerciseSet, "__undefined__")),
+    ]
+    rows = [[case, "{:.3f}".format(best_of(func, number=NUMBER, silence=False) * 1e6)] for case, func in cases]
+    print_table(["read", "us/read"], rows)
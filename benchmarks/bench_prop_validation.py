@@ -0,0 +1,61 @@
+"""
+Per value cost of validating a prop: the former loop of check_violated_prop_constraints, which filters the
+constraints of the prop on every call and calls each constraint, compared to the compiled validator of the prop.
+
+Run: python benchmarks/bench_prop_validation.py
+"""
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_float_constraint, is_not_negative_constraint, is_int_constraint, \
+    prop_constraint_optional_value_functional, prop_constraint_collection_member_functional, \
+    prop_constraint_and_functional
+from multilevel_py.core import Clabject, create_clabject_prop
+
+NUMBER = 100000
+
+
+def legacy_violations(prop, value, init_only=True) -> list:
+    """
+    Replica of the former per prop loop of ClabjectPropDict.check_violated_prop_constraints
+    """
+    violations = []
+    constraints = prop.constraints
+    if init_only:
+        constraints = [c for c in constraints if hasattr(c, "eval_on_init") and c.eval_on_init]
+    for constraint in constraints:
+        if not constraint(value):
+            violations.append(constraint)
+    return violations
+
+
+@silenced
+def build_weight_load():
+    WeightLoad = Clabject(name="WeightLoad")
+    WeightLoad.define_props([
+        create_clabject_prop(n='planned_value', t=1, f='*', c=[is_float_constraint]),
+        create_clabject_prop(n='repetitions', t=1, f='*',
+                             c=[prop_constraint_and_functional(is_not_negative_constraint, is_int_constraint,
+                                                               eval_on_init=True)]),
+        create_clabject_prop(n='rest', t=1, f='*', c=[prop_constraint_optional_value_functional(is_int_constraint)]),
+        create_clabject_prop(n='sets', t=1, f='*', c=[], coll_desc=(1, 10, is_int_constraint)),
+        create_clabject_prop(n='target', t=1, f='*', i_assoc=True, c=[]),
+    ])
+    return WeightLoad
+
+
+if __name__ == "__main__":
+    WeightLoad = build_weight_load()
+    cases = [
+        ("planned_value", 100.0), ("planned_value", "heavy"), ("repetitions", 8), ("rest", 90),
+        ("sets", [8, 8, 6]), ("target", WeightLoad),
+    ]
+    rows = []
+    for prop_name, value in cases:
+        prop = WeightLoad.__ml_props__[prop_name]
+        validate = prop.validator(init_only=True)
+        assert [c.name for c in legacy_violations(prop, value)] == [r.name for r in validate(value)]
+        legacy = best_of(lambda: legacy_violations(prop, value), number=NUMBER, silence=False)
+        compiled = best_of(lambda: validate(value), number=NUMBER, silence=False)
+        rows.append([prop_name, repr(value)[:16], str(len(prop.constraints)), "{:.3f}".format(legacy * 1e6),
+                     "{:.3f}".format(compiled * 1e6), "{:.1f}".format(legacy / compiled)])
+    print_table(["prop", "value", "constraints", "loop us", "compiled us", "speedup"], rows)
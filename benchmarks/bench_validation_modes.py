@@ -0,0 +1,64 @@
+"""
+Throughput of an ingestion workload in which most rows are invalid: the collect-all validation mode, which evaluates
+every constraint of every provided prop before raising, compared to the fail-fast mode, which raises on the first
+violation. Rows are instantiated one by one as lightweight instances and in bulk with instantiate_many.
+
+Run: python benchmarks/bench_validation_modes.py [rows]
+"""
+import sys
+
+from bench_common import best_of, print_table, silenced
+
+from multilevel_py.constraints import is_float_constraint, is_str_constraint, is_not_negative_constraint, \
+    prop_constraint_value_in_set_functional, validation_mode
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import ConstraintViolationException
+
+ROWS = 2000
+INVALID_SHARE = 0.9
+
+
+@silenced
+def build_weight_load():
+    WeightLoad = Clabject(name="WeightLoad")
+    WeightLoad.define_props([
+        create_clabject_prop(n='unit', t=1, f='*', c=[is_str_constraint,
+                                                       prop_constraint_value_in_set_functional({"kg", "lb"})]),
+        create_clabject_prop(n='planned_value', t=1, f='*', c=[is_float_constraint, is_not_negative_constraint]),
+        create_clabject_prop(n='comment', t=1, f='*', c=[is_str_constraint])])
+    return WeightLoad
+
+
+def build_rows(number: int) -> list:
+    invalid_rows = int(number * INVALID_SHARE)
+    return [{'unit': 1, 'planned_value': -1.0, 'comment': None} if i < invalid_rows else
+            {'unit': "kg", 'planned_value': 100.0, 'comment': ""} for i in range(number)]
+
+
+def ingest_one_by_one(WeightLoad, rows: list) -> int:
+    accepted = 0
+    for init_props in rows:
+        try:
+            WeightLoad(name="load", init_props=init_props, lightweight=True)
+            accepted += 1
+        except ConstraintViolationException:
+            pass
+    return accepted
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    WeightLoad = build_weight_load()
+    WeightLoad.retain_instances = False
+    rows = build_rows(number)
+    results = []
+    for mode in ("collect_all", "fail_fast"):
+        with validation_mode(mode):
+            one_by_one = best_of(lambda: ingest_one_by_one(WeightLoad, rows), number=1, repeat=3)
+            bulk = best_of(lambda: WeightLoad.instantiate_many(rows, lightweight=True, collect_all=True),
+                           number=1, repeat=3)
+        results.append((mode, one_by_one, bulk))
+    table = [[mode, "{:.0f}".format(number / one_by_one), "{:.0f}".format(number / bulk)]
+             for mode, one_by_one, bulk in results]
+    print("{N} rows, {P:.0%} invalid".format(N=number, P=INVALID_SHARE))
+    print_table(["mode", "rows/s one by one", "rows/s instantiate_many"], table)
@@ -0,0 +1,128 @@
+"""
+Memory held by the prop records of the example chains, scaled up by re-instantiating their leaf clabjects.
+The records are measured in the current slotted layout (shared descriptor + per-level state) and replicated in
+the former layout, where every prop was a plain object with a __dict__ holding its complete definition.
+
+Run: python benchmarks/memory_report.py [leaves per example]
+"""
+import importlib
+import sys
+import tracemalloc
+from pathlib import Path
+
+from bench_common import print_table, silenced
+
+EXAMPLES = ["collie_chain_initial_example", "collie_extended_chain", "collie_final_extended_chain",
+            "deadlift_chain", "endurance_chain", "plan_chain_simple_element", "plan_chain_composite_element",
+            "strength_chain"]
+LEAVES_PER_EXAMPLE = 2000
+
+# the examples import their common parts as top level modules
+sys.path.insert(0, str(Path(__file__).parent.parent.joinpath("examples").resolve()))
+
+
+class LegacyProp:
+    """
+    Replica of the former prop layout: one __dict__ per prop, holding definition and state alike
+    """
+    def __init__(self, prop):
+        self.prop_name = prop.prop_name
+        self.steps_to_instantiation = prop.steps_to_instantiation
+        self.steps_from_instantiation = prop.steps_from_instantiation
+        self.constraints = list(prop.constraints)
+        self.is_final = prop.is_final
+        self.prop_value = prop.prop_value
+        self.default_value = prop.default_value
+        self.re_init_prop_constr = prop.re_init_prop_constr
+        if prop.descriptor.collection_desc is not None:
+            self.collection_desc = prop.collection_desc
+            self.collection_member_constr = prop.collection_member_constr
+        # materialise the instance dict like any access to vars(prop) or a deepcopy did
+        self.__dict__
+
+
+def walk(clabject):
+    yield clabject
+    for instance in clabject.instances:
+        yield from walk(instance)
+
+
+def prop_records(root) -> list:
+    """
+    Returns:
+        all prop records held by the hierarchy below root, i.e. the records of the deltas and the cached views
+    """
+    records = {}
+    for clabject in walk(root):
+        prop_dict = clabject.__ml_props__
+        layer = prop_dict._layer
+        while layer is not None:
+            for prop in layer.props.values():
+                records[id(prop)] = prop
+            layer = layer.base
+        for prop in prop_dict._cache.values():
+            if prop is not None:
+                records[id(prop)] = prop
+    return list(records.values())
+
+
+@silenced
+def scale_up(root, leaves: int) -> None:
+    """
+    Re-instantiate every declared instance and leaf of the hierarchy with the same init props until the hierarchy
+    contains about the given number of additional leaves
+    """
+    templates = [clabject for clabject in walk(root) if clabject.declared_instance_flag or not clabject.instances]
+    for i in range(leaves):
+        template = templates[i % len(templates)]
+        meta = template.instance_of()
+        init_props = {name: prop.prop_value for name, prop in template.__ml_props__.changed_props()
+                      if name in meta.__ml_props__ and prop.prop_value is not None}
+        meta(name=template.__name__ + str(i), init_props=init_props,
+             speed_adjustments=dict(meta.speed_adjustments.get(template.__name__, {})),
+             declare_as_instance=template.declared_instance_flag)
+
+
+def allocated(build) -> int:
+    """
+    Returns:
+        the number of bytes still allocated by the objects build returns
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del keep
+    return size
+
+
+def slotted_copies(records: list) -> list:
+    copies = []
+    for prop in records:
+        new_prop = prop._copy()
+        new_prop.constraints = list(prop.constraints)
+        copies.append(new_prop)
+    return copies
+
+
+if __name__ == "__main__":
+    leaves = int(sys.argv[1]) if len(sys.argv) > 1 else LEAVES_PER_EXAMPLE
+    rows = []
+    total_records = total_legacy = total_slotted = 0
+    for example in EXAMPLES:
+        root = silenced(importlib.import_module(example).model_snippet)()[0]
+        scale_up(root, leaves)
+        records = prop_records(root)
+        descriptors = {id(prop.descriptor) for prop in records}
+        legacy = allocated(lambda: [LegacyProp(prop) for prop in records])
+        slotted = allocated(lambda: slotted_copies(records))
+        rows.append([example, len(records), len(descriptors), legacy // 1024, slotted // 1024,
+                     "{:.2f}".format(legacy / slotted)])
+        total_records += len(records)
+        total_legacy += legacy
+        total_slotted += slotted
+    rows.append(["total", total_records, "", total_legacy // 1024, total_slotted // 1024,
+                 "{:.2f}".format(total_legacy / total_slotted)])
+    print("Prop records of the examples with {L} additional leaves each".format(L=leaves))
+    print_table(["example", "records", "descriptors", "legacy KiB", "slotted KiB", "ratio"], rows)
@@ -0,0 +1,53 @@
+"""
+Soak test of the instance registry: a service realises weight load records and discards them again. By default
+(retain_instances=False) the registry of the parameterised weight load only holds weak references, so the memory held
+stays flat over the cycles. The retained run opts in to the former behaviour, where every record was kept forever, it
+runs a tenth of the cycles only. Memory is reported as peak resident set size (KiB on Linux).
+
+Run: python benchmarks/soak_instance_registry.py [cycles] [lightweight|class]
+"""
+import gc
+import os
+import resource
+import sys
+from contextlib import redirect_stdout
+
+from bench_common import print_table
+from bench_lightweight_instances import build_model
+
+CYCLES = 2000000
+CHECKPOINTS = 10
+
+
+def soak(cycles: int, lightweight: bool, retain: bool) -> list:
+    """
+    Returns:
+        [cycle, number of registered records, peak RSS] rows at every checkpoint
+    """
+    # a console output buffer, as used by bench_common.silenced, would grow with every created class
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return _soak(cycles, lightweight, retain)
+
+
+def _soak(cycles: int, lightweight: bool, retain: bool) -> list:
+    ParameterisedWeightLoad = build_model()[0]
+    ParameterisedWeightLoad.retain_instances = retain
+    rows = []
+    for cycle in range(1, cycles + 1):
+        weight_load = ParameterisedWeightLoad(name="RealisedWeightLoad", declare_as_instance=True,
+                                              init_props={"actual_value": 180.0}, lightweight=lightweight)
+        del weight_load
+        if cycle % (cycles // CHECKPOINTS) == 0:
+            gc.collect()
+            rows.append([cycle, len(ParameterisedWeightLoad.instances),
+                         resource.getrusage(resource.RUSAGE_SELF).ru_maxrss])
+    return rows
+
+
+if __name__ == "__main__":
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES
+    lightweight = (sys.argv[2] if len(sys.argv) > 2 else "lightweight") == "lightweight"
+    for retain in (False, True):
+        print("Create/discard cycles of {M} records, retain_instances={R}".format(
+            M="lightweight" if lightweight else "class", R=retain))
+        print_table(["cycle", "registered", "peak RSS"], soak(cycles // 10 if retain else cycles, lightweight, retain))
@@ -7,7 +7,6 @@ def model_snippet(sub_composite_hierarchy=False):
     from multilevel_py.constraints import prop_constraint_collection_member_functional as as_member_constr
     from multilevel_py.constraints import is_str_constraint, is_timedelta_constraint
     from multilevel_py.core import Clabject, create_clabject_prop
-    from multilevel_py.exceptions import ConstraintViolationException
 
     # Traditional Class (to be refined in the later development steps)
     class Exercise:
@@ -31,13 +30,8 @@ def model_snippet(sub_composite_hierarchy=False):
         init_props={"calc_plan_duration": calc_plan_duration_recursive})
 
     def append_childs(obj, childs):
-        for child in childs:
-            # [child] to check member constraints
-            violations = obj.check_prop_constraints(prop_name="child_plans", potential_value=[child], init_only=True)
-            if violations:
-                raise ConstraintViolationException(violated_constraints=violations)
-            else:
-                obj.child_plans.append(child)
+        # child_plans is a managed list, which checks the member constraints on the new children only
+        obj.child_plans.extend(childs)
 
     prop_child_plans = create_clabject_prop(
         n="child_plans", t=2, f='*', c=[], coll_desc=(1, inf, None), d=[])
@@ -0,0 +1,356 @@
+from collections.abc import Iterable
+from typing import Any, Callable, List
+
+import numpy as np
+
+from multilevel_py.clabject_prop import CollectionDescription, CollectionProp
+from multilevel_py.constraints import CollectionMultiplicityConstraint, LazyReason, PropValueConstraint, Reason, \
+    is_collection_constraint, is_not_negative_constraint
+from multilevel_py.exceptions import NotVectorisableConstraintException
+
+# number of offending indices a violation reason lists
+REPORTED_INDICES = 10
+
+
+def as_array(value: Any) -> np.ndarray:
+    """
+    Returns:
+        the given array, or an array of the members of an array-like value, for mappings of their keys
+    """
+    if isinstance(value, np.ndarray):
+        return value
+    if isinstance(value, (list, tuple)):
+        return np.asarray(value)
+    return np.asarray(list(value))
+
+
+# abstract scalar types, which stand for all dtypes of a kind
+_ABSTRACT_KINDS = frozenset((np.generic, np.number, np.integer, np.signedinteger, np.unsignedinteger, np.inexact,
+                             np.floating, np.complexfloating, np.flexible, np.character))
+
+
+class OffendingIndicesReason(LazyReason):
+    """
+    The violation reason of an :class:`ArrayConstraint`, which lists the (flat) indices of the offending members
+    and keeps all of them in indices
+    """
+    __slots__ = ("indices",)
+
+    def __init__(self, indices: np.ndarray, requirement: str):
+        super(OffendingIndicesReason, self).__init__(
+            "The members at the indices {INDICES}{MORE} ({N} in total) {REQUIREMENT}", INDICES=indices[:REPORTED_INDICES],
+            MORE=" ..." if len(indices) > REPORTED_INDICES else "", N=len(indices), REQUIREMENT=requirement)
+        self.indices = indices
+
+
+class ArrayConstraint(PropValueConstraint):
+    """
+    A constraint that each member of an array-like value must satisfy, checked by one vectorised NumPy operation
+    on the whole array instead of one Python call per member
+    """
+
+    def __init__(self, name: str, offending_mask: Callable[[np.ndarray], np.ndarray], requirement: str,
+                 eval_on_init: bool = True):
+        """
+        Args:
+            name: the name of the constraint
+            offending_mask: maps an array to a boolean array that is True for the offending members
+            requirement: the violated requirement in the violation reason, e.g. 'must not be < 0'
+            eval_on_init: a value indicating whether the constr should be evaluated on (re) init
+        """
+        self.offending_mask = offending_mask
+        self.requirement = requirement
+        super(ArrayConstraint, self).__init__(name=name, eval_value_func=self._eval_value, eval_on_init=eval_on_init)
+
+    def offending_indices(self, value: Any) -> np.ndarray:
+        """
+        Returns:
+            the flat indices of the members of an array-like value that violate the constraint
+        """
+        return np.flatnonzero(self._offending_mask(value))
+
+    def _offending_mask(self, value: Any) -> np.ndarray:
+        return self.offending_mask(as_array(value))
+
+    def _eval_value(self, value: Any) -> Reason:
+        try:
+            indices = self.offending_indices(value)
+        except (TypeError, ValueError):
+            return LazyReason("The members of {VALUE} can not be checked whether they {REQUIREMENT}", VALUE=value,
+                              REQUIREMENT=self.requirement)
+        return OffendingIndicesReason(indices, self.requirement) if len(indices) else ""
+
+
+class ArrayDtypeConstraint(ArrayConstraint):
+    """
+    Checks whether the members of an array-like value are of a NumPy dtype kind. Arrays of a matching dtype pass by
+    a single dtype check, the members of other values are only checked one by one to find the offending ones.
+    """
+
+    def __init__(self, dtype, eval_on_init: bool = True):
+        self.dtype = dtype
+        dtype_name = dtype.__name__ if dtype in _ABSTRACT_KINDS else np.dtype(dtype).name
+        super(ArrayDtypeConstraint, self).__init__(
+            name="is_array_of_{DTYPE}".format(DTYPE=dtype_name), offending_mask=self._dtype_mask,
+            requirement="must be of dtype {DTYPE}".format(DTYPE=dtype_name), eval_on_init=eval_on_init)
+
+    def _dtype_mask(self, array: np.ndarray) -> np.ndarray:
+        if np.issubdtype(array.dtype, self.dtype):
+            return np.zeros(array.shape, dtype=bool)
+        return np.fromiter((not np.issubdtype(np.asarray(member).dtype, self.dtype) for member in array.flat),
+                           dtype=bool, count=array.size).reshape(array.shape)
+
+    def _offending_mask(self, value: Any) -> np.ndarray:
+        array = as_array(value)
+        if not isinstance(value, np.ndarray) and not np.issubdtype(array.dtype, self.dtype):
+            # the conversion unifies mixed members, e.g. to strings, so they are checked as given
+            array = np.asarray(value if isinstance(value, (list, tuple)) else list(value), dtype=object)
+        return self._dtype_mask(array)
+
+
+def prop_constraint_array_dtype_functional(dtype, eval_on_init=True) -> ArrayDtypeConstraint:
+    """
+    Generates an ArrayConstraint that checks whether the members of an array-like value are of the given dtype kind
+
+    Args:
+        dtype: a NumPy dtype or abstract scalar type, e.g. np.floating for all float sizes
+        eval_on_init: value indicating whether the constr should be evaluated on (re) init
+
+    Returns:
+        a parameterised, callable ArrayConstraint object
+    """
+    return ArrayDtypeConstraint(dtype, eval_on_init=eval_on_init)
+
+
+is_float_array_constraint = prop_constraint_array_dtype_functional(np.floating)
+is_int_array_constraint = prop_constraint_array_dtype_functional(np.integer)
+is_bool_array_constraint = prop_constraint_array_dtype_functional(np.bool_)
+is_str_array_constraint = prop_constraint_array_dtype_functional(np.str_)
+
+
+def prop_constraint_array_not_negative_functional(eval_on_init=True) -> ArrayConstraint:
+    """
+    Generates an ArrayConstraint that checks that no member of an array-like value is < 0, as
+    :data:`constraints.is_not_negative_constraint` does for single values
+    """
+    return ArrayConstraint(name="is_not_negative_array_constraint", offending_mask=lambda array: array < 0,
+                           requirement="must not be < 0", eval_on_init=eval_on_init)
+
+
+is_not_negative_array_constraint = prop_constraint_array_not_negative_functional(eval_on_init=True)
+
+
+def prop_constraint_array_range_functional(min_value, max_value, eval_on_init=True) -> ArrayConstraint:
+    """
+    Generates an ArrayConstraint that checks that each member of an array-like value is in the given range
+
+    Args:
+        min_value: the smallest permitted member value
+        max_value: the largest permitted member value (inclusive logic), NaN members are out of any range
+        eval_on_init: value indicating whether the constr should be evaluated on (re) init
+
+    Returns:
+        a parameterised, callable ArrayConstraint object
+    """
+    def offending_mask(array):
+        return ~((array >= constraint.min_value) & (array <= constraint.max_value))
+
+    constraint = ArrayConstraint(
+        name="is_array_in_range_{MIN}_to_{MAX}".format(MIN=min_value, MAX=max_value), offending_mask=offending_mask,
+        requirement="must be between {MIN} and {MAX}".format(MIN=min_value, MAX=max_value), eval_on_init=eval_on_init)
+    constraint.min_value = min_value
+    constraint.max_value = max_value
+    return constraint
+
+
+def prop_constraint_array_in_set_functional(expected_set: set, eval_on_init=True) -> ArrayConstraint:
+    """
+    Generates an ArrayConstraint that checks that each member of an array-like value is in the expected set
+
+    Args:
+        expected_set: a set of permitted values
+        eval_on_init: value indicating whether the constr should be evaluated on (re) init
+
+    Returns:
+        a parameterised, callable ArrayConstraint object
+    """
+    def offending_mask(array):
+        return ~np.isin(array, list(constraint.expected_set))
+
+    constraint = ArrayConstraint(name="is_array_in_set_constr", offending_mask=offending_mask,
+                                 requirement="must be in the expected set {SET}".format(SET=expected_set),
+                                 eval_on_init=eval_on_init)
+    constraint.expected_set = expected_set
+    return constraint
+
+
+class ArrayMultiplicityConstraint(CollectionMultiplicityConstraint):
+    """
+    Bounds the number of members of an array-like value, for arrays of any dimension the number of their elements
+    """
+
+    def _eval_value(self, collection_value) -> str:
+        if isinstance(collection_value, np.ndarray):
+            return self.size_reason(collection_value.size)
+        return super(ArrayMultiplicityConstraint, self)._eval_value(collection_value)
+
+
+def prop_constraint_array_multiplicity_functional(min_member_number: int, max_member_number: int,
+                                                  eval_on_init=False) -> ArrayMultiplicityConstraint:
+    return ArrayMultiplicityConstraint(min_member_number, max_member_number, eval_on_init=eval_on_init)
+
+
+# member type of the built-in isinstance constraints => vectorised counterpart
+_VECTORISED_TYPE_CONSTRAINTS = {
+    float: is_float_array_constraint,
+    int: is_int_array_constraint,
+    bool: is_bool_array_constraint,
+    str: is_str_array_constraint,
+}
+
+
+def vectorise(member_constraint: PropValueConstraint) -> ArrayConstraint:
+    """
+    Translate a member constraint of a collection prop into the ArrayConstraint that checks all members at once
+
+    Args:
+        member_constraint: an ArrayConstraint, which is returned as is, or one of the built-in type constraints of
+                           float, int, bool and str values, is_not_negative_constraint or an in-set constraint. The
+                           type constraints become dtype kind checks, hence bool arrays are no int arrays.
+
+    Returns:
+        the vectorised counterpart of the member constraint
+    """
+    if isinstance(member_constraint, ArrayConstraint):
+        return member_constraint
+    if member_constraint is is_not_negative_constraint:
+        return is_not_negative_array_constraint
+    expected_type = getattr(member_constraint, "expected_type", None)
+    if expected_type in _VECTORISED_TYPE_CONSTRAINTS:
+        return _VECTORISED_TYPE_CONSTRAINTS[expected_type]
+    if member_constraint.name == "is_in_set_constr" and hasattr(member_constraint, "expected_set"):
+        return prop_constraint_array_in_set_functional(member_constraint.expected_set,
+                                                       eval_on_init=member_constraint.eval_on_init)
+    raise NotVectorisableConstraintException(constraint_name=member_constraint.name)
+
+
+class ArrayCollectionDescription(CollectionDescription):
+    """
+    Defines an array prop in terms of multiplicity, member constraints and the dtype its values are stored with
+    """
+    __slots__ = ("dtype",)
+
+    def __init__(self, min_max: tuple = (), member_value_constr=None, dtype=None):
+        """
+        Args:
+            min_max: A tuple with defining the min and max number of array members (inclusive logic)
+            member_value_constr: A constraint that is applied on all array members, see :func:`vectorise`
+            dtype: the NumPy dtype of the stored arrays, None to keep the dtype NumPy infers
+        """
+        super(ArrayCollectionDescription, self).__init__(min_max=min_max, member_value_constr=member_value_constr)
+        self.dtype = dtype
+
+
+class ArrayProp(CollectionProp):
+    """
+    A collection prop that stores its value as a read-only NumPy array, so it can only be changed by (validated)
+    assignments, and checks its members with vectorised constraints
+    """
+    __slots__ = ()
+
+    def _stored_value(self, value: Any, shared: bool = False) -> Any:
+        # read-only arrays are shared as they are
+        return _stored_array(value, self.collection_desc.dtype)
+
+    def _compile_validator(self, constraints, fail_fast):
+        # lazy collections are converted to arrays on assignment, so their validation is not deferred
+        return super(CollectionProp, self)._compile_validator(constraints, fail_fast)
+
+    def type_specific_constraints(self):
+        collection_desc = self.collection_desc
+        _constraints = [is_collection_constraint]
+        member_constr = vectorise(collection_desc.member_value_constr) if collection_desc.member_value_constr \
+            else None
+        if collection_desc.dtype is not None:
+            dtype_kind = _dtype_kind(collection_desc.dtype)
+            # a member type constraint of the same kind already checks the dtype
+            if not (isinstance(member_constr, ArrayDtypeConstraint) and member_constr.dtype is dtype_kind):
+                _constraints.append(prop_constraint_array_dtype_functional(dtype_kind))
+        if collection_desc.min_max:
+            _constraints.append(prop_constraint_array_multiplicity_functional(
+                min_member_number=collection_desc.min_max[0],
+                max_member_number=collection_desc.min_max[1],
+                eval_on_init=False))
+        if member_constr is not None:
+            self.descriptor.collection_member_constr = member_constr
+            _constraints.append(self.collection_member_constr)
+        return _constraints
+
+
+def _dtype_kind(dtype):
+    """
+    Returns:
+        the abstract scalar type of a dtype's kind, e.g. np.floating for np.float32, values of any size of that kind
+        are accepted and converted on storage
+    """
+    scalar_type = np.dtype(dtype).type
+    for kind in (np.bool_, np.integer, np.floating, np.complexfloating, np.str_):
+        if issubclass(scalar_type, kind):
+            return kind
+    return scalar_type
+
+
+def _stored_array(value: Any, dtype) -> Any:
+    """
+    Returns:
+        a read-only array of the members of an array-like value, other values and the ones that can not be converted
+        are returned unchanged and left to the constraints
+    """
+    if value is None or isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return value
+    try:
+        array = np.asarray(value if isinstance(value, (np.ndarray, list, tuple)) else list(value), dtype=dtype)
+    except (TypeError, ValueError):
+        return value
+    if array.flags.writeable:
+        # a view, the array the value was given as stays writeable
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def create_array_prop(n: str, t: int, f, c: List[PropValueConstraint] = [], i_f: bool = True,
+                      coll_desc: tuple = None, dtype=None, v=None, d=None, copy_policy: str = None) -> ArrayProp:
+    """
+    Counterpart of :func:`core.create_clabject_prop` for collection props whose values are stored as NumPy arrays
+
+    Args:
+        n: shorthand for prop_name
+        t: shorthand for steps_to_instantiation
+        f: shorthand for steps_from_instantiation, integer or * (str) for remaining infinite may steps
+        c: shorthand for constraints, ArrayConstraints check all members at once
+        i_f: shorthand for is_final
+        coll_desc: optional (min, max, member_constr) tuple, the member constraint is vectorised, see
+                   :func:`vectorise`
+        dtype: the NumPy dtype of the stored arrays, which the members must be of the kind of
+        v: shorthand for prop_value
+        d: shorthand for default_value
+        copy_policy: how clabjects obtain their own copies of the value, see :class:`clabject_prop.BaseClabjectProp`
+
+    Returns:
+        an ArrayProp
+    """
+    collection_desc = ArrayCollectionDescription(
+        min_max=(coll_desc[0], coll_desc[1]) if coll_desc else (),
+        member_value_constr=coll_desc[2] if coll_desc else None, dtype=dtype)
+    return ArrayProp(
+        prop_name=n,
+        steps_to_instantiation=t,
+        steps_from_instantiation=float("inf") if f == "*" else f,
+        constraints=c if len(c) else [],
+        is_final=i_f,
+        prop_value=v,
+        default_value=d,
+        collection_desc=collection_desc,
+        copy_policy=copy_policy
+    )
@@ -1,22 +1,197 @@
+import math
+import sys
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from datetime import date, time, datetime, timedelta
 from inspect import signature as sig
+from types import FunctionType, MethodType, BuiltinFunctionType
 from typing import Tuple, Union, List, Any
 from abc import abstractmethod
 
-from multilevel_py.constraints import PropValueConstraint, ReInitPropConstr
-from multilevel_py.exceptions import InvalidMultiplicityTupleException, InvalidPropValueConstraintException
+from multilevel_py.collection_values import defer_lazy_validation, manage
+from multilevel_py.constraints import PropValueConstraint, ReInitPropConstr, BaseConstraint, EmptyValue, \
+    compile_validator, FailFastValidator
+from multilevel_py.exceptions import InvalidMultiplicityTupleException, InvalidPropValueConstraintException, \
+    InvalidCopyPolicyException
+
+
+class IdentityValue:
+    """
+    Base class of objects that are referenced by their identity, e.g. clabjects that are not materialised as classes,
+    and thus are shared rather than copied as prop values
+    """
+    __slots__ = ()
+
+
+_IMMUTABLE_VALUE_TYPES = (type(None), bool, int, float, complex, str, bytes, range,
+                          date, time, datetime, timedelta,
+                          FunctionType, MethodType, BuiltinFunctionType, BaseConstraint, IdentityValue)
+
+
+def is_immutable_value(value: Any) -> bool:
+    """
+    Determine whether a prop value can be shared between clabjects without copying it
+
+    Args:
+        value: a prop value or default value
+
+    Returns:
+        True for primitive values, functions, constraints, classes and clabjects and tuples/frozensets
+        composed of such values
+    """
+    if isinstance(value, _IMMUTABLE_VALUE_TYPES) or isinstance(value, type) or value is EmptyValue:
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable_value(v) for v in value)
+    return False
+
+
+# how a clabject obtains its own copy of an inherited or default prop value, see :class:`BaseClabjectProp`
+COPY_POLICIES = ("share", "copy", "deepcopy", "copy_on_write")
+
+
+def copy_prop_value(value: Any, copy_policy: str = None) -> Any:
+    """
+    Returns:
+        the given value for immutable values and the share policy, a shallow copy for the copy policy and a deep
+        copy otherwise
+    """
+    if copy_policy == "share" or is_immutable_value(value):
+        return value
+    value_copy = copy(value) if copy_policy == "copy" else deepcopy(value)
+    record_copy(value_copy, deep=copy_policy != "copy")
+    return value_copy
+
+
+def record_copy(value_copy: Any, deep: bool) -> None:
+    """
+    Count a prop value copy in the active copy reports, see :func:`track_copies`
+
+    Args:
+        value_copy: the new copy
+        deep: False if the copy shares the members of the original value
+    """
+    if _copy_reports:
+        copied_bytes = _copied_size(value_copy, deep=deep)
+        for report in _copy_reports:
+            report.copies += 1
+            report.bytes_copied += copied_bytes
+
+
+class CopyReport:
+    """
+    The prop value copies made and the clabjects instantiated while the report is active, see :func:`track_copies`
+    """
+    __slots__ = ("copies", "bytes_copied", "instantiations")
+
+    def __init__(self):
+        self.copies = 0
+        self.bytes_copied = 0
+        self.instantiations = 0
+
+    @property
+    def bytes_per_instantiation(self) -> float:
+        return self.bytes_copied / self.instantiations if self.instantiations else 0.0
+
+
+_copy_reports = []
+
+
+@contextmanager
+def track_copies():
+    """
+    Report the prop value copies within the block, including the ones made on first reads of inherited values.
+    The copied bytes are estimated by sys.getsizeof of the new objects, which makes tracking expensive.
+
+    Returns:
+        a context manager that yields a :class:`CopyReport`
+    """
+    report = CopyReport()
+    _copy_reports.append(report)
+    try:
+        yield report
+    finally:
+        _copy_reports.remove(report)
+
+
+def note_instantiation() -> None:
+    for report in _copy_reports:
+        report.instantiations += 1
+
+
+def _copied_size(value_copy: Any, deep: bool) -> int:
+    if not deep:
+        return sys.getsizeof(value_copy)
+    size = 0
+    seen = set()
+    stack = [value_copy]
+    while stack:
+        obj = stack.pop()
+        # immutable members are shared by deep copies
+        if id(obj) in seen or is_immutable_value(obj):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return size
+
+
+class PropDescriptor:
+    """
+    The part of a ClabjectProp's definition that stays the same along the instantiation hierarchy. A descriptor is
+    created once per defined prop and shared by all per-level states of the prop, hence it must be treated as
+    immutable once the prop has been constructed.
+    """
+    __slots__ = ("prop_name", "is_final", "default_value", "collection_desc", "collection_member_constr",
+                 "copy_policy")
+
+    def __init__(self, prop_name: str,
+                 is_final: bool = False,
+                 default_value: Any = None,
+                 collection_desc: "CollectionDescription" = None,
+                 copy_policy: str = None):
+        """
+        Args:
+            prop_name: The name of the property, which must be unique for the given clabject
+            is_final: Indicating whether the property can be changed after its first instantiation.
+            default_value: optional default_value of the property, used at instantiation if no prop_value is provided
+            collection_desc: The description of a collection prop's members, None for other prop types
+            copy_policy: one of COPY_POLICIES or None for copy_on_write
+        """
+        self.prop_name = prop_name
+        self.is_final = is_final
+        self.default_value = default_value
+        self.collection_desc = collection_desc
+        self.collection_member_constr = None
+        self.copy_policy = copy_policy
 
 
 class BaseClabjectProp:
     """
-    Base class of a ClabjectProp, i.e. an enhanced attribute that is capable of "deferred instantiation"
+    Base class of a ClabjectProp, i.e. an enhanced attribute that is capable of "deferred instantiation".
+
+    An instance only holds the state of the prop at one level of the instantiation hierarchy, i.e. its schedule,
+    constraints and value. Everything else is kept by the :class:`PropDescriptor` that is shared by all states of the
+    prop.
     """
+    __slots__ = ("descriptor", "_depth", "due_depth", "vanish_depth", "_constraints", "_validators", "prop_value",
+                 "re_init_prop_constr")
+
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
                  steps_from_instantiation: Union[int, float],
                  constraints: List[PropValueConstraint] = [],
                  is_final: bool = False,
                  prop_value: Any = None,
-                 default_value: Any = None
+                 default_value: Any = None,
+                 collection_desc: "CollectionDescription" = None,
+                 copy_policy: str = None
                  ):
         """
         Args:
@@ -38,10 +213,15 @@ class BaseClabjectProp:
                         including functions.
 
             default_value: optional default_value of the property, used at instantiation if no prop_value is provided
-        """
-
 
+            collection_desc: The description of a collection prop's members, None for other prop types
 
+            copy_policy: How a clabject obtains its own copy of an inherited or default value of the prop:
+                         'share' never copies the value, so in place changes are seen along the hierarchy.
+                         'copy_on_write' (the policy for None) shares the value until a clabject reads or changes
+                         it and deep copies it then, 'copy' makes a shallow copy instead. 'deepcopy' copies the value
+                         for each new clabject on its instantiation. Immutable values are always shared.
+        """
         assert steps_to_instantiation >= 0
         assert steps_from_instantiation >= 0
         assert isinstance(constraints, list)
@@ -50,17 +230,182 @@ class BaseClabjectProp:
             if not isinstance(constr, PropValueConstraint):
                 raise InvalidPropValueConstraintException(constr=constr)
         assert isinstance(is_final, bool)
-        self.prop_name = prop_name
-        self.steps_to_instantiation = steps_to_instantiation
-        self.steps_from_instantiation = steps_from_instantiation
-        self.constraints = constraints
-        self.is_final = is_final
+        if copy_policy is not None and copy_policy not in COPY_POLICIES:
+            raise InvalidCopyPolicyException(copy_policy=copy_policy)
+        self.descriptor = PropDescriptor(prop_name=prop_name, is_final=is_final, default_value=default_value,
+                                         collection_desc=collection_desc, copy_policy=copy_policy)
+        # The schedule of the prop is stored as absolute depths in the instantiation hierarchy, the relative
+        # step counters are derived from the depth of the clabject the prop is viewed from
+        self._depth = 0
+        self.due_depth = steps_to_instantiation
+        self.vanish_depth = steps_to_instantiation + steps_from_instantiation
+        # copy the given list, so that neither the caller's list nor the shared default argument is extended
+        self.constraints = list(constraints)
         self.prop_value = prop_value
-        self.default_value = default_value
         self.re_init_prop_constr: ReInitPropConstr = None
         for ts_constr in self.type_specific_constraints():
             ts_constr.type_specific = True
-            self.constraints.append(ts_constr)
+            self.add_constraint(ts_constr)
+
+    @property
+    def prop_name(self) -> str:
+        return self.descriptor.prop_name
+
+    @property
+    def is_final(self) -> bool:
+        return self.descriptor.is_final
+
+    @property
+    def default_value(self) -> Any:
+        return self.descriptor.default_value
+
+    @property
+    def copy_policy(self) -> str:
+        return self.descriptor.copy_policy
+
+    @property
+    def constraints(self) -> List[PropValueConstraint]:
+        """
+        The constraints of the prop value. The list is compiled into validators, changes have to go through
+        :meth:`add_constraint` or the assignment of a new list.
+        """
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: List[PropValueConstraint]):
+        self._constraints = constraints
+        # views that share the former list keep their validators
+        self._validators = None
+
+    def add_constraint(self, constraint: PropValueConstraint) -> None:
+        self._constraints.append(constraint)
+        # the list is shared with the views of the prop, which share the validators as well
+        if self._validators is not None:
+            self._validators.clear()
+
+    def validator(self, init_only: bool = True, fail_fast: bool = False):
+        """
+        Args:
+            init_only: compile only the constraints that have the eval_on_init flag set
+            fail_fast: stop at the first violated constraint, see :class:`constraints.FailFastValidator`, otherwise
+                       all constraints are evaluated in the order of the constraint list
+
+        Returns:
+            the compiled validator of the prop's constraints, see :func:`constraints.compile_validator`
+        """
+        validators = self._validators
+        if validators is None:
+            validators = self._validators = {}
+        try:
+            return validators[init_only, fail_fast]
+        except KeyError:
+            pass
+        constraints = self._constraints
+        if init_only:
+            constraints = [c for c in constraints if getattr(c, "eval_on_init", False)]
+        validate = validators[init_only, fail_fast] = self._compile_validator(constraints, fail_fast)
+        return validate
+
+    def _compile_validator(self, constraints: List[PropValueConstraint], fail_fast: bool):
+        return FailFastValidator(constraints) if fail_fast else compile_validator(constraints)
+
+    @property
+    def steps_to_instantiation(self) -> int:
+        """
+        The number of steps until the prop is due from the perspective of the clabject the prop is viewed from
+        """
+        return max(0, self.due_depth - self._depth)
+
+    @steps_to_instantiation.setter
+    def steps_to_instantiation(self, value: int):
+        steps_from_instantiation = self.steps_from_instantiation
+        self.due_depth = self._depth + value
+        self.vanish_depth = self.due_depth + steps_from_instantiation
+
+    @property
+    def steps_from_instantiation(self) -> Union[int, float]:
+        """
+        The number of steps the prop continues to exist after being due from the perspective of the clabject the
+        prop is viewed from
+        """
+        return self.vanish_depth - max(self.due_depth, self._depth)
+
+    @steps_from_instantiation.setter
+    def steps_from_instantiation(self, value: Union[int, float]):
+        self.vanish_depth = max(self.due_depth, self._depth) + value
+
+    def is_visible_at(self, depth: int) -> bool:
+        """
+        Returns:
+            a value indicating whether the prop has not vanished yet at the given depth
+        """
+        return depth <= self.vanish_depth
+
+    def is_settled_at(self, depth: int) -> bool:
+        """
+        Returns:
+            True if the prop is due and never vanishes from the perspective of the current and the given depth, i.e.
+            its relative step counters are the same for both
+        """
+        return self.due_depth <= min(self._depth, depth) and self.vanish_depth == math.inf
+
+    def attach(self, depth: int) -> None:
+        """
+        Anchor the relative step counters of a newly defined prop at the depth of the defining clabject
+        """
+        shift = depth - self._depth
+        self.due_depth += shift
+        self.vanish_depth += shift
+        self._depth = depth
+
+    def rebase(self, depth: int):
+        """
+        Create a read-only view of the prop whose relative step counters refer to the given depth. Everything
+        else is shared with the current prop.
+        """
+        view = self._copy()
+        view._depth = depth
+        return view
+
+    def share_value(self, value: Any) -> None:
+        """
+        Assign a value that is shared with other props, e.g. a default value, without copying it
+        """
+        self.prop_value = value
+
+    def clone(self, copy_value: bool = True):
+        """
+        Create an independent copy of the prop. Constraint objects and the default value are shared, while the
+        constraint list and a mutable prop value are copied, the latter according to the copy policy.
+
+        Args:
+            copy_value: False if the caller replaces the prop value anyway
+
+        Returns:
+            a new prop of the same type
+        """
+        new_prop = self._copy()
+        new_prop.constraints = list(self._constraints)
+        if copy_value and self.copy_policy != "share":
+            new_prop.prop_value = copy_prop_value(self.prop_value, self.copy_policy)
+        return new_prop
+
+    def _copy(self):
+        """
+        Returns:
+            a shallow copy of the prop's state that shares the descriptor
+        """
+        new_prop = object.__new__(type(self))
+        new_prop.descriptor = self.descriptor
+        new_prop._depth = self._depth
+        new_prop.due_depth = self.due_depth
+        new_prop.vanish_depth = self.vanish_depth
+        new_prop._constraints = self._constraints
+        new_prop._validators = self._validators
+        # the value is shared as it is, not converted or bound again
+        _prop_value_slot.__set__(new_prop, _prop_value_slot.__get__(self))
+        new_prop.re_init_prop_constr = self.re_init_prop_constr
+        return new_prop
 
     @abstractmethod
     def type_specific_constraints(self) -> List[PropValueConstraint]:
@@ -83,13 +428,16 @@ class SimpleProp(BaseClabjectProp):
     """
     A property of a Clabject, that is meant to hold a simple (single primitive) value
     """
+    __slots__ = ()
+
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
                  steps_from_instantiation: Union[int, float],
                  constraints: List[PropValueConstraint] = [],
                  is_final: bool = False,
                  prop_value: Any = None,
-                 default_value: Any = None
+                 default_value: Any = None,
+                 copy_policy: str = None
                  ):
 
         super(SimpleProp, self).__init__(
@@ -99,7 +447,8 @@ class SimpleProp(BaseClabjectProp):
             constraints=constraints,
             is_final=is_final,
             prop_value=prop_value,
-            default_value=default_value
+            default_value=default_value,
+            copy_policy=copy_policy
         )
 
     def type_specific_constraints(self):
@@ -112,13 +461,16 @@ class AssociationProp(BaseClabjectProp):
     """
     A Property of a clabjec that is meant to hold an associated clabject
     """
+    __slots__ = ()
+
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
                  steps_from_instantiation: Union[int, float],
                  constraints: List[PropValueConstraint] = [],
                  is_final: bool = False,
                  prop_value: Any = None,
-                 default_value: Any = None
+                 default_value: Any = None,
+                 copy_policy: str = None
                  ):
         super(AssociationProp, self).__init__(
             prop_name=prop_name,
@@ -127,7 +479,8 @@ class AssociationProp(BaseClabjectProp):
             constraints=constraints,
             is_final=is_final,
             prop_value=prop_value,
-            default_value=default_value
+            default_value=default_value,
+            copy_policy=copy_policy
         )
     def type_specific_constraints(self):
         from multilevel_py.core import is_clabect_or_empty_constr
@@ -137,10 +490,15 @@ class AssociationProp(BaseClabjectProp):
         return "Associated Clabject: " + str(self.prop_value)
 
 
+# the slot of the prop value, CollectionProp wraps it into a property
+_prop_value_slot = BaseClabjectProp.prop_value
+
+
 class CollectionDescription:
     """
     Defines a collection property in terms of multiplicity and collection member constraints
     """
+    __slots__ = ("min_max", "member_value_constr")
 
     def __init__(self, min_max: Tuple[int, int] = (), member_value_constr=None):
         """
@@ -156,6 +514,7 @@ class CollectionProp(BaseClabjectProp):
     """
     A property of a clabject that is meant to hold a collection, i.e. a multi-value property of a Clabject
     """
+    __slots__ = ()
 
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
@@ -165,11 +524,9 @@ class CollectionProp(BaseClabjectProp):
                  prop_value: Any = None,
                  default_value: Any = None,
                  collection_desc: CollectionDescription = None,
+                 copy_policy: str = None
                  ):
         assert isinstance(collection_desc, CollectionDescription)
-        self.collection_desc = collection_desc
-        self.collection_member_constr = None
-
         super(CollectionProp, self).__init__(
             prop_name=prop_name,
             steps_to_instantiation=steps_to_instantiation,
@@ -177,16 +534,44 @@ class CollectionProp(BaseClabjectProp):
             constraints=constraints,
             is_final=is_final,
             prop_value=prop_value,
-            default_value=default_value
+            default_value=default_value,
+            collection_desc=collection_desc,
+            copy_policy=copy_policy
         )
 
         if collection_desc.min_max:
             if not (len(collection_desc.min_max) == 2 and (
                     0 <= collection_desc.min_max[0] <= collection_desc.min_max[1])):
                 raise InvalidMultiplicityTupleException(provided_tuple=collection_desc)
+        if default_value is not None:
+            # converted once, the clabjects that receive the default share the converted value
+            self.descriptor.default_value = self._stored_value(default_value)
 
-        self.collection_desc = collection_desc
-        self.collection_member_constr = None
+    @property
+    def prop_value(self) -> Any:
+        return _prop_value_slot.__get__(self)
+
+    @prop_value.setter
+    def prop_value(self, value: Any):
+        _prop_value_slot.__set__(self, self._stored_value(value))
+
+    def share_value(self, value: Any) -> None:
+        _prop_value_slot.__set__(self, self._stored_value(value, shared=True))
+
+    def _stored_value(self, value: Any, shared: bool = False) -> Any:
+        # list, set and dict values are stored as managed collections, which validate their mutations
+        return manage(value, self, shared=shared)
+
+    def _compile_validator(self, constraints, fail_fast):
+        return defer_lazy_validation(super(CollectionProp, self)._compile_validator(constraints, fail_fast))
+
+    @property
+    def collection_desc(self) -> CollectionDescription:
+        return self.descriptor.collection_desc
+
+    @property
+    def collection_member_constr(self) -> PropValueConstraint:
+        return self.descriptor.collection_member_constr
 
     def type_specific_constraints(self):
         _constraints = []
@@ -205,7 +590,7 @@ class CollectionProp(BaseClabjectProp):
 
             if self.collection_desc.member_value_constr:
                 from multilevel_py.constraints import prop_constraint_collection_member_functional
-                self.collection_member_constr = prop_constraint_collection_member_functional(
+                self.descriptor.collection_member_constr = prop_constraint_collection_member_functional(
                     member_constr_func=self.collection_desc.member_value_constr,
                     eval_on_init=True)
                 _constraints.append(self.collection_member_constr)
@@ -219,13 +604,16 @@ class MethodProp(BaseClabjectProp):
     """
     A property of a clabject that is meant to hold a method object
     """
+    __slots__ = ()
+
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
                  steps_from_instantiation: Union[int, float],
                  constraints: List[PropValueConstraint] = [],
                  is_final: bool = False,
                  prop_value: Any = None,
-                 default_value: Any = None
+                 default_value: Any = None,
+                 copy_policy: str = None
                  ):
 
         super(MethodProp, self).__init__(
@@ -235,7 +623,8 @@ class MethodProp(BaseClabjectProp):
             constraints=constraints,
             is_final=is_final,
             prop_value=prop_value,
-            default_value=default_value
+            default_value=default_value,
+            copy_policy=copy_policy
         )
 
     def type_specific_constraints(self):
@@ -255,13 +644,16 @@ class StateConstraintProp(BaseClabjectProp):
     """
     A property of a Clabject, that is meant to hold a StateConstraint
     """
+    __slots__ = ()
+
     def __init__(self, prop_name: str,
                  steps_to_instantiation: int,
                  steps_from_instantiation: Union[int, float],
                  constraints: List[PropValueConstraint] = [],
                  is_final: bool = False,
                  prop_value: Any = None,
-                 default_value: Any = None
+                 default_value: Any = None,
+                 copy_policy: str = None
                  ):
 
         super(StateConstraintProp, self).__init__(
@@ -271,7 +663,8 @@ class StateConstraintProp(BaseClabjectProp):
             constraints=constraints,
             is_final=is_final,
             prop_value=prop_value,
-            default_value=default_value
+            default_value=default_value,
+            copy_policy=copy_policy
         )
 
     def type_specific_constraints(self):
@@ -0,0 +1,561 @@
+from copy import deepcopy
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+from multilevel_py.constraints import CollectionMemberConstraint, CollectionMultiplicityConstraint, \
+    ConstraintResult, create_violated_constraint_dict, is_collection_constraint, is_fail_fast
+from multilevel_py.exceptions import ConstraintViolationException
+
+
+def _check_mutation(managed, added: Iterable, new_size: int, candidate: Callable[[], Any]) -> None:
+    """
+    Check a mutation of a managed collection before it is applied, against all constraints of the owning prop.
+    Member-wise member constraints are evaluated on the added members only, multiplicities on the new size and any
+    other constraint on the resulting collection, which is built on demand. The constraints with the eval_on_init
+    flag are enforced as on an assignment, the ones without it are not checked when the prop is initialised, so a
+    mutation may leave them violated, but not violate them anew, e.g. a collection below its minimal multiplicity
+    may grow towards it. Each checked mutation is counted, see :func:`mutation_count`.
+
+    Args:
+        managed: the managed collection
+        added: the members the mutation adds, for mappings the added keys
+        new_size: the number of members after the mutation
+        candidate: builds the resulting collection without changing the managed one
+    """
+    managed._mutations += 1
+    prop = managed._prop
+    if prop is None:
+        return
+    fail_fast = is_fail_fast()
+    violations = []
+    resulting_collection = None
+    for constraint in prop.constraints:
+        if constraint is is_collection_constraint:
+            continue
+        checked_on_init = getattr(constraint, "eval_on_init", False)
+        if isinstance(constraint, CollectionMemberConstraint) and constraint.member_wise:
+            if not added:
+                continue
+            result = constraint.evaluate(added)
+        elif isinstance(constraint, CollectionMultiplicityConstraint):
+            result = ConstraintResult(constraint, constraint.size_reason(new_size))
+            if not result.ok and not checked_on_init and _approaches_bounds(constraint, len(managed), new_size):
+                continue
+        else:
+            if resulting_collection is None:
+                resulting_collection = candidate()
+            result = constraint.evaluate(resulting_collection)
+            if not result.ok and not checked_on_init and not constraint.evaluate(managed).ok:
+                continue
+        if not result.ok:
+            violations.append(result)
+            if fail_fast:
+                break
+    _raise_violations(prop, violations)
+
+
+def _approaches_bounds(constraint: CollectionMultiplicityConstraint, size: int, new_size: int) -> bool:
+    # True if a collection whose size is already out of the bounds does not move away from them
+    if size < constraint.min_member_number:
+        return size <= new_size <= constraint.max_member_number
+    if size > constraint.max_member_number:
+        return constraint.min_member_number <= new_size <= size
+    return False
+
+
+def _raise_violations(prop, violations: List[ConstraintResult]) -> None:
+    if violations:
+        violated_constraints = create_violated_constraint_dict()
+        violated_constraints[prop.prop_name].extend(violations)
+        raise ConstraintViolationException(violated_constraints=violated_constraints)
+
+
+class ManagedList(list):
+    """
+    The list value of a collection prop. Mutations are validated against the constraints of the owning prop before
+    they are applied and violating mutations leave the list unchanged, see :func:`_check_mutation`.
+    """
+    __slots__ = ("_prop", "_mutations")
+
+    def __init__(self, members: Iterable = (), prop=None):
+        super(ManagedList, self).__init__(members)
+        self._prop = prop
+        self._mutations = 0
+
+    def append(self, member) -> None:
+        _check_mutation(self, [member], len(self) + 1, lambda: list(self) + [member])
+        list.append(self, member)
+
+    def extend(self, members: Iterable) -> None:
+        members = list(members)
+        _check_mutation(self, members, len(self) + len(members), lambda: list(self) + members)
+        list.extend(self, members)
+
+    def __iadd__(self, members: Iterable):
+        self.extend(members)
+        return self
+
+    def insert(self, index: int, member) -> None:
+        def candidate():
+            resulting_list = list(self)
+            resulting_list.insert(index, member)
+            return resulting_list
+
+        _check_mutation(self, [member], len(self) + 1, candidate)
+        list.insert(self, index, member)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            added = value
+            new_size = len(self) - len(range(*index.indices(len(self)))) + len(value) if index.step in (None, 1) \
+                else len(self)
+        else:
+            added = [value]
+            new_size = len(self)
+
+        def candidate():
+            resulting_list = list(self)
+            resulting_list[index] = value
+            return resulting_list
+
+        _check_mutation(self, added, new_size, candidate)
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index) -> None:
+        new_size = len(self) - (len(range(*index.indices(len(self)))) if isinstance(index, slice) else 1)
+
+        def candidate():
+            resulting_list = list(self)
+            del resulting_list[index]
+            return resulting_list
+
+        _check_mutation(self, (), new_size, candidate)
+        list.__delitem__(self, index)
+
+    def __imul__(self, factor: int):
+        _check_mutation(self, (), len(self) * max(factor, 0), lambda: list(self) * factor)
+        return list.__imul__(self, factor)
+
+    def remove(self, member) -> None:
+        del self[self.index(member)]
+
+    def pop(self, index: int = -1):
+        member = self[index]
+        del self[index]
+        return member
+
+    def clear(self) -> None:
+        _check_mutation(self, (), 0, list)
+        list.clear(self)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        _check_mutation(self, (), len(self), lambda: sorted(self, key=key, reverse=reverse))
+        list.sort(self, key=key, reverse=reverse)
+
+    def reverse(self) -> None:
+        _check_mutation(self, (), len(self), lambda: list(reversed(self)))
+        list.reverse(self)
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        # copies are unbound, the prop that stores a copy binds it
+        new_list = memo[id(self)] = type(self)()
+        list.extend(new_list, (deepcopy(member, memo) for member in self))
+        return new_list
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class ManagedSet(set):
+    """
+    The set value of a collection prop, see :class:`ManagedList`
+    """
+    __slots__ = ("_prop", "_mutations")
+
+    def __init__(self, members: Iterable = (), prop=None):
+        super(ManagedSet, self).__init__(members)
+        self._prop = prop
+        self._mutations = 0
+
+    def __repr__(self):
+        return repr(set(self)) if self else "set()"
+
+    def add(self, member) -> None:
+        if member not in self:
+            _check_mutation(self, [member], len(self) + 1, lambda: set(self) | {member})
+            set.add(self, member)
+
+    def update(self, *others: Iterable) -> None:
+        added = [member for member in dict.fromkeys(m for other in others for m in other) if member not in self]
+        _check_mutation(self, added, len(self) + len(added), lambda: set(self).union(added))
+        set.update(self, added)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def _replace_members(self, resulting_set: set) -> None:
+        # apply the result of an operation that can remove members after checking it
+        added = [member for member in resulting_set if member not in self]
+        _check_mutation(self, added, len(resulting_set), lambda: resulting_set)
+        set.intersection_update(self, resulting_set)
+        set.update(self, added)
+
+    def symmetric_difference_update(self, other: Iterable) -> None:
+        self._replace_members(set(self).symmetric_difference(other))
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    def difference_update(self, *others: Iterable) -> None:
+        self._replace_members(set(self).difference(*others))
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def intersection_update(self, *others: Iterable) -> None:
+        self._replace_members(set(self).intersection(*others))
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def remove(self, member) -> None:
+        if member not in self:
+            raise KeyError(member)
+        self.discard(member)
+
+    def discard(self, member) -> None:
+        if member in self:
+            _check_mutation(self, (), len(self) - 1, lambda: set(self) - {member})
+            set.discard(self, member)
+
+    def pop(self):
+        if not self:
+            raise KeyError("pop from an empty set")
+        member = next(iter(self))
+        self.discard(member)
+        return member
+
+    def clear(self) -> None:
+        _check_mutation(self, (), 0, set)
+        set.clear(self)
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        new_set = memo[id(self)] = type(self)()
+        set.update(new_set, (deepcopy(member, memo) for member in self))
+        return new_set
+
+    def __reduce__(self):
+        return set, (set(self),)
+
+
+class ManagedDict(dict):
+    """
+    The mapping value of a collection prop, see :class:`ManagedList`. As for
+    :func:`constraints.prop_constraint_collection_member_functional`, the members of a mapping are its keys.
+    """
+    __slots__ = ("_prop", "_mutations")
+
+    def __init__(self, members=(), prop=None):
+        super(ManagedDict, self).__init__(members)
+        self._prop = prop
+        self._mutations = 0
+
+    def __setitem__(self, key, value) -> None:
+        def candidate():
+            resulting_dict = dict(self)
+            resulting_dict[key] = value
+            return resulting_dict
+
+        added = () if key in self else [key]
+        _check_mutation(self, added, len(self) + len(added), candidate)
+        dict.__setitem__(self, key, value)
+
+    def update(self, other=(), **kwargs) -> None:
+        items = dict(other, **kwargs)
+        added = [key for key in items if key not in self]
+
+        def candidate():
+            resulting_dict = dict(self)
+            resulting_dict.update(items)
+            return resulting_dict
+
+        _check_mutation(self, added, len(self) + len(added), candidate)
+        dict.update(self, items)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        def candidate():
+            resulting_dict = dict(self)
+            del resulting_dict[key]
+            return resulting_dict
+
+        _check_mutation(self, (), len(self) - 1, candidate)
+        dict.__delitem__(self, key)
+
+    _MISSING = object()
+
+    def pop(self, key, default=_MISSING):
+        if key not in self:
+            if default is ManagedDict._MISSING:
+                raise KeyError(key)
+            return default
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        _check_mutation(self, (), 0, dict)
+        dict.clear(self)
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        new_dict = memo[id(self)] = type(self)()
+        for key, value in self.items():
+            dict.__setitem__(new_dict, deepcopy(key, memo), deepcopy(value, memo))
+        return new_dict
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def _check_streamed_members(prop, constraints: tuple, members: list) -> None:
+    """
+    Check a chunk of the members of a lazy collection against the member-wise member constraints with the
+    eval_on_init flag, before the members are passed on
+    """
+    fail_fast = is_fail_fast()
+    violations = []
+    for constraint in constraints:
+        if isinstance(constraint, CollectionMemberConstraint) and constraint.member_wise and constraint.eval_on_init:
+            result = constraint.evaluate(members)
+            if not result.ok:
+                violations.append(result)
+                if fail_fast:
+                    break
+    _raise_violations(prop, violations)
+
+
+def _is_checked_on_exhaustion(constraint) -> bool:
+    if isinstance(constraint, CollectionMultiplicityConstraint):
+        return True
+    return getattr(constraint, "eval_on_init", False) and constraint is not is_collection_constraint and not (
+        isinstance(constraint, CollectionMemberConstraint) and constraint.member_wise)
+
+
+def _check_exhausted_stream(prop, constraints: tuple, size: int, members: list) -> None:
+    """
+    Check the number of members of an exhausted lazy collection against all multiplicity constraints, the bounds
+    can only be checked at this point, and the other constraints with the eval_on_init flag against its members
+    """
+    fail_fast = is_fail_fast()
+    violations = []
+    for constraint in constraints:
+        if not _is_checked_on_exhaustion(constraint):
+            continue
+        if isinstance(constraint, CollectionMultiplicityConstraint):
+            result = ConstraintResult(constraint, constraint.size_reason(size))
+        else:
+            result = constraint.evaluate(members)
+        if not result.ok:
+            violations.append(result)
+            if fail_fast:
+                break
+    _raise_violations(prop, violations)
+
+
+class LazyCollection:
+    """
+    A collection prop value whose members are produced by an iterable factory on iteration instead of being held in
+    memory, e.g. the records of a large file. The validation of a lazy collection is deferred: assigning it only
+    binds it to the prop, its members are checked chunk-wise against the member constraints while they stream
+    through an iteration and the multiplicity and the other constraints are checked once the stream is exhausted,
+    see :meth:`finalize`. Violating members raise a ConstraintViolationException before they are passed on.
+    """
+    __slots__ = ("_factory", "cache", "chunk_size", "_members", "_checked_constraints", "_prop")
+
+    # the number of members that are produced and checked together
+    CHUNK_SIZE = 1024
+
+    def __init__(self, factory: Callable[[], Iterable], cache: bool = False, chunk_size: int = None, prop=None):
+        """
+        Args:
+            factory: returns a new iterable over the members on each call
+            cache: keep the members of the first complete iteration and replay them on later iterations instead of
+                   calling the factory and checking the members again
+            chunk_size: the number of members that are checked together, defaults to CHUNK_SIZE
+            prop: the collection prop that stores the value, lazy collections are bound on assignment
+        """
+        self._factory = factory
+        self.cache = cache
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self._members = None
+        # the constraints the members of the last complete iteration satisfied
+        self._checked_constraints = None
+        self._prop = prop
+
+    @property
+    def validated(self) -> bool:
+        """
+        False while the validation is deferred, True once the members of a complete iteration satisfied the current
+        constraints of the prop the collection is bound to
+        """
+        prop = self._prop
+        return prop is not None and self._checked_constraints == tuple(prop.constraints)
+
+    def finalize(self) -> "LazyCollection":
+        """
+        Conclude the deferred validation by a complete iteration, which caches the members if cache is set
+
+        Returns:
+            the validated lazy collection
+        """
+        for _ in self:
+            pass
+        return self
+
+    def __iter__(self) -> Iterator:
+        # cached members are replayed once they have been checked against the constraints of the prop
+        if self._members is not None and (self._prop is None or self.validated):
+            return iter(self._members)
+        return self._stream()
+
+    def _stream(self) -> Iterator:
+        prop = self._prop
+        constraints = tuple(prop.constraints) if prop is not None else ()
+        keep = self.cache or any(not isinstance(c, CollectionMultiplicityConstraint) and _is_checked_on_exhaustion(c)
+                                 for c in constraints)
+        members = [] if keep else None
+        size = 0
+        iterator = iter(self._factory())
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                break
+            if prop is not None:
+                _check_streamed_members(prop, constraints, chunk)
+            size += len(chunk)
+            if keep:
+                members.extend(chunk)
+            yield from chunk
+        if prop is not None:
+            _check_exhausted_stream(prop, constraints, size, members)
+            self._checked_constraints = constraints
+        if self.cache:
+            self._members = tuple(members)
+
+    def __repr__(self):
+        return "{CLS}({FACTORY}, {STATE})".format(CLS=type(self).__name__, FACTORY=self._factory,
+                                                   STATE="validated" if self.validated else "deferred")
+
+    def __copy__(self):
+        # copies are unbound and share the factory, the cached members and the record of their checks
+        lazy_copy = type(self)(self._factory, cache=self.cache, chunk_size=self.chunk_size)
+        lazy_copy._members = self._members
+        lazy_copy._checked_constraints = self._checked_constraints
+        return lazy_copy
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+def defer_lazy_validation(validate: Callable[[Any], tuple]) -> Callable[[Any], tuple]:
+    """
+    Returns:
+        a validator of collection prop values that defers the validation of lazy collections to their iteration and
+        applies the given validator to other values
+    """
+    def validate_collection(value):
+        if type(value) is LazyCollection:
+            return ()
+        return validate(value)
+    return validate_collection
+
+
+# plain collection type => managed flavour
+MANAGED_TYPES = {list: ManagedList, set: ManagedSet, dict: ManagedDict}
+
+
+def mutation_count(value: Any):
+    """
+    Returns:
+        the number of mutations of a managed collection so far, None for other values whose mutations are not
+        tracked
+    """
+    return value._mutations if type(value) in _MANAGED_VALUE_TYPES else None
+
+
+def manage(value: Any, prop, shared: bool = False) -> Any:
+    """
+    Bind the value of a collection prop to the prop
+
+    Args:
+        value: the new prop value
+        prop: the collection prop that stores the value
+        shared: True if the value is shared with other props, e.g. a default value, see
+                :meth:`clabject_prop.BaseClabjectProp.share_value`
+
+    Returns:
+        a managed collection for list, set and dict values and the given value otherwise. Unbound managed and lazy
+        values, shared ones and the ones bound to a view of the prop, which shares its constraints, are kept, the ones
+        of other props are copied. Shared managed values keep validating their mutations against the prop they are
+        bound to.
+    """
+    managed_type = MANAGED_TYPES.get(type(value))
+    if managed_type is not None:
+        from multilevel_py.clabject_prop import record_copy
+        value = managed_type(value, prop=prop)
+        record_copy(value, deep=False)
+        return value
+    if type(value) in _BOUND_VALUE_TYPES:
+        owner = value._prop
+        if owner is None:
+            value._prop = prop
+        elif owner is not prop and owner.constraints is not prop.constraints and not shared:
+            from multilevel_py.clabject_prop import copy_prop_value
+            value = copy_prop_value(value, "copy")
+            value._prop = prop
+    return value
+
+
+def bind_shared_value(value: Any, prop) -> None:
+    """
+    Bind a managed value that props share, see the 'share' copy policy, to the prop it is accessed through, so that
+    its mutations are validated against the constraints of the clabject that holds this prop instead of the ones of
+    the prop it was bound to first
+    """
+    if type(value) in _MANAGED_VALUE_TYPES and value._prop is not None:
+        value._prop = prop
+
+
+_MANAGED_VALUE_TYPES = frozenset(MANAGED_TYPES.values())
+_BOUND_VALUE_TYPES = _MANAGED_VALUE_TYPES | {LazyCollection}
@@ -1,46 +1,253 @@
 import math
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import time, date, timedelta, datetime
+from enum import Enum
 from inspect import signature
+from time import perf_counter
 from types import FunctionType
-from typing import Callable, Any, Union, Tuple, Collection, List
+from typing import Callable, Any, Union, Tuple, Collection, List, NamedTuple
+from weakref import ref
 from multilevel_py.exceptions import InvalidInstantiationOrderException, \
-    NotAClabjectException, InvalidPropValueConstraintException, TypeSpecificConstraintRemovalException
+    NotAClabjectException, InvalidPropValueConstraintException, TypeSpecificConstraintRemovalException, \
+    InvalidValidationModeException
+
+
+class LazyReason:
+    """
+    A violation reason that keeps its format template and fields and formats them when it is rendered, so reasons
+    that are only tested for truth, e.g. in fail-fast validation, are never formatted. A lazy reason is never empty,
+    it compares, hashes, formats and concatenates like the rendered string. The fields are rendered in the state they
+    have at that time.
+    """
+    __slots__ = ("template", "args", "kwargs", "_text")
+
+    def __init__(self, template: str, *args, **kwargs):
+        self.template = template
+        self.args = args
+        self.kwargs = kwargs
+        self._text = None
+
+    def __str__(self):
+        text = self._text
+        if text is None:
+            text = self._text = self.template.format(*self.args, **self.kwargs)
+        return text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __bool__(self):
+        return True
+
+    def __len__(self):
+        return len(str(self))
+
+    def __contains__(self, item):
+        return item in str(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (str, LazyReason)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        if isinstance(other, (str, LazyReason)):
+            return LazyReason("{}{}", self, other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, str):
+            return LazyReason("{}{}", other, self)
+        return NotImplemented
+
+
+Reason = Union[str, LazyReason]
+
+
+def concat_reasons(reasons: Iterable) -> Reason:
+    """
+    Returns:
+        the concatenation of the given violation reasons, lazy if any of them is lazy
+    """
+    reasons = [reason for reason in reasons if reason]
+    if len(reasons) == 1:
+        return reasons[0]
+    if all(type(reason) is str for reason in reasons):
+        return "".join(reasons)
+    return LazyReason("{}" * len(reasons), *reasons)
+
+
+class ConstraintResult(NamedTuple):
+    """
+    The immutable outcome of a single constraint evaluation, violated constraints are reported as results
+    """
+    constraint: "BaseConstraint"
+    violation_reason: Reason
+
+    @property
+    def name(self) -> str:
+        return self.constraint.name
+
+    @property
+    def ok(self) -> bool:
+        return not self.violation_reason
 
 
 class BaseConstraint:
     """
-    Abstract Base of all kind of clabject constraints
+    Abstract Base of all kind of clabject constraints. :meth:`evaluate` leaves the constraint untouched and can be
+    used concurrently, calling a constraint additionally stores the reason of the last evaluation in violation_reason.
     """
     def __init__(self, name: str, violation_reason=""):
         self.name = name
         self.violation_reason = violation_reason
 
+    def evaluate(self, value: Any) -> ConstraintResult:
+        raise NotImplementedError()
+
+
+# relative evaluation costs, composed constraints evaluate their cheapest operands first
+TYPE_CHECK_COST = 1
+DEFAULT_CONSTRAINT_COST = 10
+# constraints up to this cost evaluate faster than a memo lookup, they are never memoised
+MEMO_LOOKUP_COST = 2
+# the runtime assumed per cost unit until a constraint has been timed
+SECONDS_PER_COST_UNIT = 1e-7
+
+
+class ConstraintStats:
+    """
+    Runtime statistics of a constraint as recorded by fail-fast validators, the evaluation time is sampled
+    """
+    __slots__ = ("evaluations", "failures", "timed_evaluations", "seconds")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.evaluations = 0
+        self.failures = 0
+        self.timed_evaluations = 0
+        self.seconds = 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        The smoothed share of violated evaluations, 0.5 for constraints without evaluations
+        """
+        return (self.failures + 1) / (self.evaluations + 2)
+
+    def mean_seconds(self, cost: int) -> float:
+        """
+        Returns:
+            the mean evaluation time, at least the estimate from the static cost, since samples of sub-microsecond
+            checks are dominated by the timer
+        """
+        estimate = cost * SECONDS_PER_COST_UNIT
+        if self.timed_evaluations:
+            return max(estimate, self.seconds / self.timed_evaluations)
+        return estimate
+
+    def rank(self, cost: int) -> float:
+        """
+        Returns:
+            the expected evaluation time per detected violation, fail-fast validators evaluate low ranks first
+        """
+        return self.mean_seconds(cost) / self.failure_rate
+
+
+# attributes of prop value constraints that do not affect their results
+_MEMO_NEUTRAL_ATTRS = frozenset(("violation_reason", "type_specific", "stats", "_memo_generation",
+                                 "_memo_snapshots", "memoised"))
+
 
 class PropValueConstraint(BaseConstraint):
     """
     A callable constraint imposed on the values of clabject props
     """
-    def __init__(self, name: str, eval_value_func: Callable[[Any], str], eval_on_init: bool):
+    def __init__(self, name: str, eval_value_func: Callable[[Any], str], eval_on_init: bool,
+                 cost: int = DEFAULT_CONSTRAINT_COST, deterministic: bool = False):
         """
         Args:
             name: the name of the constraint
             eval_value_func: an evaluation function, that returns an empty string for valid prop values and
                              a non empty string for prop values that violate the constraint
             eval_on_init: a value indicating whether the constr should be evaluated on (re) init
+            cost: the relative cost of the evaluation function, e.g. TYPE_CHECK_COST for isinstance checks
+            deterministic: True if the result depends only on the value and the attributes of the constraint, which
+                           makes the constraint eligible for the :class:`ConstraintMemo` if it costs more than
+                           MEMO_LOOKUP_COST
         """
+        self._memo_generation = 0
+        self._memo_snapshots = ()
+        # names of set valued attributes that may be changed in place, the memo compares them to frozen snapshots
+        self.set_params = ()
         super(PropValueConstraint, self).__init__(name=name)
         self.eval_value_func = eval_value_func
         self.eval_on_init = eval_on_init
         self.type_specific = False
+        self.cost = cost
+        self.stats = ConstraintStats()
+        self.deterministic = deterministic
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        object.__setattr__(self, key, value)
+        # memoised results refer to the generation of the constraint, changed parameters start a new one
+        if key not in _MEMO_NEUTRAL_ATTRS and self.__dict__.get("deterministic"):
+            self.invalidate_memo()
+        if key == "set_params" or key in self.__dict__.get("set_params", ()):
+            self._snapshot_set_params()
+        elif key in ("deterministic", "cost"):
+            # constraints that are cheaper than a lookup are evaluated directly
+            object.__setattr__(self, "memoised", self.__dict__.get("deterministic", False) and
+                               self.__dict__.get("cost", DEFAULT_CONSTRAINT_COST) > MEMO_LOOKUP_COST)
+
+    def invalidate_memo(self) -> None:
+        """
+        Discard the memoised results of the constraint, necessary after in place changes of its parameters that are
+        not listed in set_params
+        """
+        object.__setattr__(self, "_memo_generation", self._memo_generation + 1)
+
+    def memo_generation(self) -> int:
+        """
+        Returns:
+            the generation of the memoised results, a new one starts if a set parameter was changed in place
+        """
+        for name, snapshot in self._memo_snapshots:
+            if getattr(self, name) != snapshot:
+                self._snapshot_set_params()
+                self.invalidate_memo()
+                break
+        return self._memo_generation
+
+    def _snapshot_set_params(self) -> None:
+        object.__setattr__(self, "_memo_snapshots", tuple((name, frozenset(getattr(self, name)))
+                                                          for name in self.set_params if hasattr(self, name)))
+
+    def evaluate(self, prop_value: Any) -> ConstraintResult:
+        """
+        Returns:
+            the result of a single call of the evaluation function on the prop value, or the memoised result
+        """
+        if self.memoised:
+            return ConstraintResult(self, constraint_memo.reason(self, prop_value))
+        return ConstraintResult(self, self.eval_value_func(prop_value) or "")
 
     def __call__(self, prop_value: Any) -> bool:
-        self.violation_reason = ""
-        if self.eval_value_func(prop_value):
-            self.violation_reason = self.eval_value_func(prop_value)
-            return False
-        return True
+        result = self.evaluate(prop_value)
+        self.violation_reason = result.violation_reason
+        return result.ok
 
 
 class ClabjectStateConstraint(BaseConstraint):
@@ -56,12 +263,108 @@ class ClabjectStateConstraint(BaseConstraint):
         super(ClabjectStateConstraint, self).__init__(name=name)
         self.eval_clabject_func = eval_clabject_func
 
+    def evaluate(self, current_clabject: Any) -> ConstraintResult:
+        """
+        Returns:
+            the result of a single call of the evaluation function on the clabject
+        """
+        return ConstraintResult(self, self.eval_clabject_func(current_clabject) or "")
+
     def __call__(self, current_clabject: Any) -> bool:
-        self.violation_reason = ""
-        if self.eval_clabject_func(current_clabject):
-            self.violation_reason = self.eval_clabject_func(current_clabject)
-            return False
-        return True
+        result = self.evaluate(current_clabject)
+        self.violation_reason = result.violation_reason
+        return result.ok
+
+
+def _reason_func(constraint: BaseConstraint) -> Callable[[Any], Reason]:
+    # the evaluation function of plain PropValueConstraints is called directly, without building a result
+    if type(constraint).evaluate is PropValueConstraint.evaluate:
+        if constraint.memoised:
+            return lambda value: constraint_memo.reason(constraint, value)
+        return constraint.eval_value_func
+    return lambda value: constraint.evaluate(value).violation_reason
+
+
+def _no_violations(value: Any) -> Tuple[ConstraintResult, ...]:
+    return ()
+
+
+def compile_validator(constraints: List[BaseConstraint]) -> Callable[[Any], Tuple[ConstraintResult, ...]]:
+    """
+    Fuse a list of prop value constraints into a single validator function
+
+    Args:
+        constraints: the constraints to evaluate, in the order of evaluation
+
+    Returns:
+        a function that evaluates each constraint once on a given value and returns the ConstraintResults of the
+        violated constraints
+    """
+    checks = tuple((constraint, _reason_func(constraint)) for constraint in constraints)
+    if not checks:
+        return _no_violations
+    elif len(checks) == 1:
+        ((constraint, reason_func),) = checks
+
+        def validate_one(value):
+            reason = reason_func(value)
+            return (ConstraintResult(constraint, reason),) if reason else ()
+        return validate_one
+
+    def validate(value):
+        violations = ()
+        for constraint, reason_func in checks:
+            reason = reason_func(value)
+            if reason:
+                violations += (ConstraintResult(constraint, reason),)
+        return violations
+    return validate
+
+
+class FailFastValidator:
+    """
+    A compiled validator that stops at the first violated constraint. It records the statistics of its constraints
+    and periodically reorders them, such that cheap and frequently violated constraints are evaluated first.
+    """
+    __slots__ = ("_checks", "_calls")
+
+    # every n-th call is timed, the order is revised every m-th call
+    timing_interval = 16
+    reorder_interval = 256
+
+    def __init__(self, constraints: List[PropValueConstraint]):
+        self._checks = tuple((constraint, _reason_func(constraint), constraint.stats) for constraint in constraints)
+        self._calls = 0
+
+    @property
+    def constraints(self) -> List[PropValueConstraint]:
+        """
+        The constraints in their current order of evaluation
+        """
+        return [constraint for constraint, _, _ in self._checks]
+
+    def reorder(self) -> None:
+        # the tuple is replaced rather than sorted in place, calls in other threads keep iterating the former order
+        self._checks = tuple(sorted(self._checks, key=lambda check: check[2].rank(check[0].cost)))
+
+    def __call__(self, value: Any) -> Tuple[ConstraintResult, ...]:
+        self._calls = calls = self._calls + 1
+        if not calls % self.reorder_interval:
+            self.reorder()
+        timed = not calls % self.timing_interval
+        for constraint, reason_func, stats in self._checks:
+            if timed:
+                start = perf_counter()
+                reason = reason_func(value)
+                stats.seconds += perf_counter() - start
+                stats.timed_evaluations += 1
+            else:
+                reason = reason_func(value)
+            stats.evaluations += 1
+            if reason:
+                stats.failures += 1
+                return (ConstraintResult(constraint, reason),)
+        return ()
 
 
 def prop_constraint_py_isinstance_functional(expected_type, eval_on_init=True) -> PropValueConstraint:
@@ -76,16 +379,18 @@ def prop_constraint_py_isinstance_functional(expected_type, eval_on_init=True) -
         a parameterised, callable PropValueConstraint object
     """
 
-    def eval_value_func(value) -> str:
-        if not isinstance(value, expected_type):
-            return "{VALUE} is not of the expected type {TYPE}".format(
-                VALUE=str(value), TYPE=expected_type.__name__
-            )
+    def eval_value_func(value) -> Reason:
+        if not isinstance(value, constraint.expected_type):
+            return LazyReason("{VALUE} is not of the expected type {TYPE}",
+                              VALUE=value, TYPE=constraint.expected_type.__name__)
         else:
             return ""
 
     name = "is_of_{TYPE}".format(TYPE=expected_type.__name__)
-    return PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=eval_on_init)
+    constraint = PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=eval_on_init,
+                                     cost=TYPE_CHECK_COST, deterministic=True)
+    constraint.expected_type = expected_type
+    return constraint
 
 
 is_str_constraint = prop_constraint_py_isinstance_functional(str)
@@ -120,8 +425,7 @@ def prop_constraint_ml_instance_of_th_order_functional(expected_clabject_type,
         a parameterised, callable PropValueConstraint object
 
     """
-    from multilevel_py.core import is_clabject
-    from multilevel_py.core import Clabject
+    from multilevel_py.core import is_clabject, instantiation_order as order_between
 
     def check_int_avove_zero(value) -> bool:
         if not isinstance(value, int):
@@ -159,28 +463,23 @@ def prop_constraint_ml_instance_of_th_order_functional(expected_clabject_type,
     def eval_value_func(value) -> str:
         if not is_clabject(value):
             return str(NotAClabjectException(obj=value))
-        inst_steps = 0
-        current_clab = value
-
-        while inst_steps < min_inst_steps:
-            # check chain end or premature instance
-            if current_clab == Clabject or current_clab == expected_clabject_type:
+        inst_steps = order_between(value, constraint.expected_clabject_type)
+        if inst_steps is None:
+            # chain ends before the minimal order is reached
+            if len(value.__ancestor_ids__) < min_inst_steps:
                 return "Instantiation order of given clabject is to low."
-
-            current_clab = current_clab.instance_of()
-            inst_steps += 1
-
-        # section of instantiation chain that is valid
-        while current_clab != Clabject and inst_steps <= max_inst_steps:
-            if current_clab == expected_clabject_type:
-                return ""
-            current_clab = current_clab.instance_of()
-            inst_steps += 1
-
+        elif inst_steps < min_inst_steps:
+            return "Instantiation order of given clabject is to low."
+        elif inst_steps <= max_inst_steps:
+            return ""
         return "Instantiation order of given clabject value is to high"
 
     name = "{ORDER}_order_ml_instance_of_{TYPE}".format(ORDER=order_str, TYPE=str(expected_clabject_type.__name__))
-    return PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=True)
+    # the order is read from the ancestor ids, which is cheaper than a memo lookup
+    constraint = PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=True,
+                                     cost=MEMO_LOOKUP_COST, deterministic=True)
+    constraint.expected_clabject_type = expected_clabject_type
+    return constraint
 
 
 def prop_constraint_is_th_order_instance_of_clabject_set_functional(expected_values: set, order: int = 1,
@@ -199,25 +498,36 @@ def prop_constraint_is_th_order_instance_of_clabject_set_functional(expected_val
 
     """
     from multilevel_py.core import is_clabject
+    from multilevel_py.registry import ClabjectIdSet
+
+    # membership by clabject ids instead of python level __hash__ and __eq__ calls
+    accepted_values = ClabjectIdSet(expected_values) if all(is_clabject(c) for c in expected_values) \
+        else expected_values
 
     def eval_value_func(value: Any):
         if not is_clabject(value):
-            return str(NotAClabjectException(value))
+            return LazyReason("{}", NotAClabjectException(value))
         inst_order = order if order else 1
-        while inst_order > 0:
-            value = value.instance_of()
-            inst_order = inst_order - 1
-        if value in expected_values:
+        ancestor_ids = value.__ancestor_ids__
+        if isinstance(accepted_values, ClabjectIdSet) and inst_order < len(ancestor_ids):
+            # the domain meta of the given order is known by its id
+            is_accepted = ancestor_ids[inst_order] in accepted_values.ids
+        else:
+            while inst_order > 0:
+                value = value.instance_of()
+                inst_order = inst_order - 1
+            is_accepted = value in accepted_values
+        if is_accepted:
             return ""
         else:
-            return "The given clabject value is not a {ORDER} order instance of any of the accepted clabjects".format(
-                ORDER=order
-            )
+            return LazyReason("The given clabject value is not a {ORDER} order instance of any of the accepted "
+                              "clabjects", ORDER=order)
 
     name = "{ORDER}_order_instance_of_clabject_set_{CLABJECTS}".format(ORDER=order,
                                                                        CLABJECTS={c.__name__ for c in expected_values})
 
-    return PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=eval_on_init)
+    return PropValueConstraint(name=name, eval_value_func=eval_value_func, eval_on_init=eval_on_init,
+                               deterministic=True)
 
 
 def prop_constraint_value_is_collection_functional(eval_on_init=True):
@@ -227,14 +537,14 @@ def prop_constraint_value_is_collection_functional(eval_on_init=True):
     Args:
         eval_on_init: value indicating whether the constr should be evaluated on (re) init
     """
-    def eval_func(value: Any) -> str:
+    def eval_func(value: Any) -> Reason:
         res = ""
         if not isinstance(value, Iterable) or isinstance(value, str):
-            res = str(value) + "is not a collection"
+            res = LazyReason("{}is not a collection", value)
         return res
 
     name = "is_collection"
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
+    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init, cost=TYPE_CHECK_COST)
 
 
 is_collection_constraint = prop_constraint_value_is_collection_functional(eval_on_init=True)
@@ -242,7 +552,8 @@ is_collection_constraint = prop_constraint_value_is_collection_functional(eval_o
 
 def prop_constraint_collection_member_functional(
         member_constr_func: PropValueConstraint,
-        filter_func: Callable[[Collection], Collection] = None, eval_on_init=True):
+        filter_func: Callable[[Collection], Collection] = None, eval_on_init=True,
+        executor: Executor = None, chunk_size: int = None, parallel_threshold: int = None):
     """
     Generates a PropValueConstraint that is applied on (selected) members of a collection prop value
 
@@ -251,41 +562,116 @@ def prop_constraint_collection_member_functional(
         filter_func: A filter function that takes the whole collection and returns only the members,
                      the member_constr_func should be checked on
         eval_on_init: value indicating whether the constr should be evaluated on (re) init
+        executor: an optional concurrent.futures executor that evaluates large collections in chunks, see
+                  :class:`CollectionMemberConstraint`
+        chunk_size: the number of members per chunk submitted to the executor
+        parallel_threshold: the number of members below which the members are evaluated sequentially
 
     Returns:
         a parameterised, callable PropValueConstraint object
 
     """
 
-    def eval_func(collection_value):
-        res_str = ""
-        eval_collection = filter_func(collection_value) if filter_func else collection_value
-        for member in eval_collection:
-            if not member_constr_func(member):
-                res_str += "Member {MEMBER} failed for reason: {REASON}".format(
-                    MEMBER=str(member),
-                    REASON=member_constr_func.violation_reason)
-                res_str += "\n"
-        return res_str
-
-    name = "_".join(["check", member_constr_func.name, "on_collection_members"])
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
+    return CollectionMemberConstraint(member_constr_func, filter_func=filter_func, eval_on_init=eval_on_init,
+                                      executor=executor, chunk_size=chunk_size, parallel_threshold=parallel_threshold)
+
+
+def _member_failures(reason_func: Callable[[Any], Reason], members: Iterable) -> List[LazyReason]:
+    failures = []
+    for member in members:
+        reason = reason_func(member)
+        if reason:
+            failures.append(LazyReason("Member {MEMBER} failed for reason: {REASON}\n", MEMBER=member, REASON=reason))
+    return failures
+
+
+def _chunk_failures(member_constraint: PropValueConstraint, members: list) -> List[LazyReason]:
+    # runs on an executor, a process pool receives a pickled copy of the member constraint
+    return _member_failures(_reason_func(member_constraint), members)
+
+
+class CollectionMemberConstraint(PropValueConstraint):
+    """
+    A constraint that each (selected) member of a collection value must satisfy. Without a filter function the
+    members are checked independently of each other, which lets managed collection values check only the members
+    they add, see :mod:`collection_values`.
+
+    With an executor, collections of at least parallel_threshold members are split into chunks of chunk_size members
+    that are evaluated on the executor and merged into the violation reason in the order of the members. A thread
+    pool pays off for member constraints that release the GIL, e.g. I/O bound ones, a process pool for CPU bound
+    ones, whose member constraint and members can be pickled.
+    """
+    # defaults of the chunked evaluation
+    CHUNK_SIZE = 1024
+    PARALLEL_THRESHOLD = 4096
+
+    def __init__(self, member_constraint: PropValueConstraint, filter_func: Callable[[Collection], Collection] = None,
+                 eval_on_init: bool = True, executor: Executor = None, chunk_size: int = None,
+                 parallel_threshold: int = None):
+        self.member_constraint = member_constraint
+        self.filter_func = filter_func
+        self.executor = executor
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.parallel_threshold = self.PARALLEL_THRESHOLD if parallel_threshold is None else parallel_threshold
+        self._member_reason = _reason_func(member_constraint)
+        super(CollectionMemberConstraint, self).__init__(
+            name="_".join(["check", member_constraint.name, "on_collection_members"]),
+            eval_value_func=self._eval_value, eval_on_init=eval_on_init)
+
+    @property
+    def member_wise(self) -> bool:
+        return self.filter_func is None
+
+    def _eval_value(self, collection_value):
+        eval_collection = self.filter_func(collection_value) if self.filter_func else collection_value
+        if self.executor is not None:
+            eval_collection = list(eval_collection)
+            if len(eval_collection) >= self.parallel_threshold:
+                return self._eval_chunks(eval_collection)
+        failures = _member_failures(self._member_reason, eval_collection)
+        return concat_reasons(failures) if failures else ""
+
+    def _eval_chunks(self, members: list) -> Reason:
+        chunk_size = self.chunk_size
+        futures = [self.executor.submit(_chunk_failures, self.member_constraint, members[i:i + chunk_size])
+                   for i in range(0, len(members), chunk_size)]
+        failures = [failure for future in futures for failure in future.result()]
+        return concat_reasons(failures) if failures else ""
 
 
 def prop_constraint_collection_multiplicity_functional(min_member_number: int, max_member_number: int,
                                                        eval_on_init=False):
-    def eval_func(collection_value) -> str:
+    return CollectionMultiplicityConstraint(min_member_number, max_member_number, eval_on_init=eval_on_init)
+
+
+class CollectionMultiplicityConstraint(PropValueConstraint):
+    """
+    Bounds the number of members of a collection value, managed collection values check the bounds on the size
+    they are about to reach, see :mod:`collection_values`
+    """
+
+    def __init__(self, min_member_number: int, max_member_number: int, eval_on_init: bool = False):
+        self.min_member_number = min_member_number
+        self.max_member_number = max_member_number
+        super(CollectionMultiplicityConstraint, self).__init__(
+            name="collection_multiplicity_between_{MIN}_and_{MAX}".format(MIN=min_member_number,
+                                                                          MAX=max_member_number),
+            eval_value_func=self._eval_value, eval_on_init=eval_on_init)
+
+    def size_reason(self, size: int) -> str:
+        """
+        Returns:
+            the violation reason of a collection of the given size
+        """
+        if not self.min_member_number <= size <= self.max_member_number:
+            return "The collection holds {N} members".format(N=size)
+        return ""
+
+    def _eval_value(self, collection_value) -> str:
         res_str = ""
         if not hasattr(collection_value, "__len__"):
             res_str += "The given value {VALUE} is no collection".format(VALUE=str(collection_value))
-
-        if not min_member_number <= len(collection_value) <= max_member_number:
-            res_str += "The collection holds {N} members".format(N=len(collection_value))
-        return res_str
-
-    name = "collection_multiplicity_between_{MIN}_and_{MAX}".format(MIN=min_member_number,
-                                                                               MAX=max_member_number)
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
+        return res_str + self.size_reason(len(collection_value))
 
 
 def prop_value_can_be_bound_as_method_functional(eval_on_init=True):
@@ -315,6 +701,224 @@ def prop_value_can_be_bound_as_method_functional(eval_on_init=True):
 value_can_be_bound_as_method_constraint = prop_value_can_be_bound_as_method_functional(eval_on_init=True)
 
 
+class ComposedConstraint(PropValueConstraint):
+    """
+    Base of the constraints that compose other prop value constraints. Nested compositions of the same kind are
+    flattened into one, identical operands are evaluated once and the operands are evaluated in the order of their
+    cost. The violation reason of a composition is the concatenation of the reasons of its operands in the given order.
+    """
+    name_separator = None
+
+    def __init__(self, operands: List[PropValueConstraint], eval_on_init: bool):
+        """
+        Args:
+            operands: the composed constraints, compositions of the same kind are replaced by their operands
+            eval_on_init: a value indicating whether the constr should be evaluated on (re) init
+        """
+        flat_operands = []
+        for operand in operands:
+            if type(operand) is type(self):
+                flat_operands.extend(operand.operands)
+            else:
+                flat_operands.append(operand)
+        self.operands = tuple(flat_operands)
+        unique_operands = list(dict.fromkeys(flat_operands))
+        # stable sort, operands of the same cost keep their order
+        self._checks = tuple((operand, _reason_func(operand))
+                             for operand in sorted(unique_operands, key=lambda operand: operand.cost))
+        super(ComposedConstraint, self).__init__(
+            name=self.name_separator.join(operand.name for operand in self.operands),
+            eval_value_func=self._eval_value, eval_on_init=eval_on_init,
+            cost=sum(operand.cost for operand in unique_operands))
+
+    def _joined_reasons(self, reasons: dict) -> Reason:
+        return concat_reasons(reasons[operand] for operand in self.operands if operand in reasons)
+
+    def _eval_value(self, value: Any) -> str:
+        raise NotImplementedError()
+
+
+class AndConstraint(ComposedConstraint):
+    """
+    A composition whose operands must all be fulfilled. The evaluation stops at the first violated operand, the
+    reasons of the remaining operands are then collected to report the violation. Once a type check is violated,
+    only the remaining type checks are evaluated, the other operands depend on the type of the value.
+    """
+    name_separator = "_And_"
+
+    def _eval_value(self, value):
+        checks = iter(self._checks)
+        for operand, reason_func in checks:
+            reason = reason_func(value)
+            if reason:
+                break
+        else:
+            return ""
+
+        type_violated = operand.cost <= TYPE_CHECK_COST
+        reasons = dict.fromkeys(self.operands, "")
+        reasons[operand] = reason
+        for operand, reason_func in checks:
+            if type_violated and operand.cost > TYPE_CHECK_COST:
+                break
+            reasons[operand] = reason_func(value) or ""
+            type_violated = type_violated or (reasons[operand] and operand.cost <= TYPE_CHECK_COST)
+        return self._joined_reasons(reasons)
+
+
+class OrConstraint(ComposedConstraint):
+    """
+    A composition of which at least one operand must be fulfilled. The evaluation stops at the first fulfilled operand.
+    """
+    name_separator = "_OR_"
+
+    def _eval_value(self, value):
+        reasons = {}
+        for operand, reason_func in self._checks:
+            reason = reason_func(value)
+            if not reason:
+                return ""
+            reasons[operand] = reason
+        return self._joined_reasons(reasons)
+
+
+class _EmptyValueClass(object):
+
+    def __str__(self):
+        return "EmptyValue"
+
+
+EmptyValue = _EmptyValueClass()
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    bypasses: int
+    maxsize: int
+    currsize: int
+
+
+# values of these types are memoised by type and value
+_MEMO_VALUE_TYPES = frozenset((str, int, float, bool, complex, bytes, type(None), date, time, datetime, timedelta,
+                               _EmptyValueClass))
+
+
+class ConstraintMemo:
+    """
+    Bounded LRU of the violation reasons of deterministic prop value constraints, keyed by the constraint, its
+    generation and the value. Constraints that are cheaper than a lookup are evaluated directly. Scalar values and enum members are keyed by their type and value, instances of the types
+    registered with :meth:`key_by_identity` (i.e. clabjects) by identity, all other values bypass the memo.
+    The memo is opt-in, it stays disabled until :meth:`enable` is called.
+    """
+    def __init__(self):
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._entries = OrderedDict()
+        self._identity_types = ()
+
+    def enable(self, maxsize: int = 4096) -> None:
+        assert maxsize > 0
+        self.maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def disable(self) -> None:
+        self.maxsize = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Discard all memoised results and reset the counters
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.bypasses = 0
+
+    def info(self) -> MemoInfo:
+        return MemoInfo(hits=self.hits, misses=self.misses, bypasses=self.bypasses, maxsize=self.maxsize,
+                        currsize=len(self._entries))
+
+    def key_by_identity(self, *types: type) -> None:
+        """
+        Key the instances of the given types by identity, they are referenced weakly by the memo
+        """
+        self._identity_types += types
+
+    def reason(self, constraint: PropValueConstraint, value: Any) -> str:
+        """
+        Returns:
+            the (memoised) violation reason of the constraint for the value
+        """
+        if not self.maxsize or not constraint.memoised:
+            return constraint.eval_value_func(value) or ""
+        generation = constraint.memo_generation() if constraint._memo_snapshots else constraint._memo_generation
+        value_type = type(value)
+        if value_type in _MEMO_VALUE_TYPES or isinstance(value, Enum):
+            key = (constraint, generation, value_type, value)
+            by_identity = False
+        elif isinstance(value, self._identity_types):
+            key = (constraint, generation, None, id(value))
+            by_identity = True
+        else:
+            self.bypasses += 1
+            return constraint.eval_value_func(value) or ""
+
+        entries = self._entries
+        entry = entries.get(key)
+        # the id of a collected value may have been reused
+        if entry is not None and (not by_identity or entry[0]() is value):
+            self.hits += 1
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                # evicted by a concurrent evaluation meanwhile
+                pass
+            return entry[1]
+
+        self.misses += 1
+        reason = constraint.eval_value_func(value) or ""
+        entries[key] = (ref(value) if by_identity else None, reason)
+        if len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                pass
+        return reason
+
+
+constraint_memo = ConstraintMemo()
+
+
+class OptionalConstraint(PropValueConstraint):
+    """
+    A relaxation of a prop value constraint that also accepts the EmptyValue. Nested relaxations are merged into one
+    that checks the EmptyValue once.
+    """
+    def __init__(self, constraint: PropValueConstraint):
+        """
+        Args:
+            constraint: the relaxed constraint
+        """
+        self.levels = 1
+        while isinstance(constraint, OptionalConstraint):
+            self.levels += constraint.levels
+            constraint = constraint.constraint
+        self.constraint = constraint
+        self._reason_func = _reason_func(constraint)
+        self._suffix = " or an EmptyValue" * self.levels
+        super(OptionalConstraint, self).__init__(name=constraint.name + "_OR_Empty" * self.levels,
+                                                 eval_value_func=self._eval_value,
+                                                 eval_on_init=constraint.eval_on_init, cost=constraint.cost)
+
+    def _eval_value(self, value):
+        if value is EmptyValue:
+            return ""
+        reason = self._reason_func(value)
+        return reason + self._suffix if reason else ""
+
+
 def prop_constraint_or_functional(constraint_a: PropValueConstraint, constraint_b: PropValueConstraint):
     """
     Args:
@@ -322,21 +926,10 @@ def prop_constraint_or_functional(constraint_a: PropValueConstraint, constraint_
         constraint_b: the snd constraint
 
     Returns:
-        a combined PropValueConstraint, in which at least one of constraint_a and constraint_b must be fulfilled
+        a combined OrConstraint, in which at least one of constraint_a and constraint_b must be fulfilled
     """
-
-    def eval_func(value):
-        constraint_a(value)
-        constraint_b(value)
-        res = ""
-        if constraint_a.violation_reason and constraint_b.violation_reason:
-            res += constraint_a.violation_reason
-            res += constraint_b.violation_reason
-        return res
-
-    name = constraint_a.name + "_OR_" + constraint_b.name
     eval_on_init = constraint_a.eval_on_init and constraint_b.eval_on_init  # conservative
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
+    return OrConstraint(operands=[constraint_a, constraint_b], eval_on_init=eval_on_init)
 
 
 def prop_constraint_and_functional(constraint_a: PropValueConstraint, constraint_b: PropValueConstraint,
@@ -348,31 +941,10 @@ def prop_constraint_and_functional(constraint_a: PropValueConstraint, constraint
         eval_on_init: (bool) value indicating whether the constr should be evaluated on (re) init
 
     Returns:
-        a combined PropValue Constraint, in which both constraint_a, constraint_b must be fulfilled
+        a combined AndConstraint, in which both constraint_a, constraint_b must be fulfilled
 
     """
-
-    def eval_func(value):
-        constraint_a(value)
-        constraint_b(value)
-        res = ""
-        if constraint_a.violation_reason or constraint_b.violation_reason:
-            res += constraint_a.violation_reason
-            res += constraint_b.violation_reason
-        return res
-
-    name = constraint_a.name + "_And_" + constraint_b.name
-    eval_on_init = eval_on_init
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
-
-
-class _EmptyValueClass(object):
-
-    def __str__(self):
-        return "EmptyValue"
-
-
-EmptyValue = _EmptyValueClass()
+    return AndConstraint(operands=[constraint_a, constraint_b], eval_on_init=eval_on_init)
 
 
 def prop_constraint_optional_value_functional(constraint: PropValueConstraint):
@@ -383,20 +955,7 @@ def prop_constraint_optional_value_functional(constraint: PropValueConstraint):
     Returns:
         a relaxed constraint of the given PropValueConstraint by tolerating also values of None as valid init value
     """
-
-    def eval_func(value):
-        if value == EmptyValue:
-            return ""
-        else:
-            constraint(value)
-            if constraint.violation_reason:
-                return constraint.violation_reason + " or an EmptyValue"
-            else:
-                return ""
-
-    name = constraint.name + "_OR_Empty"
-    eval_on_init = constraint.eval_on_init
-    return PropValueConstraint(name=name, eval_value_func=eval_func, eval_on_init=eval_on_init)
+    return OptionalConstraint(constraint)
 
 
 def eval_negative_value_func(value) -> str:
@@ -424,13 +983,17 @@ def prop_constraint_value_in_set_functional(expected_set: set, eval_on_init=True
 
     """
     def eval_func(value):
-        if value in expected_set:
+        if value in constraint.expected_set:
             return ""
         else:
-            return "The Value {VAL} is not in the expected set {SET}".format(VAL=value, SET=expected_set)
-            return constraint.violation_reason
+            return LazyReason("The Value {VAL} is not in the expected set {SET}", VAL=value,
+                              SET=constraint.expected_set)
 
-    return PropValueConstraint(name="is_in_set_constr", eval_value_func=eval_func, eval_on_init=eval_on_init)
+    constraint = PropValueConstraint(name="is_in_set_constr", eval_value_func=eval_func, eval_on_init=eval_on_init,
+                                     deterministic=True)
+    constraint.expected_set = expected_set
+    constraint.set_params = ("expected_set",)
+    return constraint
 
 
 class ConstrViolationDictFactory(defaultdict):
@@ -441,7 +1004,7 @@ class ConstrViolationDictFactory(defaultdict):
     def add_violations(self, violations: dict) -> None:
         """
         Args:
-            violations: a dict with structure <prop_name: str> => <violation_reason: str>
+            violations: a dict with structure <prop_name: str> => <ConstraintResult or list of ConstraintResults>
 
         Returns:
             Nothing, updates the violationDict object
@@ -465,6 +1028,44 @@ def create_violated_constraint_dict():
     return all_violated_constraints
 
 
+# 'collect_all' reports every violated constraint, 'fail_fast' stops at the first violation
+VALIDATION_MODES = ("collect_all", "fail_fast")
+_validation_mode = ContextVar("validation_mode", default="collect_all")
+
+
+@contextmanager
+def validation_mode(mode: str):
+    """
+    Set the validation mode of the instantiations, prop assignments and constraint checks within the context, calls
+    that are given a validation mode explicitly are not affected. The mode is local to the current thread or task.
+
+    Args:
+        mode: one of VALIDATION_MODES
+    """
+    if mode not in VALIDATION_MODES:
+        raise InvalidValidationModeException(mode=mode)
+    token = _validation_mode.set(mode)
+    try:
+        yield mode
+    finally:
+        _validation_mode.reset(token)
+
+
+def is_fail_fast(validation: str = None) -> bool:
+    """
+    Args:
+        validation: the validation mode given to a call, None for the mode of the current context
+
+    Returns:
+        True if the validation has to stop at the first violation
+    """
+    if validation is None:
+        return _validation_mode.get() == "fail_fast"
+    if validation not in VALIDATION_MODES:
+        raise InvalidValidationModeException(mode=validation)
+    return validation == "fail_fast"
+
+
 class ReInitPropConstr:
     def __init__(self,
                  del_constr: List[PropValueConstraint] = [],
@@ -1,14 +1,23 @@
 import math
-from copy import deepcopy
-from typing import List, Callable, Any, Dict
+import warnings
+from itertools import count
+from types import MethodType, MappingProxyType
+from typing import List, Callable, Any, Dict, MutableMapping, NamedTuple, Union
+from weakref import finalize
 
 from multilevel_py.clabject_prop import CollectionDescription, \
-    BaseClabjectProp, SimpleProp, CollectionProp, MethodProp, StateConstraintProp, AssociationProp
-from multilevel_py.constraints import create_violated_constraint_dict, ReInitPropConstr, PropValueConstraint
+    BaseClabjectProp, SimpleProp, CollectionProp, MethodProp, StateConstraintProp, AssociationProp, \
+    is_immutable_value, copy_prop_value, IdentityValue, note_instantiation
+from multilevel_py.collection_values import mutation_count, bind_shared_value
+from multilevel_py.constraints import create_violated_constraint_dict, ReInitPropConstr, PropValueConstraint, \
+    constraint_memo, is_fail_fast
 from multilevel_py.exceptions import UninitialisedPropException, ConstraintViolationException, \
     UndefinedPropsException, ChangeFinalPropException, UnduePropInstantiationException, \
     PropsAlreadyDefinedException, ReInitFinalPropException, \
-    ReInitVanishingPropException, InconsistentCreateClabjectPropArgsException, ClabjectDeclaredAsInstanceException
+    ReInitVanishingPropException, InconsistentCreateClabjectPropArgsException, ClabjectDeclaredAsInstanceException, \
+    LightweightInstanceParentsException, InvalidIndexKindException, DuplicateClabjectNameException
+from multilevel_py.indexes import INDEX_KINDS, parse_lookup, matches
+from multilevel_py.registry import InstanceRegistry, ClabjectIdTable, NameRegistry
 
 
 def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
@@ -16,7 +25,7 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
                          i_m: bool = False,
                          i_sc: bool=False,
                          i_assoc: bool=False,
-                         coll_desc: tuple = None, v=None, d=None):
+                         coll_desc: tuple = None, v=None, d=None, copy_policy: str = None):
     """
     Stable Interface for the creation of clabject properties, the suitable ClabjectProp class is chosen in dependence
     of the given attributes, see :meth:`clabject_prop.BaseClabjectProp.__init__`
@@ -34,6 +43,7 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
         coll_desc: (min, max, member_constr) tuple that is translated to a CollectionDescription object
         v: shorthand for prop_value
         d: shorthand for default_value
+        copy_policy: how clabjects obtain their own copies of the value, see :class:`clabject_prop.BaseClabjectProp`
 
     Returns:
         An obj which is an instance of a class that inherits from BaseClabjectProp
@@ -55,7 +65,8 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
             constraints=c,
             is_final=i_f,
             prop_value=v,
-            default_value=d
+            default_value=d,
+            copy_policy=copy_policy
         )
 
     elif i_assoc:
@@ -66,7 +77,8 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
             constraints=c,
             is_final=i_f,
             prop_value=v,
-            default_value=d
+            default_value=d,
+            copy_policy=copy_policy
         )
 
     elif i_sc:
@@ -77,7 +89,8 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
             constraints=c,
             is_final=i_f,
             prop_value=v,
-            default_value=d
+            default_value=d,
+            copy_policy=copy_policy
         )
     elif coll_desc is not None:
         return CollectionProp(
@@ -88,7 +101,8 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
             is_final=i_f,
             prop_value=v,
             default_value=d,
-            collection_desc=coll_desc
+            collection_desc=coll_desc,
+            copy_policy=copy_policy
         )
     else:
         return SimpleProp(
@@ -98,14 +112,195 @@ def create_clabject_prop(n: str, t: int, f, c: List[Callable[[Any], bool]] = [],
             constraints=c,
             is_final=i_f,
             prop_value=v,
-            default_value=d
+            default_value=d,
+            copy_policy=copy_policy
         )
 
 
-class ClabjectPropDict(Dict[str, BaseClabjectProp]):
+class _PropLayer:
+    """
+    The props defined, initialised or changed on a single clabject together with the layer of its domain meta
     """
-    Responsible for updating the clabject props in the __ml_props__ attribute of a clabject
+    __slots__ = ("props", "due_at", "vanish_at", "pending", "base")
+
+    def __init__(self, base=None, props: dict = None, due_at: dict = None, vanish_at: dict = None,
+                 pending: set = None):
+        self.props = props if props is not None else {}
+        # <due_depth> => names of the props in this layer that are due at the respective depth
+        self.due_at = due_at if due_at is not None else {}
+        # <vanish_depth> => names of the props in this layer that are visible for the last time at the respective depth
+        self.vanish_at = vanish_at if vanish_at is not None else {}
+        # names of the props in this layer that are already due but not initialised or that require a re-init
+        self.pending = pending if pending is not None else set()
+        self.base = base
+
+    def copy(self):
+        return _PropLayer(base=self.base,
+                          props=dict(self.props),
+                          due_at={depth: set(names) for depth, names in self.due_at.items()},
+                          vanish_at={depth: set(names) for depth, names in self.vanish_at.items()},
+                          pending=set(self.pending))
+
+
+def _unchanged(value: Any, snapshot_value: Any) -> bool:
+    try:
+        return bool(value == snapshot_value)
+    except Exception:
+        # values without a plain equality, e.g. arrays, count as changed
+        return False
+
+
+class _ExposureSnapshot:
     """
+    A copy of the layer of a clabject whose exposed values are replaced by copies. The instances of the clabject
+    resolve their props through the snapshot, so they share the copies instead of taking one each, until an exposed
+    value changes.
+    """
+    __slots__ = ("layer", "_sources")
+
+    def __init__(self, layer: _PropLayer, exposed_props):
+        self.layer = layer.copy()
+        # (exposed value, mutation count or copy to compare it with) pairs
+        self._sources = []
+        for prop_name in exposed_props:
+            prop = layer.props[prop_name]
+            if prop.copy_policy == "deepcopy":
+                # each instance takes a copy of its own anyway, see InstantiationPlan.bind
+                continue
+            snapshot_prop = prop.clone()
+            self.layer.props[prop_name] = snapshot_prop
+            count = mutation_count(prop.prop_value)
+            self._sources.append((prop.prop_value, snapshot_prop.prop_value if count is None else count))
+
+    def is_current(self) -> bool:
+        """
+        Returns:
+            False if an exposed value was changed in place since the snapshot was taken
+        """
+        for value, reference in self._sources:
+            count = mutation_count(value)
+            if count is None:
+                if not _unchanged(value, reference):
+                    return False
+            elif count != reference:
+                return False
+        return True
+
+
+class ClabjectPropDict(MutableMapping[str, BaseClabjectProp]):
+    """
+    Responsible for updating the clabject props in the __ml_props__ attribute of a clabject.
+
+    The props are delta encoded: the dict of a clabject holds only the props that were defined, initialised or
+    changed on the clabject itself. All other props are resolved through a snapshot of the dicts of its domain metas
+    and cached as views, whose relative step counters refer to the depth of the current clabject, props whose counters
+    do not depend on the depth are shared as they are. The schedule of a prop is stored as absolute due and vanish
+    depths, so an instantiation step only touches the props it changes.
+    """
+    __slots__ = ("depth", "_layer", "_layer_shared", "_owned", "_exposed", "_snapshot", "_cache", "_plans")
+
+    def __init__(self, depth: int = 0, base: _PropLayer = None):
+        """
+        Args:
+            depth: the number of instantiation steps between the top clabject of the hierarchy and the current clabject
+            base: the layer of the domain meta of the current clabject
+        """
+        self.depth = depth
+        self._layer = _PropLayer(base=base)
+        # True if the own layer is referenced by instances and thus must be copied before it is changed
+        self._layer_shared = False
+        # names of the props in the own layer that are referenced by this dict only and may be changed in place,
+        # the set is allocated on the first change
+        self._owned = ()
+        # names of the owned props whose mutable values may be referenced outside of the dict, e.g. by a caller that
+        # read or provided them. They stay owned on instantiation, the instances share a snapshot of them instead.
+        self._exposed = ()
+        # the _ExposureSnapshot the instances resolve their props through, None if it has to be taken (again)
+        self._snapshot = None
+        self._cache = {}
+        # <speed adjustments> => InstantiationPlan, allocated on the first instantiation
+        self._plans = None
+
+    def _lookup(self, prop_name: str):
+        """
+        Returns:
+            the (cached) view of the given prop or None if the prop is not defined or has vanished
+        """
+        try:
+            return self._cache[prop_name]
+        except KeyError:
+            pass
+
+        prop = None
+        layer = self._layer
+        while layer is not None:
+            prop = layer.props.get(prop_name)
+            if prop is not None:
+                break
+            layer = layer.base
+
+        # undefined and vanished props are cached as well, which keeps negative lookups cheap
+        if prop is not None:
+            if not prop.is_visible_at(self.depth):
+                prop = None
+            elif prop._depth != self.depth and not prop.is_settled_at(self.depth):
+                prop = prop.rebase(self.depth)
+        self._cache[prop_name] = prop
+        return prop
+
+    def _writable_layer(self) -> _PropLayer:
+        if self._layer_shared:
+            self._layer = self._layer.copy()
+            self._layer_shared = False
+        return self._layer
+
+    def _expose(self, prop_name: str) -> None:
+        if not self._exposed:
+            self._exposed = set()
+        if prop_name not in self._exposed:
+            self._exposed.add(prop_name)
+            self.invalidate_plans()
+
+    def _store(self, prop_name: str, prop: BaseClabjectProp) -> None:
+        self.invalidate_plans()
+        layer = self._writable_layer()
+        layer.props[prop_name] = prop
+        layer.due_at.setdefault(prop.due_depth, set()).add(prop_name)
+        if prop.vanish_depth != math.inf:
+            layer.vanish_at.setdefault(prop.vanish_depth, set()).add(prop_name)
+        if prop.re_init_prop_constr or (prop.prop_value is None and prop.due_depth <= self.depth):
+            layer.pending.add(prop_name)
+        else:
+            layer.pending.discard(prop_name)
+        if not self._owned:
+            self._owned = set()
+        self._owned.add(prop_name)
+        self._cache[prop_name] = prop if prop.is_visible_at(self.depth) else None
+
+    def __getitem__(self, key):
+        prop = self._lookup(key)
+        if prop is None:
+            raise KeyError(key)
+        return prop
+
+    def __contains__(self, key):
+        return self._lookup(key) is not None
+
+    def __iter__(self):
+        layers = []
+        layer = self._layer
+        while layer is not None:
+            layers.append(layer)
+            layer = layer.base
+
+        # definition order, i.e. props of the top clabject first
+        prop_names = {}
+        for layer in reversed(layers):
+            prop_names.update(dict.fromkeys(layer.props))
+        return (prop_name for prop_name in prop_names if self._lookup(prop_name) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
 
     def __setitem__(self, key, value):
         if not isinstance(value, BaseClabjectProp):
@@ -115,161 +310,284 @@ class ClabjectPropDict(Dict[str, BaseClabjectProp]):
             raise ValueError(
                 "The given key {k} does not correspond to the Clabject.prop_name {n}".format(k=key, n=value))
 
-        super(ClabjectPropDict, self).__setitem__(key, value)
+        self._store(key, value)
+
+    def __delitem__(self, key):
+        prop = self.own_prop(key)
+        prop.vanish_depth = self.depth - 1
+        self._store(key, prop)
+
+    def changed_props(self):
+        """
+        Returns:
+            (prop_name, prop) pairs of the props defined, initialised or changed on the current clabject
+        """
+        return self._layer.props.items()
+
+    def vanished_props(self) -> List[str]:
+        """
+        Returns:
+            the names of the props that were visible for the domain meta, but vanished on the current clabject
+        """
+        vanished_props_set = set()
+        layer = self._layer
+        while layer is not None:
+            vanished_props_set.update(layer.vanish_at.get(self.depth - 1, ()))
+            layer = layer.base
+        return [prop_name for prop_name in vanished_props_set if prop_name not in self]
 
     def next_prop_dict(self):
         """
-         Create a deep copy of the ClabjectPropDict of the current clabject.
-         Chosen on copy rather than reference semantic to enable independent state evolution
+         Create the (empty) delta for the next clabject, that resolves all props through the current one.
+         The current dict copies its delta before changing it, which keeps the state evolution of the current
+         clabject and its instances independent. Mutable values that callers may still reference, since they read or
+         provided them, stay owned by the current dict and the instances share a snapshot of the delta with copies of
+         them, which is taken once and again only after an exposed value changed.
 
         Returns:
-            a fresh ClabjectPropDict copy
+            a fresh ClabjectPropDict
         """
-        new_clabject_prop_dict = ClabjectPropDict()
-        for prop_name, prop_value in self.items():
-            prop_value_copy = deepcopy(prop_value) if prop_value is not None else None
-            new_clabject_prop_dict[prop_name] = prop_value_copy
-        return new_clabject_prop_dict
+        if not self._exposed:
+            self._layer_shared = True
+            self._owned = ()
+            return ClabjectPropDict(depth=self.depth + 1, base=self._layer)
+
+        if self._snapshot is None or not self._snapshot.is_current():
+            self._snapshot = _ExposureSnapshot(self._layer, self._exposed)
+        # the snapshot shares the props that are not exposed
+        self._owned = set(self._exposed)
+        return ClabjectPropDict(depth=self.depth + 1, base=self._snapshot.layer)
+
+    def own_prop(self, prop_name: str, copy_value: bool = True) -> BaseClabjectProp:
+        """
+        Ensure that the prop is referenced by the current dict only, i.e. clone it into the own delta if necessary
 
-    def define_props(self, new_props: List[BaseClabjectProp]) -> None:
+        Args:
+            prop_name: the name of the prop that is about to be changed
+            copy_value: False if the caller replaces the prop value anyway
+
+        Returns:
+            the prop object that may be changed in place
+        """
+        if prop_name in self._owned:
+            return self._layer.props[prop_name]
+
+        prop = self._clone(prop_name, copy_value=copy_value)
+        self._store(prop_name, prop)
+        if self._exposed:
+            self._exposed.discard(prop_name)
+        return prop
+
+    def _clone(self, prop_name: str, copy_value: bool) -> BaseClabjectProp:
+        self.check_prop_in_keys(prop_name)
+        prop = self._lookup(prop_name).clone(copy_value=copy_value)
+        # a shared prop of a domain meta still refers to the depth of the meta
+        prop._depth = self.depth
+        return prop
+
+    def get_prop_value(self, prop_name: str) -> Any:
+        """
+        Read a prop value. Mutable values of shared props are copied first, since the caller might change them in place.
+
+        Args:
+            prop_name: the name of the prop
+
+        Returns:
+            the current prop value
+        """
+        prop = self._lookup(prop_name)
+        if prop is None:
+            raise UndefinedPropsException(undefined_props=set([prop_name]))
+        if not is_immutable_value(prop.prop_value):
+            if prop.copy_policy == "share":
+                bind_shared_value(prop.prop_value, prop)
+            else:
+                if prop_name not in self._owned:
+                    prop = self.own_prop(prop_name)
+                self._expose(prop_name)
+        return prop.prop_value
+
+    def set_prop_value(self, prop_name: str, value: Any, shared: bool = False) -> None:
+        """
+        Assign a (validated) value to a prop without further checks
+
+        Args:
+            prop_name: the name of the prop
+            value: the new prop value
+            shared: True if the value is referenced elsewhere, e.g. a default value, and thus has to be copied
+                    according to the copy policy of the prop before it is read or changed
+        """
+        if prop_name in self._owned:
+            prop = self._layer.props[prop_name]
+        else:
+            prop = self._clone(prop_name, copy_value=False)
+        if shared:
+            prop.share_value(value)
+        else:
+            prop.prop_value = value
+        self._store(prop_name, prop)
+        if shared:
+            self._owned.discard(prop_name)
+            if self._exposed:
+                self._exposed.discard(prop_name)
+        elif prop.prop_value is value and not is_immutable_value(value) and prop.copy_policy != "share":
+            # values that were converted on assignment, e.g. to managed collections, are not held by the caller
+            self._expose(prop_name)
+
+    def require_re_init(self, prop_name: str, re_init_prop_constr: ReInitPropConstr) -> None:
+        """
+        Mark a prop to be re-initialised on the next instantiation step
+        """
+        prop = self.own_prop(prop_name)
+        prop.re_init_prop_constr = re_init_prop_constr
+        self._store(prop_name, prop)
+
+    def define_props(self, new_props: List[BaseClabjectProp], fail_fast: bool = False) -> None:
         """
         Define props on the current clabject
 
         Args:
             new_props: a list of new properties
+            fail_fast: report only the first violated constraint of an initialised prop
 
         Returns:
             Nothing, manipulates the objects state, i.e. the current __ml_props__
 
         """
-        existing_prop_set = set(self.keys())
-        intersection_set = existing_prop_set.intersection(new_props)
+        intersection_set = set([prop.prop_name for prop in new_props if prop.prop_name in self])
         if len(intersection_set):
             raise PropsAlreadyDefinedException(already_defined_props=intersection_set)
         else:
             for prop in new_props:
+                prop.attach(self.depth)
                 self[prop.prop_name] = prop
+                # the managed collection of a collection prop is a copy of the given list, set or dict
+                if not is_immutable_value(prop.prop_value) and prop.copy_policy != "share" and \
+                        mutation_count(prop.prop_value) is None:
+                    self._expose(prop.prop_name)
                 if prop.prop_value is not None and prop.steps_to_instantiation == 0:
                     violated_constraints = self.check_violated_prop_constraints(prop_name=prop.prop_name,
-                                                                                potential_value=prop.prop_value)
+                                                                                potential_value=prop.prop_value,
+                                                                                fail_fast=fail_fast)
                     if violated_constraints:
                         raise ConstraintViolationException(violated_constraints=violated_constraints)
 
-    def apply_instantiation_step(self, init_props: dict, speed_adjustments: dict):
+    def invalidate_plans(self) -> None:
         """
+        Drop the cached instantiation plans, necessary whenever the props of the current clabject change
+        """
+        self._plans = None
+        self._snapshot = None
 
-        Implements deep instantiation mechanism
+    def instantiation_plan(self, speed_adjustments: dict):
+        """
+        Returns:
+            the cached InstantiationPlan for the given speed adjustments, see :py:meth:`.plan_instantiation_step`
+        """
+        key = tuple(sorted(speed_adjustments.items())) if speed_adjustments else ()
+        if self._snapshot is not None and not self._snapshot.is_current():
+            # the plans refer to a snapshot of exposed values that were changed since
+            self.invalidate_plans()
+        if self._plans is None:
+            self._plans = {}
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self.plan_instantiation_step(speed_adjustments=speed_adjustments)
+            self._plans[key] = plan
+        return plan
+
+    def plan_instantiation_step(self, speed_adjustments: dict):
+        """
+        Do the bookkeeping of the next instantiation step, i.e. apply speed adjustments and re-inits and determine
+        the props that are due, see :class:`InstantiationPlan`
 
         Args:
-            init_props: the props to be instantiated at this instantiation - step given as prop: value pairs inside a dictionary
             speed_adjustments: prop_name : integer, see :py:meth:`.adjust_instantiation_speed`
 
         Returns:
-            A ClabjectPropDict object with initialised props and decremented instantiation counters if no Exception is
-            raised
+            an InstantiationPlan
         """
-
-        # Prepare Instantiation
-        next_prop_dict = self.next_prop_dict()
+        prototype = self.next_prop_dict()
+        next_depth = prototype.depth
         if speed_adjustments:
-            next_prop_dict.adjust_instantiation_speed(speed_adjustments=speed_adjustments)
+            prototype.__adjust_speed(speed_adjustments=speed_adjustments, relative_dict=self)
 
-        next_prop_dict.__decrement_step_from_counters()
-        next_prop_dict.__decrement_step_to_counters()
-        next_prop_dict.__activate_re_init()
+        for prop_name in self._layer.pending:
+            prop = self._lookup(prop_name)
+            if prop is not None and prop.re_init_prop_constr:
+                prototype.__activate_re_init(prop_name)
 
-        provided_props_set = set(init_props.keys())
-        clabject_props_set = set(next_prop_dict.keys())
-        provided_but_not_defined_set = provided_props_set.difference(clabject_props_set)  # case 1
-        defined_but_not_provided_set = clabject_props_set.difference(provided_props_set)  # case 2
-        intersection_set = clabject_props_set.intersection(provided_props_set)  # case 3
-        all_violated_constraints = create_violated_constraint_dict()
+        # Props that might be due without being provided: newly due, accelerated, re-initialised or not initialised
+        due_props_set = set(self._layer.pending)
+        due_props_set.update(speed_adjustments)
+        layer = self._layer
+        while layer is not None:
+            due_props_set.update(layer.due_at.get(next_depth, ()))
+            layer = layer.base
 
-        # Handle Case 1 - throw exception
-        if len(provided_but_not_defined_set):
-            raise UndefinedPropsException(undefined_props=[provided_but_not_defined_set])
-
-        # Handle Case 2: Ensure that all props that are due to be initialised are provided
-        for prop_name in defined_but_not_provided_set:
-            if next_prop_dict[prop_name].steps_to_instantiation == 0 and next_prop_dict[prop_name].prop_value is None:
-                if next_prop_dict[prop_name].default_value is not None:
-                    violated_constraints = next_prop_dict.check_violated_prop_constraints(prop_name, next_prop_dict[
-                        prop_name].default_value)
-                    if not violated_constraints:
-                        next_prop_dict[prop_name].prop_value = next_prop_dict[prop_name].default_value
-                    else:
-                        all_violated_constraints.add_violations(violated_constraints)
-                else:
-                    raise UninitialisedPropException(prop_name=prop_name)
-
-        # Handle Case 3:
-        # a.) prop.steps_to_instantiation == 0 and existing value => try overwriting existing prop
-        # b.) prop.steps_to_instantiation = 0 and no value => instantiate
-        # c.) prop.steps_to_instantiation > 0 instantiation Error
-
-        for prop_name in intersection_set:
-            no_of_steps = next_prop_dict[prop_name].steps_to_instantiation
-            value = next_prop_dict[prop_name].prop_value
-            if no_of_steps == 0 and value is not None:
-                if next_prop_dict[prop_name].is_final:
-                    raise ChangeFinalPropException(prop_name=prop_name)
-                else:
-                    potential_new_value = init_props[prop_name]
-                    violated_constraints = next_prop_dict.check_violated_prop_constraints(prop_name=prop_name,
-                                                                                          potential_value=potential_new_value)
-                    if not violated_constraints:
-                        next_prop_dict[prop_name].prop_value = potential_new_value
-                    else:
-                        all_violated_constraints.add_violations(violations=violated_constraints)
-
-            elif no_of_steps == 0 and value is None:
-                potential_new_value = init_props[prop_name]
-                violated_constraints = next_prop_dict.check_violated_prop_constraints(prop_name=prop_name,
-                                                                                      potential_value=potential_new_value)
-                if not violated_constraints:
-                    next_prop_dict[prop_name].prop_value = potential_new_value
-                else:
-                    all_violated_constraints.add_violations(violations=violated_constraints)
+        return InstantiationPlan(prototype=prototype, due_props=due_props_set)
 
-            else:
-
-                raise UnduePropInstantiationException(prop_name=prop_name,
-                                                      later_steps_number=self[prop_name].steps_to_instantiation - 1)
+    def apply_instantiation_step(self, init_props: dict, speed_adjustments: dict, fail_fast: bool = False):
+        """
 
-        if all_violated_constraints:
-            raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+        Implements deep instantiation mechanism
 
-        return next_prop_dict
+        Args:
+            init_props: the props to be instantiated at this instantiation - step given as prop: value pairs inside a dictionary
+            speed_adjustments: prop_name : integer, see :py:meth:`.adjust_instantiation_speed`
+            fail_fast: raise on the first violated constraint instead of reporting all violated constraints
 
-    def __activate_re_init(self):
-        for prop in self.values():
-            if prop.re_init_prop_constr:
-                for constr in prop.constraints:
-                    if constr.name in [constr.name for constr in prop.re_init_prop_constr.del_constr]:
-                        prop.constraints.remove(constr)
-                prop.constraints = prop.constraints + prop.re_init_prop_constr.add_constr
-                prop.prop_value = None
-                prop.re_init_prop_constr = None
-
-    def __decrement_step_to_counters(self):
-        for prop in self.values():
-            if prop.steps_to_instantiation > 0:
-                prop.steps_to_instantiation += -1
-
-    def __decrement_step_from_counters(self):
-        to_be_dropped = []
-        for prop in self.values():
-            if prop.steps_to_instantiation == 0:
-                if prop.steps_from_instantiation == 0:
-                    to_be_dropped.append(prop.prop_name)
-                else:
-                    prop.steps_from_instantiation += -1
+        Returns:
+            A ClabjectPropDict object with initialised props if no Exception is raised
+        """
+        plan = self.instantiation_plan(speed_adjustments=speed_adjustments)
+        plan.check_row(init_props, fail_fast=fail_fast)
+        return plan.bind(init_props)
 
-        for drop_prop in to_be_dropped:
-            self.pop(drop_prop)
+    def _fork(self):
+        """
+        Returns:
+            a dict with the same state as the current one, whose first change copies the shared delta
+        """
+        self._layer_shared = True
+        self._owned = ()
+        fork = ClabjectPropDict(depth=self.depth)
+        fork._layer = self._layer
+        fork._layer_shared = True
+        fork._cache = dict(self._cache)
+        return fork
+
+    def __activate_re_init(self, prop_name: str):
+        prop = self.own_prop(prop_name, copy_value=False)
+        del_names = [constr.name for constr in prop.re_init_prop_constr.del_constr]
+        prop.constraints = [constr for constr in prop.constraints if constr.name not in del_names] + \
+            prop.re_init_prop_constr.add_constr
+        prop.prop_value = None
+        prop.re_init_prop_constr = None
+        self._store(prop_name, prop)
+
+    def __adjust_speed(self, speed_adjustments: Dict[str, int], relative_dict):
+        """
+        Args:
+            speed_adjustments: see :py:meth:`.adjust_instantiation_speed`
+            relative_dict: the dict the adjustments refer to, i.e. either the current dict or the dict of the domain meta
+        """
+        relative_depth = relative_dict.depth
+        for prop_name, speed_adjustment in speed_adjustments.items():
+            relative_dict.check_prop_in_keys(prop_name)
+            if relative_dict is self:
+                prop = self.own_prop(prop_name)
+            else:
+                prop = relative_dict._lookup(prop_name).clone()
+                prop._depth = self.depth
+            steps_to_instantiation = max(0, prop.due_depth - relative_depth)
+            steps_from_instantiation = prop.vanish_depth - max(prop.due_depth, relative_depth)
+            prop.due_depth = relative_depth + max(1, steps_to_instantiation + speed_adjustment)
+            prop.vanish_depth = prop.due_depth + steps_from_instantiation
+            self._store(prop_name, prop)
 
     def check_prop_in_keys(self, prop_name: str) -> None:
-        if prop_name not in self.keys():
+        if prop_name not in self:
             raise UndefinedPropsException(undefined_props=set([prop_name]))
 
     def adjust_instantiation_speed(self, speed_adjustments: Dict[str, int]):
@@ -286,10 +604,7 @@ class ClabjectPropDict(Dict[str, BaseClabjectProp]):
         Returns:
             Updates the State of the ClabjectPropDict
         """
-        for prop_name, speed_adjustment in speed_adjustments.items():
-            self.check_prop_in_keys(prop_name)
-            adjusted_step_to_number = self[prop_name].steps_to_instantiation + speed_adjustment
-            self[prop_name].steps_to_instantiation = max(1, adjusted_step_to_number)
+        self.__adjust_speed(speed_adjustments=speed_adjustments, relative_dict=self)
 
     def add_prop_constraint(self, prop_name: str, constraint: PropValueConstraint) -> None:
         """
@@ -305,9 +620,11 @@ class ClabjectPropDict(Dict[str, BaseClabjectProp]):
         assert isinstance(constraint, PropValueConstraint)
 
         self.check_prop_in_keys(prop_name)
-        self[prop_name].constraints.append(constraint)
+        self.own_prop(prop_name).add_constraint(constraint)
+        self.invalidate_plans()
 
-    def check_violated_prop_constraints(self, prop_name: str = None, potential_value=None, init_only=True):
+    def check_violated_prop_constraints(self, prop_name: str = None, potential_value=None, init_only=True,
+                                        fail_fast=False):
         """
         Check the constraints for a specific prop or for all props if no prop_name is provided
 
@@ -315,10 +632,12 @@ class ClabjectPropDict(Dict[str, BaseClabjectProp]):
             prop_name: The property to check
             potential_value: the provided value due to be instantiated, if not provided the current prop_value is checked
             init_only: Evaluate only the constraints that have eval_on_init flag set
+            fail_fast: Stop at the first violated constraint, whose constraints are evaluated in an adaptive order.
+                       Otherwise all violated constraints are reported in the order of the constraint lists
 
         Returns:
-            ConstrViolationDict
-
+            ConstrViolationDict of the ConstraintResults of the violated constraints, the constraints themselves are
+            not modified, so props can be checked concurrently
         """
         all_violated_constraints = create_violated_constraint_dict()
         props_to_check = []
@@ -332,19 +651,222 @@ class ClabjectPropDict(Dict[str, BaseClabjectProp]):
             if potential_value is None:
                 potential_value = self[prop_name].prop_value
 
-            constraints = self[prop_name].constraints
-            if init_only:
-                constraints = [c for c in constraints if hasattr(c, "eval_on_init") and c.eval_on_init]
-
-            for constraint in constraints:
-                if not constraint(potential_value):
-                    all_violated_constraints[prop_name].append(constraint)
+            violations = self[prop_name].validator(init_only, fail_fast)(potential_value)
+            if violations:
+                all_violated_constraints[prop_name].extend(violations)
+                if fail_fast:
+                    break
 
             potential_value = None
 
         return all_violated_constraints
 
 
+class InstantiationPlan:
+    """
+    The bookkeeping part of an instantiation step, i.e. the props of the next clabject after speed adjustments and
+    re-inits, the props that have to be provided and the defaults that are applied otherwise. The plan depends only
+    on the instantiated clabject and the speed adjustments, so it can be applied to many rows of init props. It is
+    cached by the prop dict of the instantiated clabject until its props change.
+
+    The props that are given for a row fall into the following cases:
+        1. prop is not defined => UndefinedPropsException
+        2. prop is due and not provided => default value or UninitialisedPropException
+        3. a.) prop is due and has a value => overwrite the value unless the prop is final
+           b.) prop is due and has no value => instantiate
+           c.) prop is not due yet => UnduePropInstantiationException
+    """
+    __slots__ = ("prototype", "required", "defaults", "default_violations", "eager_copies", "_columns")
+
+    _UNDEFINED = 0
+    _UNDUE = 1
+    _FINAL = 2
+    _SETTABLE = 3
+
+    def __init__(self, prototype: ClabjectPropDict, due_props: set):
+        """
+        Args:
+            prototype: the prop dict of the next clabject before any prop is initialised
+            due_props: the names of the props that might be due without being provided
+        """
+        self.prototype = prototype
+        self.required = []
+        self.defaults = []
+        self.default_violations = {}
+        # <prop_name> => (case, later steps or init validator, fail-fast init validator)
+        self._columns = {}
+
+        for prop_name in due_props:
+            prop = prototype._lookup(prop_name)
+            if prop is not None and prop.due_depth <= prototype.depth and prop.prop_value is None:
+                if prop.default_value is not None:
+                    self.defaults.append((prop_name, prop.default_value, prop.copy_policy))
+                    violated_constraints = prototype.check_violated_prop_constraints(prop_name, prop.default_value)
+                    if violated_constraints:
+                        self.default_violations[prop_name] = violated_constraints
+                else:
+                    self.required.append(prop_name)
+
+        # props whose values are copied for each new clabject, i.e. the ones with the deepcopy policy
+        eager_copies = {}
+        layer = prototype._layer
+        while layer is not None:
+            eager_copies.update(dict.fromkeys(prop_name for prop_name, prop in layer.props.items()
+                                              if prop.copy_policy == "deepcopy"))
+            layer = layer.base
+        self.eager_copies = list(eager_copies)
+
+    def _column(self, prop_name: str) -> tuple:
+        try:
+            return self._columns[prop_name]
+        except KeyError:
+            pass
+
+        prop = self.prototype._lookup(prop_name)
+        if prop is None:
+            column = (self._UNDEFINED, None, None)
+        elif prop.due_depth > self.prototype.depth:
+            column = (self._UNDUE, prop.due_depth - self.prototype.depth, None)
+        elif prop.prop_value is not None and prop.is_final:
+            column = (self._FINAL, None, None)
+        else:
+            column = (self._SETTABLE, prop.validator(init_only=True), prop.validator(init_only=True, fail_fast=True))
+        self._columns[prop_name] = column
+        return column
+
+    def check_structure(self, init_props: dict) -> None:
+        """
+        Check the cases 1, 2 and 3 of a row without evaluating constraints, raises the first exception
+        """
+        provided_but_not_defined_set = set([p for p in init_props if self._column(p)[0] == self._UNDEFINED])
+        if len(provided_but_not_defined_set):
+            raise UndefinedPropsException(undefined_props=[provided_but_not_defined_set])
+
+        for prop_name in self.required:
+            if prop_name not in init_props:
+                raise UninitialisedPropException(prop_name=prop_name)
+
+        for prop_name in init_props:
+            case, detail, _ = self._column(prop_name)
+            if case == self._FINAL:
+                raise ChangeFinalPropException(prop_name=prop_name)
+            elif case == self._UNDUE:
+                raise UnduePropInstantiationException(prop_name=prop_name, later_steps_number=detail)
+
+    def _default_violation(self, init_props: dict):
+        # the first violated constraint of a default value that is not overridden by the init props
+        for prop_name, violated_constraints in self.default_violations.items():
+            if prop_name not in init_props:
+                return prop_name, violated_constraints[prop_name][0]
+        return None
+
+    def check_row(self, init_props: dict, fail_fast: bool = False) -> None:
+        """
+        Check a single row of init props, raises the first structural exception or a ConstraintViolationException.
+        With fail_fast the exception reports only the first violated constraint.
+        """
+        self.check_structure(init_props)
+        all_violated_constraints = create_violated_constraint_dict()
+        if fail_fast:
+            default_violation = self._default_violation(init_props)
+            if default_violation:
+                all_violated_constraints[default_violation[0]].append(default_violation[1])
+                raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+            for prop_name, potential_new_value in init_props.items():
+                violations = self._column(prop_name)[2](potential_new_value)
+                if violations:
+                    all_violated_constraints[prop_name].extend(violations)
+                    raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+            return
+
+        for prop_name, violated_constraints in self.default_violations.items():
+            if prop_name not in init_props:
+                all_violated_constraints.add_violations(violated_constraints)
+
+        for prop_name, potential_new_value in init_props.items():
+            violations = self._column(prop_name)[1](potential_new_value)
+            if violations:
+                all_violated_constraints[prop_name].extend(violations)
+
+        if all_violated_constraints:
+            raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+
+    def check_rows(self, rows: List[dict], fail_fast: bool = False) -> Dict[int, Exception]:
+        """
+        Check many rows of init props. The constraints are evaluated column-wise, i.e. the compiled validator of a
+        prop is applied to all values of the prop at once.
+
+        Args:
+            rows: a list of init_props dicts
+            fail_fast: report only the first violated constraint per row, the values of rejected rows are skipped
+
+        Returns:
+            a dict with the structure <row index> => <exception that rejects the row>, ordered by row index
+        """
+        rejected_rows = {}
+        valid_rows = []
+        for row_index, init_props in enumerate(rows):
+            try:
+                self.check_structure(init_props)
+            except (UndefinedPropsException, UninitialisedPropException, ChangeFinalPropException,
+                    UnduePropInstantiationException) as ex:
+                rejected_rows[row_index] = ex
+            else:
+                valid_rows.append(row_index)
+
+        row_violations = {}
+        for row_index in valid_rows:
+            if fail_fast:
+                default_violation = self._default_violation(rows[row_index])
+                if default_violation:
+                    row_violations[row_index] = create_violated_constraint_dict()
+                    row_violations[row_index][default_violation[0]].append(default_violation[1])
+                continue
+            for prop_name, violated_constraints in self.default_violations.items():
+                if prop_name not in rows[row_index]:
+                    row_violations.setdefault(row_index, create_violated_constraint_dict())[prop_name].extend(
+                        violated_constraints[prop_name])
+
+        column_names = dict.fromkeys(prop_name for row_index in valid_rows for prop_name in rows[row_index])
+        for prop_name in column_names:
+            column = [(row_index, rows[row_index][prop_name]) for row_index in valid_rows
+                      if prop_name in rows[row_index] and not (fail_fast and row_index in row_violations)]
+            validate = self._column(prop_name)[2 if fail_fast else 1]
+            for row_index, potential_new_value in column:
+                violations = validate(potential_new_value)
+                if violations:
+                    row_violations.setdefault(row_index, create_violated_constraint_dict())[prop_name].extend(
+                        violations)
+
+        for row_index, violated_constraints in row_violations.items():
+            rejected_rows[row_index] = ConstraintViolationException(violated_constraints=violated_constraints)
+        return dict(sorted(rejected_rows.items()))
+
+    def bind(self, init_props: dict) -> ClabjectPropDict:
+        """
+        Create the prop dict of a new clabject from a (checked) row of init props
+
+        Returns:
+            a new ClabjectPropDict
+        """
+        next_prop_dict = self.prototype._fork()
+        for prop_name, default_value, copy_policy in self.defaults:
+            if prop_name not in init_props:
+                if copy_policy == "deepcopy":
+                    next_prop_dict.set_prop_value(prop_name, copy_prop_value(default_value, copy_policy))
+                else:
+                    next_prop_dict.set_prop_value(prop_name, default_value, shared=True)
+        for prop_name, potential_new_value in init_props.items():
+            next_prop_dict.set_prop_value(prop_name, potential_new_value)
+        for prop_name in self.eager_copies:
+            if prop_name not in next_prop_dict._owned:
+                prop = next_prop_dict._lookup(prop_name)
+                if prop is not None and not is_immutable_value(prop.prop_value):
+                    next_prop_dict.own_prop(prop_name)
+        note_instantiation()
+        return next_prop_dict
+
+
 def bind(instance, func, as_name=None):
     """
     Bind a function to an object, i.e. make it a method of the object
@@ -364,6 +886,162 @@ def bind(instance, func, as_name=None):
     return bound_method
 
 
+class _MethodPropBinding:
+    """
+    Class level descriptor that binds the function of a MethodProp to the clabject it is accessed from. Since it is
+    not tied to a specific clabject, it remains valid when it is handed down to instances along with the class dict.
+    """
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, obj, owner=None):
+        return MethodType(self.func, owner if obj is None else obj)
+
+
+def bind_method_prop(clabject, prop_name: str, func) -> None:
+    """
+    Make the function of a MethodProp a method of the given clabject and of all its later instances
+
+    Args:
+        clabject: the clabject that holds the MethodProp
+        prop_name: the name of the MethodProp
+        func: The function to be bound, should accept the clabject as first argument
+    """
+    # use xxxbind_ convention to avoid that __setattr__ tries to write value in __ml_props__
+    bind_key = ("_").join(["xxxbind", prop_name])
+    setattr(clabject, bind_key, _MethodPropBinding(func))
+
+
+# framework attributes of clabjects, see MetaClabject.get_framework_attrs
+_FRAMEWORK_ATTRS = ("__ml_props__", "__domain_meta__", "__name__", "__clabject_id__", "__ancestor_ids__",
+                    "__descendant_index__", "__prop_indexes__", "__default_names__",
+                    "__slots__", "constraints", "re_init_prop_constr",
+                    "declared_instance_flag", "speed_adjustments", "viz_props_collapse", "retain_instances")
+_FRAMEWORK_ATTR_SET = frozenset(_FRAMEWORK_ATTRS)
+
+# the integer ids of clabjects, assigned on creation
+_clabject_ids = ClabjectIdTable()
+
+# the clabjects by name, per root hierarchy, see lookup
+name_registry = NameRegistry()
+
+
+def _ancestor_ids(clabject_id: int, domain_meta) -> tuple:
+    """
+    Returns:
+        the ids of a clabject and of its n-th order domain metas at index n, up to the direct instance of Clabject
+    """
+    if domain_meta is None:
+        # Clabject and its implementation detail parent
+        return ()
+    return (clabject_id,) + domain_meta.__ancestor_ids__
+
+
+class _PropValue:
+    """
+    Class level data descriptor that publishes an immutable prop value in the class dict of a clabject, so that
+    reading the prop is a plain attribute lookup instead of a detour via MetaClabject.__getattr__
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __get__(self, obj, owner=None):
+        return self.value
+
+    def __set__(self, obj, value):
+        raise AttributeError("Props are set on the clabject")
+
+
+class _PropDelegate:
+    """
+    Class level data descriptor for props with mutable values, which delegates reads to the prop dict of the
+    clabject it is accessed from. In contrast to a _PropValue it remains valid when it is handed down to instances.
+    """
+    __slots__ = ("prop_name",)
+
+    def __init__(self, prop_name: str):
+        self.prop_name = prop_name
+
+    def __get__(self, obj, owner=None):
+        return owner.__ml_props__.get_prop_value(self.prop_name)
+
+    def __set__(self, obj, value):
+        raise AttributeError("Props are set on the clabject")
+
+
+def _publish_prop(class_dict, prop_name: str, ml_props, setter, deleter) -> None:
+    """
+    Keep the class attribute of a prop in sync with its value: immutable values are published as _PropValue,
+    mutable ones as _PropDelegate. MethodProps are bound separately and attributes that are not published props,
+    e.g. framework attributes, are left untouched.
+
+    Args:
+        class_dict: the class dict or attribute dict of a clabject
+        prop_name: the name of the prop
+        ml_props: the ClabjectPropDict of the clabject
+        setter: called with (prop_name, attribute) to publish the attribute
+        deleter: called with prop_name to remove a published attribute
+    """
+    published = class_dict.get(prop_name)
+    if published is not None and not isinstance(published, (_PropValue, _PropDelegate)):
+        return
+    if prop_name in _FRAMEWORK_ATTR_SET or prop_name.startswith("__"):
+        return
+
+    prop = ml_props._lookup(prop_name)
+    if prop is None or isinstance(prop, MethodProp):
+        if published is not None:
+            deleter(prop_name)
+    elif is_immutable_value(prop.prop_value):
+        setter(prop_name, _PropValue(prop.prop_value))
+    elif not isinstance(published, _PropDelegate):
+        setter(prop_name, _PropDelegate(prop_name))
+
+
+def _set_prop_attr(clabject, key: str, value: Any) -> None:
+    """
+    Update the value of a prop on attribute assignment, i.e. check that the prop is due, not final and that the
+    value satisfies all prop constraints
+
+    Args:
+        clabject: a clabject
+        key: the name of the prop
+        value: the new prop value
+    """
+    if key not in clabject.__ml_props__:
+        raise UndefinedPropsException(undefined_props=set([key]))
+    else:
+        step_to_inst = clabject.__ml_props__[key].steps_to_instantiation
+        if step_to_inst > 0:
+            raise UnduePropInstantiationException(prop_name=key, later_steps_number=step_to_inst)
+        elif clabject.__ml_props__[key].is_final:
+            raise ChangeFinalPropException(prop_name=key)
+        else:
+            violated_constraints = clabject.__ml_props__.check_violated_prop_constraints(prop_name=key,
+                                                                                          potential_value=value,
+                                                                                          fail_fast=is_fail_fast())
+            if not violated_constraints:
+                clabject.__ml_props__.set_prop_value(key, value)
+                for meta in _domain_metas(clabject):
+                    index = meta.__prop_indexes__.get(key)
+                    if index is not None:
+                        index.add(clabject)
+            else:
+                all_violated_constraints = create_violated_constraint_dict()
+                all_violated_constraints.add_violations(violations=violated_constraints)
+                raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+
+
+def _drop_speed_adjustment(speed_adjustments: dict, name: str, speed_adjustment: dict) -> None:
+    # finalizer of weakly registered instances - a later instance of the same name may own the entry meanwhile
+    if speed_adjustments.get(name) is speed_adjustment:
+        del speed_adjustments[name]
+
+
 class MetaClabject(type):
     """
     The python metaclass that defines the behaviour of clabjects
@@ -374,9 +1052,7 @@ class MetaClabject(type):
         Returns:
             all framework attributes of clabjects, that are not as domain related ClabjectProps managed by the internal ClabjectDict
         """
-        return ["__ml_props__", "__domain_meta__", "__name__",
-                "__slots__", "constraints", "re_init_prop_constr",
-                "declared_instance_flag", "speed_adjustments", "viz_props_collapse"]
+        return list(_FRAMEWORK_ATTRS)
 
     def instance_of(cls):
         """
@@ -398,29 +1074,29 @@ class MetaClabject(type):
         return str(cls)
 
     def __hash__(cls):
-        return super(MetaClabject, cls).__hash__()
+        return hash(cls.__clabject_id__)
 
     def __eq__(cls, other):
-        # Assumption: Each Clabject has a unique name, need for refinement here in later dev stages
-        if hasattr(cls, "__name__") and hasattr(other, "__name__"):
-            return cls.__name__ == other.__name__
-        else:
-            return False
+        # each clabject has its own __clabject_id__, clabjects of the same name are different clabjects
+        try:
+            return cls.__clabject_id__ == other.__clabject_id__
+        except AttributeError:
+            return NotImplemented
 
     def __getattr__(cls, item):
+        # Only reached if the item is neither a class attribute nor a published prop, see _publish_prop
         # Avoid Recursion
-        framework_props = cls.get_framework_attrs()
-        if item not in framework_props:
+        if item not in _FRAMEWORK_ATTR_SET:
+            if item.startswith("__"):
+                raise AttributeError(item)
             if item not in cls.__ml_props__:
                 raise UndefinedPropsException(undefined_props=set([item]))
             else:
-                return cls.__ml_props__[item].prop_value
+                return cls.__ml_props__.get_prop_value(item)
 
     def __setattr__(cls, key, value):
         # Avoid Recursion
-        all_violated_constraints = create_violated_constraint_dict()
-        framework_props = cls.get_framework_attrs()
-        if key in framework_props:
+        if key in _FRAMEWORK_ATTR_SET:
             super(MetaClabject, cls).__setattr__(key, value)
 
         # xxxbind_ as convention for bound methods (should bot be set to ml_props_dict)
@@ -429,22 +1105,9 @@ class MetaClabject(type):
             super(MetaClabject, cls).__setattr__(key, value)
 
         else:
-            if key not in cls.__ml_props__:
-                raise UndefinedPropsException(undefined_props=set([key]))
-            else:
-                step_to_inst = cls.__ml_props__[key].steps_to_instantiation
-                if step_to_inst > 0:
-                    raise UnduePropInstantiationException(prop_name=key, later_steps_number=step_to_inst)
-                elif cls.__ml_props__[key].is_final:
-                    raise ChangeFinalPropException(prop_name=key)
-                else:
-                    violated_constraints = cls.__ml_props__.check_violated_prop_constraints(prop_name=key,
-                                                                                             potential_value=value)
-                    if not violated_constraints:
-                        cls.__ml_props__[key].prop_value = value
-                    else:
-                        all_violated_constraints.add_violations(violations=violated_constraints)
-                        raise ConstraintViolationException(violated_constraints=all_violated_constraints)
+            _set_prop_attr(cls, key, value)
+            _publish_prop(cls.__dict__, key, cls.__ml_props__, setter=super(MetaClabject, cls).__setattr__,
+                          deleter=super(MetaClabject, cls).__delattr__)
 
     def __new__(cls, name, bases, attr_dict):
         for b in bases:
@@ -453,12 +1116,21 @@ class MetaClabject(type):
                 raise TypeError(
                     "Clabject {c} is not allowed as a BaseClass that can be inherited from.".format(c=b.__name__))
         print("Create new Class constructed by MetaClabject : " + name)
-        attr_dict["instances"] = []
+        attr_dict["instances"] = InstanceRegistry()
+        # order (>= 2) => weak registry of the instances of that order, the instances are the 1st order
+        attr_dict["__descendant_index__"] = {}
+        # prop_name => PropIndex over the values of the descendants, see create_index
+        attr_dict["__prop_indexes__"] = {}
+        # numbers the default names of the instances, see instantiate_many
+        attr_dict["__default_names__"] = count()
+        clabject_id = _clabject_ids.next_id()
+        attr_dict["__clabject_id__"] = clabject_id
+        attr_dict["__ancestor_ids__"] = _ancestor_ids(clabject_id, attr_dict.get("__domain_meta__"))
         return super(MetaClabject, cls).__new__(cls, name, bases, attr_dict)
 
     def _instantiate(cls, name=None, parents: list = None, init_props: dict = dict(),
-                     declare_as_instance=False, speed_adjustment: dict = {}):
-
+                     declare_as_instance=False, speed_adjustment: dict = {}, ml_props: ClabjectPropDict = None,
+                     validation: str = None):
         new_bases = list(cls.__bases__)
         if parents:
             for c in parents:
@@ -471,40 +1143,97 @@ class MetaClabject(type):
         attr_dict["speed_adjustments"] = {}
         attr_dict["declared_instance_flag"] = declare_as_instance
         attr_dict["viz_props_collapse"] = False
+        # retaining the instances is inherited, a hierarchy opts in at its root
+        attr_dict["retain_instances"] = cls.retain_instances
 
         # Handle Next Props
         if cls.__name__ == 'Clabject':
             # Begin of instantiation hierarchy
             attr_dict["__ml_props__"] = ClabjectPropDict()
             next_meta_cls = MetaClabject
+        elif ml_props is not None:
+            # props of a row that was checked by instantiate_many
+            attr_dict["__ml_props__"] = ml_props
         else:
             assert hasattr(cls, "__ml_props__")
 
             attr_dict["__ml_props__"] = cls.__ml_props__.apply_instantiation_step(
-                init_props=init_props, speed_adjustments=speed_adjustment)
+                init_props=init_props, speed_adjustments=speed_adjustment, fail_fast=is_fail_fast(validation))
+
+        # a name is taken by a valid clabject only
+        namespace = cls._namespace_of_instance()
+        name_registry.check_name(name, namespace)
+
+        # Published props - the attributes handed down with the class dict are valid except for changed and
+        # vanished props
+        ml_props = attr_dict["__ml_props__"]
+        if isinstance(ml_props, ClabjectPropDict):
+            for prop_name in ml_props.vanished_props():
+                _publish_prop(attr_dict, prop_name, ml_props, setter=attr_dict.__setitem__, deleter=attr_dict.__delitem__)
+            for prop_name, _ in ml_props.changed_props():
+                _publish_prop(attr_dict, prop_name, ml_props, setter=attr_dict.__setitem__, deleter=attr_dict.__delitem__)
 
         # next Clabject
         new_cls = MetaClabject(name, tuple(new_bases), attr_dict)
 
-        # Bind Methods - use xxxbind_ convention to avoid that __setattr__ tries to write value in __ml_props__
-        for prop_name, prop in attr_dict["__ml_props__"].items():
+        # Bind Methods - bindings of unchanged MethodProps are handed down with the class dict
+        for prop_name, prop in attr_dict["__ml_props__"].changed_props():
             if isinstance(prop, MethodProp) and prop.prop_value is not None:
                 if prop_name in init_props:
                     setattr(prop.prop_value, "__impl_origin__", name)
-                bind_key = ("_").join(["xxxbind", prop_name])
-                bind(new_cls, prop.prop_value, bind_key)
+                bind_method_prop(new_cls, prop_name, prop.prop_value)
 
         # Origin "Clabject" need not know about all of its usages
         if not cls.__name__ == "Clabject":
-            cls.instances.append(new_cls)
+            cls._register_instance(new_cls, speed_adjustment)
+        elif len(speed_adjustment) > 0:
+            cls.speed_adjustments.update({name: speed_adjustment})
+        name_registry.register(new_cls, namespace)
+        return new_cls
 
+    def _namespace_of_instance(cls):
+        # the name registry namespace of a new instance is the root of its hierarchy, None for a new root
+        return None if cls is Clabject else _hierarchy_root(cls)
+
+    def _register_instance(cls, instance, speed_adjustment: dict) -> None:
+        retain = cls.retain_instances
+        cls.instances.append(instance, retain=retain)
+        for index in cls.__prop_indexes__.values():
+            index.add(instance)
+        order = 2
+        for meta in _domain_metas(cls):
+            bucket = meta.__descendant_index__.get(order)
+            if bucket is None:
+                bucket = meta.__descendant_index__[order] = InstanceRegistry()
+            bucket.append(instance, retain=False)
+            for index in meta.__prop_indexes__.values():
+                index.add(instance)
+            order += 1
         if len(speed_adjustment) > 0:
-            update_dic = {name: speed_adjustment}
-            cls.speed_adjustments.update(update_dic)
-        return new_cls
+            cls.speed_adjustments[instance.__name__] = speed_adjustment
+            if not retain:
+                finalize(instance, _drop_speed_adjustment, cls.speed_adjustments, instance.__name__, speed_adjustment)
+
+    def _instantiate_lightweight(cls, name=None, init_props: dict = dict(), speed_adjustment: dict = {},
+                                 ml_props: ClabjectPropDict = None, validation: str = None):
+        if ml_props is None:
+            ml_props = cls.__ml_props__.apply_instantiation_step(init_props=init_props,
+                                                                 speed_adjustments=speed_adjustment,
+                                                                 fail_fast=is_fail_fast(validation))
+        namespace = cls._namespace_of_instance()
+        name_registry.check_name(name, namespace)
+        new_instance = ClabjectInstance(name=name, domain_meta=cls, ml_props=ml_props)
+
+        for prop_name, prop in ml_props.changed_props():
+            if isinstance(prop, MethodProp) and prop.prop_value is not None and prop_name in init_props:
+                setattr(prop.prop_value, "__impl_origin__", name)
+
+        cls._register_instance(new_instance, speed_adjustment)
+        name_registry.register(new_instance, namespace)
+        return new_instance
 
     def __call__(cls, name=None, parents: list = [], init_props: dict = dict(),
-                 speed_adjustments=dict(), declare_as_instance=False):
+                 speed_adjustments=dict(), declare_as_instance=False, lightweight=False, validation=None):
         """
         Call a clabject to trigger it's further instantiation
 
@@ -515,6 +1244,10 @@ class MetaClabject(type):
             speed_adjustments: a dict of prop_name: int paris that accelerate/ slow down the instantiation speed, see
             also :py:meth:`ClabjectPropDict.adjust_instantiation_speed`
             declare_as_instance: Declare the next clabject as an instance which prevents further instantiation
+            lightweight: Materialise the next clabject as a compact :class:`ClabjectInstance` instead of a class,
+                         implies declare_as_instance
+            validation: 'collect_all' reports all violated constraints, 'fail_fast' raises on the first violation,
+                        by default the mode of the current :func:`constraints.validation_mode` context applies
 
         Returns: a new clabject instance of the current clabject
 
@@ -523,22 +1256,189 @@ class MetaClabject(type):
         if cls.declared_instance_flag:
             raise ClabjectDeclaredAsInstanceException(obj=cls)
 
+        if lightweight:
+            if parents:
+                raise LightweightInstanceParentsException(name=name)
+            return cls._instantiate_lightweight(name=name,
+                                                init_props=init_props,
+                                                speed_adjustment=speed_adjustments,
+                                                validation=validation)
+
         return cls._instantiate(name=name,
                                 parents=parents,
                                 init_props=init_props,
                                 speed_adjustment=speed_adjustments,
-                                declare_as_instance=declare_as_instance)
+                                declare_as_instance=declare_as_instance,
+                                validation=validation)
+
+    def instantiate_many(cls, rows: List[dict], names: List[str] = None, speed_adjustments=dict(),
+                         declare_as_instance=False, lightweight=False, collect_all=False, validation=None):
+        """
+        Instantiate the current clabject once per row of init props. The bookkeeping of the instantiation step is
+        done once for all rows, see :class:`InstantiationPlan`, and the rows are validated column-wise before any
+        clabject is created.
+
+        Args:
+            rows: a list of init_props dicts, one per new clabject
+            names: the names of the new clabjects, by default the name of the current clabject and a number that
+                   counts the default names of its instances
+            speed_adjustments: speed adjustments that apply to all new clabjects, see :py:meth:`__call__`
+            declare_as_instance: Declare the new clabjects as instances which prevents further instantiation
+            lightweight: Materialise the new clabjects as :class:`ClabjectInstance` objects, implies declare_as_instance
+            collect_all: If False the exception of the first invalid row is raised and no clabject is created.
+                         If True the clabjects of all valid rows are created and invalid rows are reported.
+            validation: the validation mode of the rows, with 'fail_fast' an invalid row reports only its first
+                        violated constraint, see :py:meth:`__call__`
 
-    def define_props(cls, new_props=List[BaseClabjectProp]):
+        Returns:
+            a (new_clabjects, violation_report) tuple. new_clabjects holds the new clabject of each row in order and
+            None for invalid rows, violation_report is a dict with the structure <row index> => <exception>
+        """
+        if cls.declared_instance_flag:
+            raise ClabjectDeclaredAsInstanceException(obj=cls)
+        if names is None:
+            names = ["_".join([cls.__name__, str(next(cls.__default_names__))]) for _ in rows]
+        elif len(names) != len(rows):
+            raise ValueError("instantiate_many got {N} names for {R} rows".format(N=len(names), R=len(rows)))
+        if name_registry.on_duplicate == "raise" and cls is not Clabject:
+            # refuse duplicate names before any clabject is created, new roots open namespaces of their own
+            namespace = cls._namespace_of_instance()
+            seen = set()
+            for name in names:
+                name_registry.check_name(name, namespace)
+                if name in seen:
+                    raise DuplicateClabjectNameException(name=name, namespace=namespace.__name__)
+                seen.add(name)
+
+        plan = cls.__ml_props__.instantiation_plan(speed_adjustments=speed_adjustments)
+        violation_report = plan.check_rows(rows, fail_fast=is_fail_fast(validation))
+        if violation_report and not collect_all:
+            raise next(iter(violation_report.values()))
+
+        new_clabjects = []
+        for row_index, (name, init_props) in enumerate(zip(names, rows)):
+            if row_index in violation_report:
+                new_clabjects.append(None)
+            elif lightweight:
+                new_clabjects.append(cls._instantiate_lightweight(name=name,
+                                                                  init_props=init_props,
+                                                                  speed_adjustment=speed_adjustments,
+                                                                  ml_props=plan.bind(init_props)))
+            else:
+                new_clabjects.append(cls._instantiate(name=name,
+                                                      parents=[],
+                                                      init_props=init_props,
+                                                      speed_adjustment=speed_adjustments,
+                                                      declare_as_instance=declare_as_instance,
+                                                      ml_props=plan.bind(init_props)))
+        return new_clabjects, violation_report
+
+    def descendants(cls, order: int = None) -> list:
+        """
+        Look up the (transitive) instances of the clabject in its descendant index
+
+        Args:
+            order: the number of instantiation steps between the clabject and the requested descendants,
+                   if None the descendants of all orders
+
+        Returns:
+            the living descendants, ordered by instantiation order and creation
+        """
+        if order is None:
+            orders = range(1, max(cls.__descendant_index__, default=1) + 1)
+            return [descendant for order in orders for descendant in cls._descendant_bucket(order)]
+        return list(cls._descendant_bucket(order))
+
+    def count_descendants(cls, order: int = None) -> int:
         """
-        Delegates to :py:meth:`ClabjectPropDict.define_props`
+        Args:
+            order: see :py:meth:`descendants`
+
+        Returns:
+            the number of living descendants, without visiting them
+        """
+        if order is None:
+            return len(cls.instances) + sum(len(bucket) for bucket in cls.__descendant_index__.values())
+        return len(cls._descendant_bucket(order))
+
+    def _descendant_bucket(cls, order: int):
+        if order == 1:
+            return cls.instances
+        return cls.__descendant_index__.get(order, ())
+
+    def create_index(cls, prop_name: str, kind: str = "hash") -> None:
+        """
+        Maintain a secondary index on the values of a prop of all descendants, which is used by :py:meth:`query`.
+        Existing descendants are indexed at once, later ones on instantiation and prop values on assignment.
+
+        Args:
+            prop_name: the name of the indexed prop
+            kind: 'hash' for equality and membership lookups, 'sorted' additionally for range lookups
+        """
+        if kind not in INDEX_KINDS:
+            raise InvalidIndexKindException(kind=kind, prop_name=prop_name)
+        index = INDEX_KINDS[kind](prop_name)
+        for descendant in cls.descendants():
+            index.add(descendant)
+        cls.__prop_indexes__[prop_name] = index
+
+    def drop_index(cls, prop_name: str) -> None:
+        cls.__prop_indexes__.pop(prop_name, None)
+
+    def query(cls, order: int = None, **lookups) -> list:
+        """
+        Find descendants by their prop values, e.g. Deadlift.query(weight_load__planned_value__gt=150, order=2).
+        A lookup is a prop path, optionally followed by one of the operators exact, in, gt, gte, lt and lte.
+        Lookups of a single prop are answered by its index, see :py:meth:`create_index`, all others by a scan.
+
+        Args:
+            order: the instantiation order of the requested descendants, if None descendants of any order
+            lookups: lookup => operand pairs that all have to be satisfied
+
+        Returns:
+            the matching descendants, in index order if an index was used, otherwise as listed by
+            :py:meth:`descendants`
+        """
+        candidates = None
+        indexed_lookups = []
+        scanned_lookups = []
+        for lookup, operand in lookups.items():
+            path, op = parse_lookup(lookup)
+            index = cls.__prop_indexes__.get(path[0]) if len(path) == 1 else None
+            if index is None or op not in index.operators:
+                scanned_lookups.append((path, op, operand))
+            else:
+                indexed_lookups.append((index.count(op, operand), index, path, op, operand))
+        if indexed_lookups:
+            # the most selective index provides the candidates, the further lookups are checked on them
+            selective = min(indexed_lookups, key=lambda indexed_lookup: indexed_lookup[0])
+            candidates = selective[1].lookup(*selective[3:])
+            scanned_lookups.extend(indexed_lookup[2:] for indexed_lookup in indexed_lookups
+                                   if indexed_lookup is not selective)
+
+        if candidates is None:
+            candidates = cls.descendants(order=order)
+        elif order is not None:
+            depth = len(cls.__ancestor_ids__) + order
+            candidates = [c for c in candidates if len(c.__ancestor_ids__) == depth]
+        return [c for c in candidates if all(matches(c, path, op, operand) for path, op, operand in scanned_lookups)]
+
+    def define_props(cls, new_props=List[BaseClabjectProp], validation: str = None):
+        """
+        Delegates to :py:meth:`ClabjectPropDict.define_props`, see :py:meth:`__call__` for the validation modes
         """
         assert hasattr(cls, "__ml_props__")
         for prop in new_props:
             if isinstance(prop, MethodProp) and prop.prop_value is not None:
                 setattr(prop.prop_value, "__impl_origin__", cls.__name__)
 
-        cls.__ml_props__.define_props(new_props=new_props)
+        cls.__ml_props__.define_props(new_props=new_props, fail_fast=is_fail_fast(validation))
+        for prop in new_props:
+            if isinstance(prop, MethodProp) and prop.prop_value is not None:
+                bind_method_prop(cls, prop.prop_name, prop.prop_value)
+            else:
+                _publish_prop(cls.__dict__, prop.prop_name, cls.__ml_props__,
+                              setter=super(MetaClabject, cls).__setattr__, deleter=super(MetaClabject, cls).__delattr__)
 
     def add_prop_constraint(cls, constraint, prop_name: str = None) -> None:
         """
@@ -546,13 +1446,29 @@ class MetaClabject(type):
         """
         cls.__ml_props__.add_prop_constraint(prop_name=prop_name, constraint=constraint)
 
-    def check_prop_constraints(cls, prop_name: str = None, potential_value=None, init_only=False):
+    def check_prop_constraints(cls, prop_name: str = None, potential_value=None, init_only=False,
+                               fail_fast: bool = None, validation: str = None):
         """
-        Delegates to :py:meth:`ClabjectPropDict.check_violated_prop_constraints`
+        Delegates to :py:meth:`ClabjectPropDict.check_violated_prop_constraints`, see :py:meth:`__call__` for the
+        validation modes
+
+        Args:
+            fail_fast: deprecated alias of validation, True stands for 'fail_fast' and False for 'collect_all'
+
+        Raises:
+            ValueError: if fail_fast and validation are given and disagree
         """
+        if fail_fast is not None:
+            warnings.warn("fail_fast is deprecated, use validation='fail_fast' or 'collect_all' instead",
+                          DeprecationWarning, stacklevel=2)
+            fail_fast_mode = "fail_fast" if fail_fast else "collect_all"
+            if validation is not None and validation != fail_fast_mode:
+                raise ValueError("fail_fast={F} contradicts validation='{V}'".format(F=fail_fast, V=validation))
+            validation = fail_fast_mode
         return cls.__ml_props__.check_violated_prop_constraints(prop_name=prop_name,
                                                                 potential_value=potential_value,
-                                                                init_only=init_only)
+                                                                init_only=init_only,
+                                                                fail_fast=is_fail_fast(validation))
 
     def adjust_instantiation_speed(cls, speed_adjustments: Dict[str, int]):
         """
@@ -561,19 +1477,26 @@ class MetaClabject(type):
         assert hasattr(cls, "__ml_props__")
         cls.__ml_props__.adjust_instantiation_speed(speed_adjustments=speed_adjustments)
 
-    def check_state_constraints(cls) -> dict:
+    def check_state_constraints(cls, validation: str = None) -> dict:
         """
         Checks all 'active', i.e. instantiated ClabjectStateProps on the current clabject
 
+        Args:
+            validation: with 'fail_fast' the check stops at the first violated state constraint, see
+                        :py:meth:`__call__`
+
         Returns:
             a dictionary with the structure <prop_name> => <violation_reason>
         """
+        fail_fast = is_fail_fast(validation)
         all_violated_constr = {}
         for prop_name, prop in cls.__ml_props__.items():
-            if isinstance(prop, StateConstraintProp) and \
-                    prop.steps_to_instantiation == 0 and \
-                    not prop.prop_value(current_clabject=cls):
-                all_violated_constr[prop_name] = prop.prop_value.violation_reason
+            if isinstance(prop, StateConstraintProp) and prop.steps_to_instantiation == 0:
+                result = prop.prop_value.evaluate(cls)
+                if not result.ok:
+                    all_violated_constr[prop_name] = result.violation_reason
+                    if fail_fast:
+                        break
         return all_violated_constr
 
     def require_re_init_on_next_step(cls, prop_name: str = None, re_init_prop_constr: ReInitPropConstr = None) -> None:
@@ -594,7 +1517,7 @@ class MetaClabject(type):
         if cls.__ml_props__[prop_name].steps_from_instantiation < 1:
             raise ReInitVanishingPropException(prop_name=prop_name)
 
-        cls.__ml_props__[prop_name].re_init_prop_constr = re_init_prop_constr
+        cls.__ml_props__.require_re_init(prop_name=prop_name, re_init_prop_constr=re_init_prop_constr)
 
 
 class ClabjectParent(metaclass=MetaClabject):
@@ -604,6 +1527,9 @@ class ClabjectParent(metaclass=MetaClabject):
     __domain_meta__ = None
     __ml_props__ = {}
     speed_adjustments = {}
+    # True (default): the registry of a clabject keeps its instances alive and so do the registries of these
+    # instances, a hierarchy that sets it to False at its root registers its instances weakly
+    retain_instances = True
 
 
 class Clabject(ClabjectParent):
@@ -614,6 +1540,100 @@ class Clabject(ClabjectParent):
     pass
 
 
+class ClabjectInstance(IdentityValue):
+    """
+    A lightweight terminal clabject, i.e. a clabject that is declared as an instance and materialised as a compact
+    object instead of a class. It offers the prop access, method props and constraint checks of clabjects, but can
+    neither be instantiated further nor inherit from parents.
+    """
+    __slots__ = ("__name__", "__clabject_id__", "__ancestor_ids__", "__domain_meta__", "__ml_props__",
+                 "viz_props_collapse", "__weakref__")
+
+    declared_instance_flag = True
+    speed_adjustments = MappingProxyType({})
+    instances = ()
+    __descendant_index__ = MappingProxyType({})
+    __prop_indexes__ = MappingProxyType({})
+    retain_instances = False
+
+    def __init__(self, name: str, domain_meta: MetaClabject, ml_props: ClabjectPropDict):
+        """
+        Args:
+            name: The name of the instance
+            domain_meta: The clabject the instance was created from
+            ml_props: The props of the instance
+        """
+        clabject_id = _clabject_ids.next_id()
+        object.__setattr__(self, "__name__", name)
+        object.__setattr__(self, "__clabject_id__", clabject_id)
+        object.__setattr__(self, "__ancestor_ids__", _ancestor_ids(clabject_id, domain_meta))
+        object.__setattr__(self, "__domain_meta__", domain_meta)
+        object.__setattr__(self, "__ml_props__", ml_props)
+        object.__setattr__(self, "viz_props_collapse", False)
+
+    get_framework_attrs = MetaClabject.get_framework_attrs
+    descendants = MetaClabject.descendants
+    count_descendants = MetaClabject.count_descendants
+    _descendant_bucket = MetaClabject._descendant_bucket
+    query = MetaClabject.query
+    add_prop_constraint = MetaClabject.add_prop_constraint
+    check_prop_constraints = MetaClabject.check_prop_constraints
+    check_state_constraints = MetaClabject.check_state_constraints
+    viz_name_str = MetaClabject.viz_name_str
+    __str__ = MetaClabject.__str__
+    __eq__ = MetaClabject.__eq__
+
+    def instance_of(self):
+        return self.__domain_meta__
+
+    __hash__ = MetaClabject.__hash__
+
+    def __repr__(self):
+        return "<ClabjectInstance '{N}'>".format(N=self.__name__)
+
+    def __call__(self, *args, **kwargs):
+        raise ClabjectDeclaredAsInstanceException(obj=self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getattr__(self, item):
+        # dunder lookups of python protocols (copy, pickle, ...) are no prop accesses
+        if item.startswith("__"):
+            raise AttributeError(item)
+        ml_props = self.__ml_props__
+        if item in ml_props:
+            prop = ml_props[item]
+            if isinstance(prop, MethodProp) and prop.prop_value is not None:
+                return MethodType(prop.prop_value, self)
+            return ml_props.get_prop_value(item)
+
+        # attributes a class based instance would inherit from the class dict of its domain meta
+        for base in self.__domain_meta__.__mro__:
+            if item in base.__dict__:
+                attr = base.__dict__[item]
+                if isinstance(attr, classmethod):
+                    return MethodType(attr.__func__, self)
+                elif isinstance(attr, staticmethod):
+                    return attr.__func__
+                elif not isinstance(attr, _MethodPropBinding):
+                    return attr
+        raise UndefinedPropsException(undefined_props=set([item]))
+
+    def __setattr__(self, key, value):
+        if key == "viz_props_collapse":
+            object.__setattr__(self, key, value)
+        else:
+            _set_prop_attr(self, key, value)
+
+
+# clabjects are equal by name, memoised constraint results must refer to the clabject itself
+constraint_memo.key_by_identity(MetaClabject, ClabjectInstance)
+
+
 def is_clabject(obj: Any) -> bool:
     """
     Determine whether a given object is a clabject
@@ -624,7 +1644,135 @@ def is_clabject(obj: Any) -> bool:
     Returns:
         a boolean value that indicates whether the predicate is fulfilled for the given obj
     """
-    return type(obj) == MetaClabject
+    return type(obj) == MetaClabject or isinstance(obj, ClabjectInstance)
+
+
+class DanglingAssociation(NamedTuple):
+    """
+    A reference to a deleted clabject that remains in the prop of another clabject, see :py:func:`delete_subtree`
+    """
+    holder: Any
+    prop_name: str
+    target: Any
+
+
+def _domain_metas(clabject):
+    """
+    Yields:
+        the domain metas of increasing order of a clabject, up to the direct instance of Clabject
+    """
+    meta = clabject.__domain_meta__
+    while isinstance(meta, MetaClabject) and meta.__ancestor_ids__:
+        yield meta
+        meta = meta.__domain_meta__
+
+
+def _walk_instances(clabject):
+    yield clabject
+    for instance in clabject.instances:
+        yield from _walk_instances(instance)
+
+
+def _hierarchy_root(clabject):
+    root = clabject
+    while isinstance(root.__domain_meta__, MetaClabject) and root.__domain_meta__ is not Clabject:
+        root = root.__domain_meta__
+    return root
+
+
+def delete_subtree(clabject, scope: list = None) -> List[DanglingAssociation]:
+    """
+    Detach a clabject and all its (transitive) instances from the instantiation hierarchy. The clabject is removed
+    from the instances of its domain meta, the speed adjustments recorded for it are dropped and the instance
+    registries of the deleted clabjects are cleared, so that they are garbage collected once the caller releases them.
+
+    Args:
+        clabject: the root of the subtree to delete
+        scope: clabjects whose hierarchies are searched for references to the deleted clabjects, defaults to the
+               hierarchy the clabject is detached from
+
+    Returns:
+        the association props and collection props of the remaining clabjects that still refer to a deleted clabject
+    """
+    deleted = {id(c): c for c in _walk_instances(clabject)}
+    if scope is None:
+        scope = [_hierarchy_root(clabject)]
+
+    domain_meta = clabject.__domain_meta__
+    if isinstance(domain_meta, MetaClabject):
+        domain_meta.speed_adjustments.pop(clabject.__name__, None)
+
+    for c in deleted.values():
+        # drop c from the descendant index of its (transitive) domain metas above the subtree
+        for order, meta in enumerate(_domain_metas(c), start=1):
+            if id(meta) in deleted:
+                continue
+            bucket = meta._descendant_bucket(order)
+            if c in bucket:
+                bucket.remove(c)
+            for index in meta.__prop_indexes__.values():
+                index.discard(c)
+    namespace = _hierarchy_root(clabject)
+    for c in deleted.values():
+        name_registry.unregister(c, namespace)
+        if isinstance(c, MetaClabject):
+            c.instances.clear()
+            c.__descendant_index__.clear()
+            c.speed_adjustments.clear()
+
+    dangling = []
+    visited = set()
+    for root in scope:
+        for holder in _walk_instances(root):
+            if id(holder) in deleted or id(holder) in visited:
+                continue
+            visited.add(id(holder))
+            for prop_name, prop in holder.__ml_props__.changed_props():
+                if isinstance(prop, AssociationProp):
+                    targets = [prop.prop_value]
+                elif isinstance(prop, CollectionProp) and isinstance(prop.prop_value, (list, tuple, set, frozenset)):
+                    targets = prop.prop_value
+                else:
+                    continue
+                for target in targets:
+                    if id(target) in deleted:
+                        dangling.append(DanglingAssociation(holder=holder, prop_name=prop_name, target=target))
+    return dangling
+
+
+def instantiation_order(value: Any, clabject: Any) -> Union[int, None]:
+    """
+    Determine the number of instantiation steps between a clabject and one of its (transitive) domain metas without
+    walking the instantiation chain, based on the ancestor ids clabjects store on creation. The cost depends on the
+    number of levels only, not on the size of the hierarchy.
+
+    Args:
+        value: a clabject
+        clabject: the potential domain meta of some order
+
+    Returns:
+        n if clabject is the n-th order domain meta of value, 0 if both are equal and None if clabject is no
+        domain meta of value below the origin Clabject
+    """
+    clabject_id = getattr(clabject, "__clabject_id__", None)
+    try:
+        return value.__ancestor_ids__.index(clabject_id)
+    except ValueError:
+        return None
+
+
+def lookup(name: str, namespace: Any = None) -> Any:
+    """
+    Find a clabject by its name, see :class:`registry.NameRegistry`
+
+    Args:
+        name: the name of the clabject
+        namespace: the root clabject of a hierarchy or its name, if None the clabjects of all hierarchies
+
+    Returns:
+        the living clabject created last with the given name or None
+    """
+    return name_registry.lookup(name, namespace)
 
 
 def _built_is_clabject_or_empty_constraint(eval_on_init=True):
@@ -637,7 +1785,7 @@ def _built_is_clabject_or_empty_constraint(eval_on_init=True):
     Returns:
         a parameterised, callable PropValueConstraint object
     """
-    from multilevel_py.constraints import prop_constraint_optional_value_functional as optional
+    from multilevel_py.constraints import prop_constraint_optional_value_functional as optional, TYPE_CHECK_COST
 
     def eval_value_func(value: Any):
         if not is_clabject(value):
@@ -645,7 +1793,8 @@ def _built_is_clabject_or_empty_constraint(eval_on_init=True):
         else:
             return ""
 
-    return optional(PropValueConstraint(name="is_a_clabject", eval_value_func=eval_value_func, eval_on_init=eval_on_init))
+    return optional(PropValueConstraint(name="is_a_clabject", eval_value_func=eval_value_func, eval_on_init=eval_on_init,
+                                        cost=TYPE_CHECK_COST))
 
 
 is_clabect_or_empty_constr = _built_is_clabject_or_empty_constraint(True)
\ No newline at end of file
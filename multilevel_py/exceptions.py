@@ -26,9 +26,14 @@ class InvalidPropValueConstraintException(Exception):
 
 
 class NotAClabjectException(Exception):
+    # raised and reported by the clabject constraints, the message is formatted on demand
     def __init__(self, obj):
-        self.ex_msg = "The provided obj {OBJ} not a clabject of the multilevel_py framework". \
-            format(OBJ=obj)
+        super(NotAClabjectException, self).__init__(obj)
+        self.obj = obj
+
+    @property
+    def ex_msg(self):
+        return "The provided obj {OBJ} not a clabject of the multilevel_py framework".format(OBJ=self.obj)
 
     def __str__(self):
         return self.ex_msg
@@ -45,6 +50,15 @@ class ClabjectDeclaredAsInstanceException(Exception):
         return self.ex_msg
 
 
+class LightweightInstanceParentsException(Exception):
+    def __init__(self, name):
+        self.ex_msg = "The lightweight instance {NAME} is not materialised as a class " \
+                      "and thus can't inherit from parents".format(NAME=name)
+
+    def __str__(self):
+        return self.ex_msg
+
+
 class InvalidMultiplicityTupleException(Exception):
     def __init__(self, provided_tuple):
         self.ex_msg = "The provided multiplicity {MULT} is invalid." \
@@ -66,56 +80,138 @@ class InvalidInstantiationOrderException(Exception):
         return self.ex_msg
 
 
-class UndefinedPropsException(Exception):
+class InvalidQueryLookupException(Exception):
+    def __init__(self, lookup):
+        self.ex_msg = "The query lookup {LOOKUP} is invalid. " \
+                      "It has to be a prop path like 'prop__sub_prop', optionally followed by an operator like '__gt'" \
+            .format(LOOKUP=lookup)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class InvalidIndexKindException(Exception):
+    def __init__(self, kind, prop_name):
+        self.ex_msg = "The index kind {KIND} requested for prop '{PROP}' is invalid, " \
+                      "it has to be either 'hash' or 'sorted'".format(KIND=kind, PROP=prop_name)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class InvalidValidationModeException(Exception):
+    def __init__(self, mode):
+        self.ex_msg = "The validation mode {MODE} is invalid, it has to be either 'collect_all' or 'fail_fast'" \
+            .format(MODE=mode)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class InvalidCopyPolicyException(Exception):
+    def __init__(self, copy_policy):
+        self.ex_msg = "The copy policy {POLICY} is invalid, it has to be one of 'share', 'copy', 'deepcopy' or " \
+                      "'copy_on_write'".format(POLICY=copy_policy)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class NotVectorisableConstraintException(Exception):
+    def __init__(self, constraint_name):
+        self.ex_msg = "The member constraint {CONSTR} has no vectorised counterpart, array props accept the built-in " \
+                      "type, non-negative and in-set constraints or ArrayConstraints".format(CONSTR=constraint_name)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class DuplicateClabjectNameException(Exception):
+    def __init__(self, name, namespace):
+        self.ex_msg = "The name {NAME} is already taken by a clabject of the hierarchy {NAMESPACE}" \
+            .format(NAME=name, NAMESPACE=namespace)
+
+    def __str__(self):
+        return self.ex_msg
+
+
+class UndefinedPropsException(AttributeError):
+    # An AttributeError, so that hasattr() probes on clabjects are answered with False. The message is formatted on
+    # demand, since most of these exceptions end in a hasattr() or getattr() with default. The structural exceptions
+    # below follow the same scheme, they pass their fields to Exception, which keeps them picklable.
     def __init__(self, undefined_props: Set[str]):
-        ex_msg = "The following properties are not defined for the clabject: '{PROPS}'".format(
-            PROPS=str(undefined_props)
+        super(UndefinedPropsException, self).__init__(undefined_props)
+        self.undefined_props = undefined_props
+
+    def __str__(self):
+        return "The following properties are not defined for the clabject: '{PROPS}'".format(
+            PROPS=str(self.undefined_props)
         )
-        super(UndefinedPropsException, self).__init__(self, ex_msg)
 
 
 class PropsAlreadyDefinedException(Exception):
     def __init__(self, already_defined_props: Set[str]):
-        ex_msg = "The following properties are already defined for the clabject: '{PROPS}'.".format(
-            PROPS=str(already_defined_props)
+        super(PropsAlreadyDefinedException, self).__init__(already_defined_props)
+        self.already_defined_props = already_defined_props
+
+    def __str__(self):
+        return "The following properties are already defined for the clabject: '{PROPS}'.".format(
+            PROPS=str(self.already_defined_props)
         )
-        super(PropsAlreadyDefinedException, self).__init__(self, ex_msg)
 
 
 class ChangeFinalPropException(Exception):
     def __init__(self, prop_name: str):
-        ex_mgs = "The Property '{PROP} is declared final and thus cannot be changed".format(
-            PROP=prop_name
+        super(ChangeFinalPropException, self).__init__(prop_name)
+        self.prop_name = prop_name
+
+    def __str__(self):
+        return "The Property '{PROP} is declared final and thus cannot be changed".format(
+            PROP=self.prop_name
         )
 
 
 class ReInitFinalPropException(Exception):
     def __init__(self, prop_name: str):
-        ex_mgs = "The Property '{PROP} is declared final and thus cannot be re-initialised".format(
-            PROP=prop_name
+        super(ReInitFinalPropException, self).__init__(prop_name)
+        self.prop_name = prop_name
+
+    def __str__(self):
+        return "The Property '{PROP} is declared final and thus cannot be re-initialised".format(
+            PROP=self.prop_name
         )
 
 
 class ReInitVanishingPropException(Exception):
     def __init__(self, prop_name: str):
-        ex_mgs = "The Property '{PROP} will vanish with the next instantiation step and thus cannot be re-initialised".format(
-            PROP=prop_name
-        )
+        super(ReInitVanishingPropException, self).__init__(prop_name)
+        self.prop_name = prop_name
+
+    def __str__(self):
+        return "The Property '{PROP} will vanish with the next instantiation step and thus cannot be " \
+               "re-initialised".format(PROP=self.prop_name)
 
 
 class UnduePropInstantiationException(Exception):
     def __init__(self, prop_name: str, later_steps_number: int):
-        ex_msg = "Propery {PROP} is not due to be instantiated. It's has to be instantiated at {STEPS}.".format(
-            PROP=prop_name,
-            STEPS=str(later_steps_number)
+        super(UnduePropInstantiationException, self).__init__(prop_name, later_steps_number)
+        self.prop_name = prop_name
+        self.later_steps_number = later_steps_number
+
+    def __str__(self):
+        return "Propery {PROP} is not due to be instantiated. It's has to be instantiated at {STEPS}.".format(
+            PROP=self.prop_name,
+            STEPS=str(self.later_steps_number)
         )
-        super(UnduePropInstantiationException, self).__init__(self, ex_msg)
 
 
 class UninitialisedPropException(Exception):
     def __init__(self, prop_name: str):
-        ex_msg = "Property '{PROP}' has to be instantiated at this level.".format(PROP=prop_name)
-        super(UninitialisedPropException, self).__init__(self, ex_msg)
+        super(UninitialisedPropException, self).__init__(prop_name)
+        self.prop_name = prop_name
+
+    def __str__(self):
+        return "Property '{PROP}' has to be instantiated at this level.".format(PROP=self.prop_name)
 
 
 class ConstraintViolationException(Exception):
@@ -0,0 +1,271 @@
+import math
+import operator
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from weakref import KeyedRef, ref
+
+from multilevel_py.exceptions import InvalidQueryLookupException
+
+# lookup suffix => comparison of the prop value with the operand
+LOOKUP_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "exact": operator.eq,
+    "in": lambda value, operand: value in operand,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def parse_lookup(lookup: str) -> Tuple[List[str], str]:
+    """
+    Split a query lookup like 'weight_load__planned_value__gt' into its prop path and its operator
+
+    Returns:
+        (prop path, operator name) tuple, the operator defaults to 'exact'
+    """
+    path = lookup.split("__")
+    op = path.pop() if len(path) > 1 and path[-1] in LOOKUP_OPERATORS else "exact"
+    if not all(path):
+        raise InvalidQueryLookupException(lookup=lookup)
+    return path, op
+
+
+def matches(clabject: Any, path: List[str], op: str, operand: Any) -> bool:
+    """
+    Evaluate a lookup by reading the props along the path, undefined props and incomparable values do not match
+    """
+    value = clabject
+    try:
+        for prop_name in path:
+            value = getattr(value, prop_name)
+        return bool(LOOKUP_OPERATORS[op](value, operand))
+    except (AttributeError, TypeError):
+        return False
+
+
+def _indexed_value(clabject: Any, prop_name: str) -> Tuple[bool, Any]:
+    """
+    Returns:
+        (True, value) if the clabject has the prop, (False, None) otherwise - the value is read without copying it
+    """
+    ml_props = clabject.__ml_props__
+    if prop_name not in ml_props:
+        return False, None
+    return True, ml_props[prop_name].prop_value
+
+
+# marks entries whose value is not part of the index structure
+_UNINDEXED = object()
+
+
+class PropIndex:
+    """
+    Base of the secondary indexes a clabject keeps on the values of one prop of its (transitive) instances.
+    Indexed clabjects are weakly referenced, values the index can not hold (unhashable or incomparable ones) are kept
+    aside and checked by a scan on lookups.
+    """
+    kind = None
+    operators = ()
+
+    def __init__(self, prop_name: str):
+        self.prop_name = prop_name
+        # id(clabject) -> (weak ref, index key or _UNINDEXED)
+        self._entries = {}
+        # id(clabject) -> weak ref, for the entries that are not part of the index structure
+        self._unindexed = {}
+        self_ref = ref(self)
+
+        def on_collect(weak_ref):
+            index = self_ref()
+            if index is not None:
+                entry = index._entries.get(weak_ref.key)
+                if entry is not None and entry[0] is weak_ref:
+                    index._remove_entry(weak_ref.key)
+
+        self._on_collect = on_collect
+
+    def add(self, clabject: Any) -> None:
+        """
+        Index the current prop value of the clabject, replacing a former entry of it
+        """
+        key = id(clabject)
+        if key in self._entries:
+            self._remove_entry(key)
+        has_prop, value = _indexed_value(clabject, self.prop_name)
+        if has_prop:
+            weak_ref = KeyedRef(clabject, self._on_collect, key)
+            index_key = self._insert(key, weak_ref, value)
+            if index_key is _UNINDEXED:
+                self._unindexed[key] = weak_ref
+            self._entries[key] = (weak_ref, index_key)
+
+    def discard(self, clabject: Any) -> None:
+        key = id(clabject)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is clabject:
+            self._remove_entry(key)
+
+    def lookup(self, op: str, operand: Any) -> List[Any]:
+        """
+        Returns:
+            the living indexed clabjects whose prop value satisfies the lookup operator
+        """
+        found = [weak_ref() for weak_ref in self._find(op, operand)]
+        unindexed = [weak_ref() for weak_ref in list(self._unindexed.values())]
+        found.extend(c for c in unindexed if c is not None and matches(c, [self.prop_name], op, operand))
+        return [c for c in found if c is not None]
+
+    def count(self, op: str, operand: Any) -> int:
+        """
+        Returns:
+            an upper bound of the number of clabjects a lookup returns, without materialising them
+        """
+        return self._count(op, operand) + len(self._unindexed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove_entry(self, key: int) -> None:
+        weak_ref, index_key = self._entries.pop(key)
+        if index_key is _UNINDEXED:
+            del self._unindexed[key]
+        else:
+            self._delete(key, index_key)
+
+    def _insert(self, key: int, weak_ref: KeyedRef, value: Any):
+        raise NotImplementedError()
+
+    def _delete(self, key: int, index_key: Any) -> None:
+        raise NotImplementedError()
+
+    def _find(self, op: str, operand: Any) -> Iterable[KeyedRef]:
+        raise NotImplementedError()
+
+    def _count(self, op: str, operand: Any) -> int:
+        raise NotImplementedError()
+
+
+class HashPropIndex(PropIndex):
+    """
+    Index for equality and membership lookups
+    """
+    kind = "hash"
+    operators = ("exact", "in")
+
+    def __init__(self, prop_name: str):
+        super(HashPropIndex, self).__init__(prop_name)
+        # value -> {id(clabject): weak ref}
+        self._buckets = {}
+
+    def _insert(self, key, weak_ref, value):
+        try:
+            self._buckets.setdefault(value, {})[key] = weak_ref
+        except TypeError:
+            return _UNINDEXED
+        return value
+
+    def _delete(self, key, index_key):
+        bucket = self._buckets[index_key]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[index_key]
+
+    def _find(self, op, operand):
+        operands = operand if op == "in" else (operand,)
+        for value in operands:
+            try:
+                bucket = self._buckets.get(value)
+            except TypeError:
+                continue
+            if bucket:
+                yield from list(bucket.values())
+
+    def _count(self, op, operand):
+        operands = operand if op == "in" else (operand,)
+        number = 0
+        for value in operands:
+            try:
+                number += len(self._buckets.get(value, ()))
+            except TypeError:
+                continue
+        return number
+
+
+class SortedPropIndex(PropIndex):
+    """
+    Index for range lookups on values with a total order, such as numbers, dates and timedeltas
+    """
+    kind = "sorted"
+    operators = ("exact", "in", "gt", "gte", "lt", "lte")
+
+    def __init__(self, prop_name: str):
+        super(SortedPropIndex, self).__init__(prop_name)
+        # sorted (value, insertion number) keys and the weak refs of the clabjects per key
+        self._keys = []
+        self._refs = {}
+        self._insertions = count()
+        # None values of uninitialised props can not be ordered, they are kept apart
+        self._nones = {}
+
+    def _insert(self, key, weak_ref, value):
+        if value is None:
+            self._nones[key] = weak_ref
+            return None
+        index_key = (value, next(self._insertions))
+        try:
+            insort(self._keys, index_key)
+        except TypeError:
+            return _UNINDEXED
+        self._refs[index_key] = weak_ref
+        return index_key
+
+    def _delete(self, key, index_key):
+        if index_key is None:
+            del self._nones[key]
+        else:
+            del self._keys[bisect_left(self._keys, index_key)]
+            del self._refs[index_key]
+
+    def _bounds(self, op: str, operand: Any) -> Tuple[int, int]:
+        """
+        Returns:
+            the slice of the sorted keys whose values satisfy a comparison with a non None operand
+        """
+        keys = self._keys
+        # (operand,) sorts before and (operand, inf) after all keys of the operand value
+        try:
+            if op == "exact":
+                return bisect_left(keys, (operand,)), bisect_right(keys, (operand, math.inf))
+            elif op == "gt":
+                return bisect_right(keys, (operand, math.inf)), len(keys)
+            elif op == "gte":
+                return bisect_left(keys, (operand,)), len(keys)
+            elif op == "lt":
+                return 0, bisect_left(keys, (operand,))
+            else:
+                return 0, bisect_right(keys, (operand, math.inf))
+        except TypeError:
+            # operand is incomparable with the indexed values
+            return 0, 0
+
+    def _find(self, op, operand):
+        if op == "in":
+            return [weak_ref for value in operand for weak_ref in self._find("exact", value)]
+        elif operand is None:
+            return list(self._nones.values()) if op == "exact" else []
+        lower, upper = self._bounds(op, operand)
+        refs = self._refs
+        return [refs[index_key] for index_key in self._keys[lower:upper]]
+
+    def _count(self, op, operand):
+        if op == "in":
+            return sum(self._count("exact", value) for value in operand)
+        elif operand is None:
+            return len(self._nones) if op == "exact" else 0
+        lower, upper = self._bounds(op, operand)
+        return upper - lower
+
+
+INDEX_KINDS = {index_class.kind: index_class for index_class in (HashPropIndex, SortedPropIndex)}
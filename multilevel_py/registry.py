@@ -0,0 +1,296 @@
+import gc
+import warnings
+from itertools import islice
+from typing import Any, Iterable, Iterator
+from weakref import KeyedRef, WeakKeyDictionary, WeakValueDictionary, ref
+
+from multilevel_py.exceptions import DuplicateClabjectNameException
+
+
+class InstanceRegistry:
+    """
+    The ordered collection behind the 'instances' relation of a clabject. Instances are registered by weak references,
+    so an instance that is no longer referenced elsewhere is dropped from the registry once it is garbage collected.
+    Instances registered with retain=True (opt-in) are additionally held by a strong reference, which keeps them alive
+    as long as the registry itself.
+    """
+    __slots__ = ("_refs", "_retained", "_on_collect", "__weakref__")
+
+    def __init__(self):
+        # id(instance) -> KeyedRef, insertion ordered
+        self._refs = {}
+        # id(instance) -> instance, for the instances the registry keeps alive
+        self._retained = {}
+
+        self_ref = ref(self)
+
+        def on_collect(weak_ref):
+            registry = self_ref()
+            if registry is not None and registry._refs.get(weak_ref.key) is weak_ref:
+                del registry._refs[weak_ref.key]
+
+        self._on_collect = on_collect
+
+    def append(self, instance: Any, retain: bool = False) -> None:
+        """
+        Register an instance
+
+        Args:
+            instance: the instance to register
+            retain: if True, the registry keeps the instance alive, otherwise it is only weakly referenced
+        """
+        key = id(instance)
+        self._refs[key] = KeyedRef(instance, self._on_collect, key)
+        if retain:
+            self._retained[key] = instance
+
+    def remove(self, instance: Any) -> None:
+        """
+        Unregister an instance
+
+        Raises:
+            ValueError: if the instance is not registered
+        """
+        key = id(instance)
+        weak_ref = self._refs.get(key)
+        if weak_ref is None or weak_ref() is not instance:
+            raise ValueError("{I} is not a registered instance".format(I=repr(instance)))
+        del self._refs[key]
+        self._retained.pop(key, None)
+
+    def release(self) -> None:
+        """
+        Drop the strong references to all registered instances, they remain registered as long as they are alive
+        """
+        self._retained.clear()
+
+    def clear(self) -> None:
+        self._refs.clear()
+        self._retained.clear()
+
+    def __iter__(self) -> Iterator[Any]:
+        # iterate over a snapshot, the garbage collector may unregister instances meanwhile
+        for weak_ref in list(self._refs.values()):
+            instance = weak_ref()
+            if instance is not None:
+                yield instance
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, instance: Any) -> bool:
+        weak_ref = self._refs.get(id(instance))
+        return weak_ref is not None and weak_ref() is instance
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        # skip to the reference from the end the index counts from instead of materialising the instances, which
+        # makes the common first and last instance lookups O(1)
+        refs = self._refs.values()
+        if index < 0:
+            index, refs = -index - 1, reversed(refs)
+        weak_ref = next(islice(refs, index, None), None)
+        instance = weak_ref() if weak_ref is not None else None
+        if instance is None:
+            raise IndexError("instance index out of range")
+        return instance
+
+    def __repr__(self):
+        return "<InstanceRegistry of {N} instances>".format(N=len(self))
+
+
+class ClabjectIdTable:
+    """
+    Assigns monotonically increasing integer ids to clabjects, every clabject gets its own id and ids are never reused
+    """
+    __slots__ = ("_last_id",)
+
+    def __init__(self):
+        self._last_id = 0
+
+    def next_id(self) -> int:
+        """
+        Returns:
+            a new id, greater than all ids assigned before
+        """
+        self._last_id += 1
+        return self._last_id
+
+    def __len__(self) -> int:
+        # the number of assigned ids
+        return self._last_id
+
+
+class ClabjectIdSet:
+    """
+    An immutable set of clabjects that is keyed by their integer ids. Membership tests and set operations work on the
+    ids and never call the python level __hash__ and __eq__ of clabjects.
+    """
+    __slots__ = ("ids", "_tables")
+
+    def __init__(self, clabjects: Iterable = ()):
+        members = {clabject.__clabject_id__: clabject for clabject in clabjects}
+        self.ids = frozenset(members)
+        # clabject id -> clabject tables, shared with the sets derived from this one, so they may hold non-members
+        self._tables = (members,)
+
+    @classmethod
+    def _from_ids(cls, ids: frozenset, tables: tuple):
+        id_set = cls.__new__(cls)
+        id_set.ids = ids
+        id_set._tables = tables
+        return id_set
+
+    def _member(self, clabject_id: int):
+        for table in self._tables:
+            if clabject_id in table:
+                return table[clabject_id]
+
+    def __contains__(self, clabject: Any) -> bool:
+        try:
+            return clabject.__clabject_id__ in self.ids
+        except AttributeError:
+            return False
+
+    def __iter__(self) -> Iterator[Any]:
+        if len(self._tables) == 1:
+            table = self._tables[0]
+            return (table[clabject_id] for clabject_id in self.ids)
+        return (self._member(clabject_id) for clabject_id in self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __eq__(self, other):
+        if isinstance(other, ClabjectIdSet):
+            return self.ids == other.ids
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.ids)
+
+    def __or__(self, other):
+        tables = self._tables + other._tables
+        if len(tables) > 8:
+            # repeated unions would otherwise slow down member lookups
+            tables = ({clabject_id: member for table in reversed(tables) for clabject_id, member in table.items()},)
+        return ClabjectIdSet._from_ids(self.ids | other.ids, tables)
+
+    def __and__(self, other):
+        return ClabjectIdSet._from_ids(self.ids & other.ids, self._tables)
+
+    def __sub__(self, other):
+        return ClabjectIdSet._from_ids(self.ids - other.ids, self._tables)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+    def __repr__(self):
+        return "ClabjectIdSet({M})".format(M=sorted(str(c) for c in self))
+
+
+DUPLICATE_NAME_POLICIES = ("replace", "warn", "raise")
+
+
+class NameRegistry:
+    """
+    Weak registry of clabjects by name, globally and per namespace, i.e. per root hierarchy. The namespaces are keyed
+    by the root clabjects themselves, so hierarchies whose roots share a name do not clash and the namespace of a
+    hierarchy is dropped as soon as its root is released. A name that is registered again in the same namespace
+    refers to the newer clabject, depending on the duplicate name policy the registration additionally warns (default)
+    or is refused.
+    """
+    __slots__ = ("_names", "_namespaces", "_on_duplicate")
+
+    def __init__(self, on_duplicate: str = "warn"):
+        self._names = WeakValueDictionary()
+        # root clabject -> WeakValueDictionary of the names in its hierarchy
+        self._namespaces = WeakKeyDictionary()
+        self.on_duplicate = on_duplicate
+
+    @property
+    def on_duplicate(self) -> str:
+        """
+        'replace', 'warn' (default) or 'raise', the handling of a name that is already taken in its namespace
+        """
+        return self._on_duplicate
+
+    @on_duplicate.setter
+    def on_duplicate(self, policy: str) -> None:
+        if policy not in DUPLICATE_NAME_POLICIES:
+            raise ValueError("on_duplicate has to be one of " + ", ".join(DUPLICATE_NAME_POLICIES))
+        self._on_duplicate = policy
+
+    def check_name(self, name: str, root: Any) -> None:
+        """
+        Apply the duplicate name policy to a name that is about to be registered
+
+        Args:
+            name: the name of the new clabject
+            root: the root clabject of the hierarchy of the new clabject, None for a new root
+
+        Raises:
+            DuplicateClabjectNameException: if the name is taken and the policy is 'raise'
+        """
+        # a new root opens a namespace of its own
+        if self._on_duplicate == "replace" or root is None or self.lookup(name, root) is None:
+            return
+        # classes are part of reference cycles, so a released clabject stays registered until the cycle collector
+        # runs. Collecting before the policy is applied keeps its outcome independent of the collection timing.
+        gc.collect()
+        if self.lookup(name, root) is None:
+            return
+        if self._on_duplicate == "raise":
+            raise DuplicateClabjectNameException(name=name, namespace=root.__name__)
+        warnings.warn(str(DuplicateClabjectNameException(name=name, namespace=root.__name__)), stacklevel=4)
+
+    def register(self, clabject: Any, root: Any) -> None:
+        """
+        Args:
+            clabject: the new clabject
+            root: the root clabject of its hierarchy, None if the clabject is a root itself
+        """
+        if root is None:
+            root = clabject
+        name = clabject.__name__
+        self._names[name] = clabject
+        names = self._namespaces.get(root)
+        if names is None:
+            names = self._namespaces[root] = WeakValueDictionary()
+        names[name] = clabject
+
+    def unregister(self, clabject: Any, root: Any) -> None:
+        """
+        Release the entries of the clabject, entries of newer clabjects of the same name are kept
+        """
+        name = clabject.__name__
+        if self._names.get(name) is clabject:
+            del self._names[name]
+        names = self._namespaces.get(root)
+        if names is not None and names.get(name) is clabject:
+            del names[name]
+
+    def lookup(self, name: str, namespace: Any = None) -> Any:
+        """
+        Args:
+            name: the name of a clabject
+            namespace: the root clabject of a hierarchy or its name, which refers to the newest living root of that
+                       name, if None the clabjects of all hierarchies
+
+        Returns:
+            the living clabject registered last with the given name or None
+        """
+        if namespace is None:
+            return self._names.get(name)
+        if isinstance(namespace, str):
+            roots = [root for root in self._namespaces.keys() if root.__name__ == namespace]
+            if not roots:
+                return None
+            namespace = max(roots, key=lambda root: root.__clabject_id__)
+        names = self._namespaces.get(namespace)
+        return names.get(name) if names is not None else None
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -90,7 +90,7 @@ def _create_level_recursive(dot: Digraph,
         for clabject in current_queue:
             _create_node(lev, clabject, font, fontsize)
             if clabject.instances is not None and len(clabject.instances) > 0:
-                next_queue = next_queue + clabject.instances
+                next_queue = next_queue + list(clabject.instances)
 
     for clabject in prev_queue:
         if clabject.instances is not None:
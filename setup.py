@@ -98,7 +98,8 @@ setup(
     extras_require={  # Optional
         'dev': [],
         'test': ['pytest', 'pytest-depends'],
-        'viz': ['graphviz', 'jinja2']
+        'viz': ['graphviz', 'jinja2'],
+        'numpy': ['numpy']
     },
 
     # If there are data files included in your packages that need to be
@@ -0,0 +1,90 @@
+import copy
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from multilevel_py.array_values import ArrayProp, create_array_prop, is_float_array_constraint, \
+    is_int_array_constraint, is_not_negative_array_constraint, prop_constraint_array_in_set_functional, \
+    prop_constraint_array_multiplicity_functional, prop_constraint_array_range_functional, vectorise
+from multilevel_py.constraints import is_float_constraint, is_not_negative_constraint, PropValueConstraint, \
+    prop_constraint_value_in_set_functional, validation_mode
+from multilevel_py.core import Clabject
+from multilevel_py.exceptions import ConstraintViolationException, NotVectorisableConstraintException
+
+
+@pytest.fixture
+def build_plan():
+    def builder(**prop_kwargs):
+        Plan = Clabject(name="ArrayPlan")
+        Plan.define_props([create_array_prop(n='loads', t=1, f='*', i_f=False, **prop_kwargs)])
+        return Plan
+    return builder
+
+
+def test_array_constraints_report_offending_indices():
+    result = is_not_negative_array_constraint.evaluate(np.array([1.0, -2.0, 3.0, -0.5]))
+    assert not result.ok
+    assert list(result.violation_reason.indices) == [1, 3]
+    assert str(result.violation_reason) == "The members at the indices [1 3] (2 in total) must not be < 0"
+    assert "(25 in total)" in is_not_negative_array_constraint.evaluate(-np.arange(1, 26)).violation_reason
+    assert is_not_negative_array_constraint.evaluate([0, 1, 2]).ok
+
+    in_range = prop_constraint_array_range_functional(0, 10)
+    assert list(in_range.offending_indices([5, 11, np.nan, -1])) == [1, 2, 3]
+    in_set = prop_constraint_array_in_set_functional({"kg", "lb"})
+    assert list(in_set.offending_indices(["kg", "g", "lb"])) == [1]
+
+
+def test_dtype_constraint_checks_mixed_members_as_given():
+    assert is_float_array_constraint.evaluate(np.array([1.0, 2.0], dtype=np.float32)).ok
+    assert list(is_float_array_constraint.offending_indices([1.0, "a", 2.0, 3])) == [1, 3]
+    assert list(is_int_array_constraint.offending_indices(np.array([1.5, 2.5]))) == [0, 1]
+    assert not is_not_negative_array_constraint.evaluate(["a", "b"]).ok
+
+
+def test_vectorise_builtin_member_constraints():
+    assert vectorise(is_float_constraint) is is_float_array_constraint
+    assert vectorise(is_not_negative_constraint) is is_not_negative_array_constraint
+    in_set = vectorise(prop_constraint_value_in_set_functional({1, 2}))
+    assert list(in_set.offending_indices([1, 3, 2])) == [1]
+    with pytest.raises(NotVectorisableConstraintException):
+        vectorise(PropValueConstraint(name="custom", eval_value_func=lambda v: "", eval_on_init=True))
+
+
+def test_array_prop_stores_read_only_arrays(build_plan):
+    Plan = build_plan(coll_desc=(0, 4, is_float_constraint), dtype=np.float32,
+                      c=[is_not_negative_array_constraint])
+    plan = Plan(name="array_plan", init_props={'loads': [1.0, 2.5]})
+    assert isinstance(plan.__ml_props__['loads'], ArrayProp)
+    assert plan.loads.dtype == np.float32 and list(plan.loads) == [1.0, 2.5]
+    with pytest.raises(ValueError):
+        plan.loads[0] = -1.0
+    plan.loads = np.array([3.0, 4.0])
+    assert plan.loads.dtype == np.float32
+    assert copy.deepcopy(plan.loads).flags.writeable
+
+
+def test_array_prop_assignments_are_validated(build_plan):
+    Plan = build_plan(coll_desc=(0, 4, is_float_constraint), dtype=float, c=[is_not_negative_array_constraint])
+    plan = Plan(name="validated_array_plan", init_props={'loads': [1.0]})
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads = [1.0, -2.0, 3.0]
+    [violation] = ex_info.value.violated_constraints["loads"]
+    assert violation.name == "is_not_negative_array_constraint" and list(violation.violation_reason.indices) == [1]
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads = [1.0, "two"]
+    # the member type constraint covers the dtype of the prop, the type violation is reported once
+    assert sorted(r.name for r in ex_info.value.violated_constraints["loads"]) == \
+        ["is_array_of_floating", "is_not_negative_array_constraint"]
+    with validation_mode("fail_fast"), pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads = [1.0, "two"]
+    assert len(ex_info.value.violated_constraints["loads"]) == 1
+    assert list(plan.loads) == [1.0]
+
+
+def test_array_multiplicity_counts_elements():
+    multiplicity = prop_constraint_array_multiplicity_functional(0, 3)
+    assert multiplicity.evaluate(np.zeros(3)).ok
+    assert not multiplicity.evaluate(np.zeros((2, 2))).ok
+    assert not multiplicity.evaluate([1, 2, 3, 4]).ok
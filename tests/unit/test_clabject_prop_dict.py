@@ -34,3 +34,296 @@ def test_clabject_prop_manager_set_value_of_invalid_type(clabject_prop_dict):
 def test_clabject_prop_manager_set_value_inconsistent_with_key(clabject_prop_dict, lev_3_prop):
     with pytest.raises(ValueError):
         clabject_prop_dict["hello"] = lev_3_prop
+
+
+@pytest.fixture(scope="module")
+def build_copy_on_write_clabject():
+    def builder():
+        from multilevel_py.core import Clabject, create_clabject_prop
+        from multilevel_py.constraints import is_str_constraint
+        Meta = Clabject(name="CowMeta")
+        prop_label = create_clabject_prop(n="label", t=0, f='*', i_f=False, c=[is_str_constraint], v="meta")
+        prop_items = create_clabject_prop(n="items", t=1, f='*', i_f=False, coll_desc=(0, math.inf, None), d=[])
+        prop_level = create_clabject_prop(n="level", t=2, f='*', c=[])
+        Meta.define_props([prop_label, prop_items, prop_level])
+        return Meta
+    return builder
+
+
+def test_next_prop_dict_shares_unchanged_props(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    assert Cls.__ml_props__["label"] is Meta.__ml_props__["label"]
+    # counters changed by the instantiation step => cloned
+    assert Cls.__ml_props__["level"] is not Meta.__ml_props__["level"]
+    assert Cls.__ml_props__["level"].steps_to_instantiation == 1
+    assert Meta.__ml_props__["level"].steps_to_instantiation == 2
+
+
+def test_next_prop_dict_holds_only_changed_props(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    # the default value of items is initialised at this step, label and level are resolved through Meta
+    assert [prop_name for prop_name, _ in Cls.__ml_props__.changed_props()] == ["items"]
+    assert list(Cls.__ml_props__.keys()) == ["label", "items", "level"]
+    assert Cls.__ml_props__["level"].steps_to_instantiation == 1
+    assert Meta.__ml_props__["level"].steps_to_instantiation == 2
+
+
+def test_changing_a_shared_prop_does_not_affect_the_other_clabject(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    Cls.label = "cls"
+    assert Meta.label == "meta"
+    Meta.label = "changed meta"
+    assert Cls.label == "cls"
+
+
+def test_in_place_changes_of_mutable_values_evolve_independently(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    inst_a = Cls(name="cow_inst_a", init_props={"level": 1})
+    inst_b = Cls(name="cow_inst_b", init_props={"level": 2})
+    Cls.items.append("cls_item")
+    inst_a.items.append("a_item")
+    assert Cls.items == ["cls_item"]
+    assert inst_a.items == ["a_item"]
+    assert inst_b.items == []
+    assert Cls.__ml_props__["items"].default_value == []
+
+
+def test_values_read_before_an_instantiation_are_not_shared_with_the_instance():
+    from multilevel_py.core import Clabject, create_clabject_prop
+    Meta = Clabject(name="ReadBeforeMeta")
+    Meta.define_props([create_clabject_prop(n="items", t=0, f='*', i_f=False, coll_desc=(0, math.inf, None), v=[1]),
+                       create_clabject_prop(n="params", t=0, f='*', i_f=False, v={"reps": 5}),
+                       create_clabject_prop(n="level", t=1, f='*', c=[])])
+    held_items, held_params = Meta.items, Meta.params
+    Cls = Meta(name="ReadBeforeCls", init_props={"level": 1})
+    held_items.append(2)
+    held_params["rest"] = 60
+    other_Cls = Meta(name="OtherReadBeforeCls", init_props={"level": 2})
+    # the copies are referenced by the classes only, so they are shared copy-on-write with their instances
+    inst = Cls(name="read_before_inst")
+    assert Cls.__ml_props__["items"].prop_value is inst.__ml_props__["items"].prop_value
+    assert (Cls.items, Cls.params) == ([1], {"reps": 5})
+    assert (Meta.items, Meta.params) == ([1, 2], {"reps": 5, "rest": 60})
+    assert (other_Cls.items, other_Cls.params) == ([1, 2], {"reps": 5, "rest": 60})
+
+
+def test_collection_values_converted_on_definition_are_not_copied_on_instantiation():
+    from multilevel_py.core import Clabject, create_clabject_prop
+    from multilevel_py.clabject_prop import track_copies
+    given_items = [1, 2]
+    Meta = Clabject(name="ConvertedMeta")
+    Meta.define_props([create_clabject_prop(n="items", t=0, f='*', i_f=False, coll_desc=(0, math.inf, None),
+                                            v=given_items)])
+    # the managed list is a copy of the given list, which the caller may change without affecting the prop
+    given_items.append(3)
+    with track_copies() as report:
+        classes = [Meta(name="ConvertedCls" + str(i)) for i in range(3)]
+        assert (report.instantiations, report.copies) == (3, 0)
+    assert [cls.items for cls in classes] == [[1, 2]] * 3
+
+
+def test_prop_schedule_is_stored_as_absolute_depths():
+    from multilevel_py.core import Clabject, create_clabject_prop
+    Top = Clabject(name="DepthTop")
+    Top.define_props([create_clabject_prop(n="late", t=3, f=1, c=[]),
+                      create_clabject_prop(n="early", t=1, f=0, c=[])])
+    Mid = Top(name="DepthMid", init_props={"early": 1})
+    Low = Mid(name="DepthLow")
+    assert (Mid.__ml_props__.depth, Low.__ml_props__.depth) == (1, 2)
+    assert Top.__ml_props__["late"].due_depth == Low.__ml_props__["late"].due_depth == 3
+    assert Low.__ml_props__["late"].steps_to_instantiation == 1
+    assert "early" in Mid.__ml_props__ and "early" not in Low.__ml_props__
+    Bottom = Low(name="DepthBottom", init_props={"late": 1})
+    assert Bottom.__ml_props__["late"].steps_from_instantiation == 1
+    BelowBottom = Bottom(name="DepthBelowBottom")
+    assert BelowBottom.__ml_props__["late"].steps_from_instantiation == 0
+    assert "late" not in BelowBottom(name="DepthVanished").__ml_props__
+
+
+def test_delta_of_domain_meta_is_copied_before_it_changes():
+    from multilevel_py.core import Clabject, create_clabject_prop
+    Top = Clabject(name="SnapshotTop")
+    Top.define_props([create_clabject_prop(n="a", t=0, f='*', i_f=False, c=[], v=1)])
+    Mid = Top(name="SnapshotMid")
+    Top.a = 2
+    Top.define_props([create_clabject_prop(n="b", t=0, f='*', c=[], v=3)])
+    assert Mid.a == 1
+    assert "b" not in Mid.__ml_props__
+
+
+def test_prop_states_share_their_descriptor(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    Cls.label = "cls"
+    meta_label, cls_label = Meta.__ml_props__["label"], Cls.__ml_props__["label"]
+    assert meta_label is not cls_label
+    assert meta_label.descriptor is cls_label.descriptor
+    assert not hasattr(cls_label, "__dict__")
+    assert Cls.__ml_props__["items"].collection_desc.min_max == (0, math.inf)
+
+
+def test_constraints_given_to_a_prop_are_not_extended():
+    from multilevel_py.clabject_prop import MethodProp
+    constraints = []
+    prop = MethodProp(prop_name="run", steps_to_instantiation=0, steps_from_instantiation=0, constraints=constraints)
+    assert constraints == []
+    assert [constr.name for constr in prop.constraints] == ["can_be_method_constraint"]
+
+
+def test_instantiation_plan_is_cached_until_props_change(build_copy_on_write_clabject):
+    from multilevel_py.core import create_clabject_prop
+    from multilevel_py.constraints import ReInitPropConstr, is_str_constraint
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    plan = Cls.__ml_props__.instantiation_plan({})
+    Cls(name="cow_inst_a", init_props={"level": 1})
+    assert Cls.__ml_props__.instantiation_plan({}) is plan
+    assert Cls.__ml_props__.instantiation_plan({"label": 1}) is not plan
+
+    mutations = [
+        lambda: Cls.add_prop_constraint(prop_name="label", constraint=is_str_constraint),
+        lambda: Cls.adjust_instantiation_speed({"level": 1}),
+        lambda: Cls.require_re_init_on_next_step("label", ReInitPropConstr(del_constr=[], add_constr=[])),
+        lambda: Cls.define_props([create_clabject_prop(n="extra", t=1, f=0, c=[])]),
+        lambda: setattr(Cls, "label", "changed")]
+    for mutate in mutations:
+        plan = Cls.__ml_props__.instantiation_plan({})
+        mutate()
+        assert Cls.__ml_props__.instantiation_plan({}) is not plan
+
+
+def test_compiled_validators_are_cached_until_constraints_change(build_copy_on_write_clabject):
+    from multilevel_py.constraints import PropValueConstraint, ReInitPropConstr, is_str_constraint, is_int_constraint
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    validate = Cls.__ml_props__["label"].validator()
+    assert Cls.__ml_props__["label"].validator() is validate is Meta.__ml_props__["label"].validator()
+    assert [r.name for r in validate(1)] == ["is_of_str"] and validate("label") == ()
+    items = Cls.__ml_props__["items"]
+    assert items.validator(init_only=True) is not items.validator(init_only=False)
+    assert [r.name for r in items.validator(init_only=True)(5)] == ["is_collection"]
+
+    not_empty = PropValueConstraint(name="not_empty", eval_value_func=lambda v: "" if v else "empty", eval_on_init=True)
+    Cls.add_prop_constraint(prop_name="label", constraint=not_empty)
+    assert [r.name for r in Cls.__ml_props__["label"].validator()("")] == ["not_empty"]
+    assert Meta.__ml_props__["label"].validator() is validate
+
+    Cls.require_re_init_on_next_step("label", ReInitPropConstr(del_constr=[is_str_constraint],
+                                                               add_constr=[is_int_constraint]))
+    inst = Cls(name="cow_inst_re_init", init_props={"level": 1, "label": 5})
+    assert [r.name for r in inst.__ml_props__["label"].validator()("")] == ["not_empty", "is_of_int"]
+
+
+def test_cached_plan_reflects_changed_values(build_copy_on_write_clabject):
+    Meta = build_copy_on_write_clabject()
+    Cls = Meta(name="CowCls")
+    Cls(name="cow_inst_a", init_props={"level": 1})
+    Cls.label = "changed"
+    Cls.items.append("cls_item")
+    inst_b = Cls(name="cow_inst_b", init_props={"level": 2})
+    assert inst_b.label == "changed"
+    assert inst_b.items == ["cls_item"]
+
+
+def test_prop_values_are_published_as_class_attributes(build_copy_on_write_clabject):
+    from multilevel_py.core import Clabject, create_clabject_prop
+    Meta = build_copy_on_write_clabject()
+    assert "label" in Meta.__dict__ and "level" in Meta.__dict__
+    Cls = Meta(name="CowCls")
+    Cls.label = "cls"
+    assert (Meta.label, Cls.label) == ("meta", "cls")
+    inst = Cls(name="cow_inst", init_props={"level": 3})
+    assert inst.level == 3 and Cls.level is None
+    inst.items.append("inst_item")
+    assert (inst.items, Cls.items) == (["inst_item"], [])
+
+    Top = Clabject(name="PublishTop")
+    Top.define_props([create_clabject_prop(n="short_lived", t=0, f=0, c=[], v=1)])
+    Low = Top(name="PublishLow")
+    assert "short_lived" not in Low.__dict__
+    assert not hasattr(Low, "short_lived")
+
+
+@pytest.mark.parametrize("copy_policy, copies_before_reads, shared, members_shared", [
+    (None, 1, False, False), ("copy_on_write", 1, False, False), ("copy", 1, False, True), ("share", 0, True, True),
+    ("deepcopy", 6, False, False)])
+def test_copy_policies(copy_policy, copies_before_reads, shared, members_shared):
+    from multilevel_py.core import Clabject, create_clabject_prop
+    from multilevel_py.clabject_prop import track_copies
+    Meta = Clabject(name="CopyPolicyMeta")
+    # params is provided by the caller, so the classes share a copy of it unless it is shared, each class takes a copy
+    # of its own with the deepcopy policy
+    Meta.define_props([
+        create_clabject_prop(n="params", t=0, f='*', i_f=False, v={"reps": [5]}, copy_policy=copy_policy),
+        create_clabject_prop(n="table", t=1, f='*', i_f=False, d={"sets": [3]}, copy_policy=copy_policy)])
+    with track_copies() as report:
+        classes = [Meta(name="CopyPolicyCls" + str(i)) for i in range(3)]
+        assert (report.instantiations, report.copies) == (3, copies_before_reads)
+        assert (report.bytes_per_instantiation > 0) == (copies_before_reads > 0)
+        classes[0].params["reps"].append(8)
+        classes[0].params["rest"] = 60
+        classes[0].table["sets"].append(4)
+    assert ("rest" in Meta.params) == shared
+    assert (Meta.params["reps"] == [5, 8]) == members_shared
+    assert (classes[1].table["sets"] == [3, 4]) == members_shared
+
+
+@pytest.mark.parametrize("copy_policy, shared", [("share", True), ("copy_on_write", False), (None, False)])
+def test_copy_policies_of_collection_props(copy_policy, shared):
+    from multilevel_py.core import Clabject, create_clabject_prop
+    from multilevel_py.clabject_prop import track_copies
+    from multilevel_py.constraints import is_int_constraint
+    from multilevel_py.exceptions import ConstraintViolationException
+    Meta = Clabject(name="CollectionCopyPolicyMeta")
+    Meta.define_props([create_clabject_prop(n="loads", t=1, f='*', i_f=False, d=list(range(1000)),
+                                            coll_desc=(0, math.inf, is_int_constraint), copy_policy=copy_policy)])
+    with track_copies() as report:
+        cls_a, cls_b = Meta(name="CollectionCopyPolicyA"), Meta(name="CollectionCopyPolicyB")
+        # the default is converted to a managed list once, on its definition
+        assert report.copies == 0
+        assert cls_a.__ml_props__["loads"].prop_value is cls_b.__ml_props__["loads"].prop_value
+        cls_a.loads.append(-1)
+        with pytest.raises(ConstraintViolationException):
+            cls_a.loads.append("no int")
+        assert (report.copies, report.bytes_copied > 0) == ((0, False) if shared else (1, True))
+        # reading the mutable value of a new instance copies it unless it is shared
+        assert (Meta(name="CollectionCopyPolicyC").loads[-1] == -1) == shared
+        assert report.copies == (0 if shared else 2)
+        # a plain list is converted to a managed one
+        cls_b.loads = [1, 2]
+        assert report.copies == (1 if shared else 3)
+    assert len(cls_a.loads) == 1001 and len(Meta.__ml_props__["loads"].default_value) == 1000 + shared
+
+
+@pytest.mark.parametrize("copy_policy", [None, "copy_on_write"])
+def test_reading_a_collection_prop_does_not_copy_it_on_later_instantiations(copy_policy):
+    from multilevel_py.core import Clabject, create_clabject_prop
+    from multilevel_py.clabject_prop import track_copies
+    from multilevel_py.constraints import is_int_constraint
+    Meta = Clabject(name="ReadCollectionMeta")
+    Meta.define_props([create_clabject_prop(n="loads", t=0, f='*', i_f=False, v=list(range(1000)),
+                                            coll_desc=(0, math.inf, is_int_constraint), copy_policy=copy_policy)])
+    held_loads = Meta.loads
+    with track_copies() as report:
+        # the classes share a single copy of the value that was read, it is taken on the first instantiation
+        first_cls = Meta(name="ReadCollectionCls")
+        assert report.copies == 1
+        classes = [Meta(name="ReadCollectionCls" + str(i)) for i in range(5)]
+        assert (report.instantiations, report.copies) == (6, 1)
+        # a change of the value that was read requires a new copy
+        held_loads.append(-1)
+        changed_cls = Meta(name="ChangedReadCollectionCls")
+        assert (report.instantiations, report.copies) == (7, 2)
+    assert all(cls.__ml_props__["loads"].prop_value is first_cls.__ml_props__["loads"].prop_value for cls in classes)
+    assert (first_cls.loads[-1], changed_cls.loads[-1]) == (999, -1)
+
+
+def test_invalid_copy_policy():
+    from multilevel_py.core import create_clabject_prop
+    from multilevel_py.exceptions import InvalidCopyPolicyException
+    with pytest.raises(InvalidCopyPolicyException):
+        create_clabject_prop(n="params", t=0, f='*', v={}, copy_policy="clone")
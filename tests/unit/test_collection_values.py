@@ -0,0 +1,189 @@
+import copy
+import pickle
+
+import pytest
+
+from multilevel_py.collection_values import LazyCollection, ManagedList, ManagedSet, ManagedDict
+from multilevel_py.constraints import is_int_constraint, is_str_constraint, PropValueConstraint, validation_mode, \
+    prop_constraint_collection_member_functional, prop_constraint_collection_multiplicity_functional
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import ConstraintViolationException
+
+
+@pytest.fixture
+def build_plan():
+    def builder(default_value):
+        Plan = Clabject(name="ManagedPlan")
+        Plan.define_props([create_clabject_prop(n='loads', t=1, f='*', i_f=False, coll_desc=(0, 3, is_int_constraint),
+                                                d=default_value)])
+        return Plan(name="managed_plan", init_props={})
+    return builder
+
+
+def test_collection_values_are_managed(build_plan):
+    for default_value, managed_type in (([], ManagedList), (set(), ManagedSet), ({}, ManagedDict)):
+        plan = build_plan(default_value)
+        assert type(plan.loads) is managed_type and plan.loads == default_value
+    plan = build_plan([])
+    plan.loads = [1, 2]
+    assert type(plan.loads) is ManagedList and repr(plan.loads) == "[1, 2]"
+    assert repr(build_plan({1}).loads) == "{1}"
+
+
+def test_managed_list_validates_mutations_atomically(build_plan):
+    plan = build_plan([])
+    plan.loads.append(1)
+    plan.loads.extend([2])
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads.extend([3, "four"])
+    assert [r.name for r in ex_info.value.violated_constraints["loads"]] == [
+        "collection_multiplicity_between_0_and_3", "check_is_of_int_on_collection_members"]
+    assert plan.loads == [1, 2]
+    with pytest.raises(ConstraintViolationException):
+        plan.loads[0] = "one"
+    plan.loads.insert(0, 0)
+    # the multiplicity is not checked on init, but mutations may not violate it
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads += [3, 4]
+    assert [r.name for r in ex_info.value.violated_constraints["loads"]] == ["collection_multiplicity_between_0_and_3"]
+    assert plan.loads == [0, 1, 2]
+    del plan.loads[1:3]
+    assert plan.loads.pop() == 0 and plan.loads == []
+
+
+def test_managed_set_and_dict_validate_added_members(build_plan):
+    loads = build_plan(set()).loads
+    loads.update({1, 2}, [2, 3])
+    with pytest.raises(ConstraintViolationException):
+        loads.add("four")
+    with pytest.raises(ConstraintViolationException):
+        loads ^= {1, "four"}
+    loads -= {3}
+    assert loads == {1, 2}
+
+    loads = build_plan({}).loads
+    loads[1] = "kg"
+    loads.update({2: "lb"}, **{})
+    with pytest.raises(ConstraintViolationException):
+        loads["three"] = "kg"
+    with pytest.raises(ConstraintViolationException):
+        loads.update([(3, "kg"), ("four", "kg")])
+    assert loads == {1: "kg", 2: "lb"} and loads.setdefault(1) == "kg"
+
+
+def test_managed_values_check_whole_collection_constraints_and_validation_modes(build_plan):
+    plan = build_plan([])
+    plan.add_prop_constraint(prop_name="loads", constraint=PropValueConstraint(
+        name="ascending", eval_on_init=True,
+        eval_value_func=lambda value: "" if list(value) == sorted(value) else "not ascending"))
+    plan.add_prop_constraint(prop_name="loads",
+                             constraint=prop_constraint_collection_member_functional(is_str_constraint))
+    loads = plan.loads
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        loads.append(-1.5)
+    assert len(ex_info.value.violated_constraints["loads"]) == 2
+    with validation_mode("fail_fast"):
+        with pytest.raises(ConstraintViolationException) as ex_info:
+            loads.append(-1.5)
+    assert len(ex_info.value.violated_constraints["loads"]) == 1
+    assert loads == []
+
+
+def test_managed_values_are_copied_per_clabject(build_plan):
+    plan = build_plan([])
+    plan.loads.append(1)
+    loads = plan.loads
+    assert copy.deepcopy(loads) == [1] and copy.deepcopy(loads)._prop is None
+    assert type(pickle.loads(pickle.dumps(loads))) is list
+    other_plan = plan.instance_of()(name="other_managed_plan", init_props={'loads': loads})
+    assert other_plan.loads == [1] and other_plan.loads is not loads
+    other_plan.loads.append(2)
+    assert loads == [1]
+
+
+def test_managed_values_track_init_checked_multiplicities(build_plan):
+    plan = build_plan([])
+    plan.add_prop_constraint(prop_name="loads", constraint=prop_constraint_collection_multiplicity_functional(
+        0, 2, eval_on_init=True))
+    loads = plan.loads
+    loads.extend([1, 2])
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        loads.append(3)
+    assert ex_info.value.violated_constraints["loads"][0].violation_reason == "The collection holds 3 members"
+    loads[0] = 3
+    assert loads == [3, 2]
+
+
+def test_mutations_may_not_violate_multiplicities_that_are_not_checked_on_init():
+    Plan = Clabject(name="MultiplicityPlan")
+    Plan.define_props([create_clabject_prop(n='loads', t=1, f='*', i_f=False, coll_desc=(2, 3, is_int_constraint))])
+    plan = Plan(name="multiplicity_plan", init_props={'loads': []})
+    # a collection below its minimal multiplicity may grow towards it
+    plan.loads.append(1)
+    plan.loads.extend([2, 3])
+    with pytest.raises(ConstraintViolationException):
+        plan.loads.append(4)
+    plan.loads.remove(3)
+    with pytest.raises(ConstraintViolationException):
+        plan.loads.remove(2)
+    assert plan.loads == [1, 2] and plan.check_prop_constraints(prop_name="loads") == {}
+
+
+def test_shared_values_are_validated_against_the_constraints_of_the_accessing_clabject():
+    Plan = Clabject(name="SharedPlan")
+    Plan.define_props([create_clabject_prop(n='loads', t=1, f='*', i_f=False, d=[1], copy_policy="share",
+                                            coll_desc=(0, 3, is_int_constraint))])
+    plan = Plan(name="shared_plan")
+    plan.add_prop_constraint(prop_name="loads", constraint=prop_constraint_collection_member_functional(
+        PropValueConstraint(name="is_odd", eval_on_init=True,
+                            eval_value_func=lambda value: "" if value % 2 else "even")))
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads.append(2)
+    assert [r.name for r in ex_info.value.violated_constraints["loads"]] == ["check_is_odd_on_collection_members"]
+    plan.loads.append(3)
+    assert Plan.__ml_props__["loads"].default_value == [1, 3]
+
+
+def counted_factory(members):
+    def factory():
+        factory.calls += 1
+        return iter(members)
+    factory.calls = 0
+    return factory
+
+
+def test_lazy_collection_defers_validation_to_iteration(build_plan):
+    plan = build_plan([])
+    factory = counted_factory([1, 2, "three", 4])
+    plan.loads = LazyCollection(factory, chunk_size=2)
+    assert factory.calls == 0 and not plan.loads.validated
+    streamed = []
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        streamed.extend(plan.loads)
+    # the violating chunk is not passed on
+    assert streamed == [1, 2]
+    assert ex_info.value.violated_constraints["loads"][0].name == "check_is_of_int_on_collection_members"
+
+    # the multiplicity is checked on exhaustion, although it is not checked on init
+    plan.loads = LazyCollection(counted_factory(range(4)))
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        plan.loads.finalize()
+    assert ex_info.value.violated_constraints["loads"][0].violation_reason == "The collection holds 4 members"
+    assert not plan.loads.validated
+
+
+def test_lazy_collection_caches_validated_members(build_plan):
+    plan = build_plan([])
+    factory = counted_factory([1, 2, 3])
+    plan.loads = LazyCollection(factory, cache=True)
+    assert plan.loads.finalize().validated
+    assert list(plan.loads) == [1, 2, 3] and factory.calls == 1
+    other_plan = plan.instance_of()(name="other_lazy_plan", init_props={'loads': plan.loads})
+    assert list(other_plan.loads) == [1, 2, 3] and other_plan.loads.validated and factory.calls == 1
+    # cached members are checked again against a changed constraint list
+    plan.add_prop_constraint(prop_name="loads", constraint=prop_constraint_collection_member_functional(
+        is_str_constraint))
+    assert not plan.loads.validated
+    with pytest.raises(ConstraintViolationException):
+        list(plan.loads)
+    assert factory.calls == 2
@@ -1,12 +1,21 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 
 from multilevel_py.constraints import prop_constraint_is_th_order_instance_of_clabject_set_functional, \
-    prop_constraint_collection_member_functional, is_int_constraint, ClabjectStateConstraint
-from multilevel_py.core import Clabject, create_clabject_prop
+    prop_constraint_collection_member_functional, is_int_constraint, ClabjectStateConstraint, \
+    prop_constraint_ml_instance_of_th_order_functional, PropValueConstraint, ConstraintResult, \
+    prop_constraint_and_functional, prop_constraint_or_functional, prop_constraint_optional_value_functional, \
+    is_str_constraint, is_not_negative_int_constraint, EmptyValue, constraint_memo, \
+    prop_constraint_value_in_set_functional, FailFastValidator, prop_constraint_py_isinstance_functional, \
+    LazyReason, validation_mode
+from multilevel_py.core import Clabject, create_clabject_prop, instantiation_order
 from multilevel_py.exceptions import ConstraintViolationException
 
 MetaMeta = Clabject(name="Meta", parents=[], init_props={})
-Meta = MetaMeta(name="Meta", parents=[], init_props={})
+# Meta shares the name of its domain meta on purpose, see test_instantiation_order_from_ancestor_ids
+with pytest.warns(UserWarning, match="The name Meta is already taken"):
+    Meta = MetaMeta(name="Meta", parents=[], init_props={})
 Meta_1 = MetaMeta(name="Meta_1", parents=[], init_props={})
 Meta_2 = MetaMeta(name="Meta_2", parents=[], init_props={})
 Cl_ss = Meta(name="Cl_ss", parents=[], init_props={})
@@ -37,6 +46,51 @@ def test_higher_order_is_instance_of_in_clabject_set_constraint_valid_value(give
     assert constr(given_value) == expected_return
 
 
+def test_instantiation_order_from_ancestor_ids():
+    assert inst_ce.__ancestor_ids__ == tuple(c.__clabject_id__ for c in (inst_ce, Cl_ss, Meta, MetaMeta))
+    assert [instantiation_order(inst_ce, c) for c in (inst_ce, Cl_ss, Meta, MetaMeta)] == [0, 1, 2, 3]
+    assert instantiation_order(inst_ce, Meta_1) is None
+    # MetaMeta and Meta share their name, but not their id
+    assert instantiation_order(Meta, MetaMeta) == 1 and instantiation_order(Meta_1, Meta) is None
+    assert instantiation_order(Meta, inst_ce) is None
+    assert instantiation_order(inst_ce, Clabject) is None
+
+
+def test_instantiation_order_tells_same_named_clabjects_of_other_hierarchies_apart():
+    Shared = Clabject(name="OrderTopA")(name="SharedOrderName")
+    OtherShared = Clabject(name="OrderTopB")(name="SharedOrderName")
+    instance = Shared(name="shared_order_instance")
+    assert Shared != OtherShared and Shared.__clabject_id__ != OtherShared.__clabject_id__
+    assert instantiation_order(instance, Shared) == 1
+    assert instantiation_order(instance, OtherShared) is None
+    assert instantiation_order(OtherShared, Shared) is None
+
+
+@pytest.mark.parametrize(
+    "order, given_value, expected_reason", ([
+        (None, inst_ce, ""),
+        (None, Meta, "Instantiation order of given clabject is to low."),
+        (2, inst_ce, ""),
+        (1, inst_ce, "Instantiation order of given clabject value is to high"),
+        (3, Cl_ss, "Instantiation order of given clabject is to low."),
+        ((1, 2), Cl_ss, ""),
+        ((2, 3), Cl_ss, "Instantiation order of given clabject is to low."),
+        # the 2nd order domain meta of Cl_ss_2 has the name of Meta, but is another clabject
+        (None, Cl_ss_2, "Instantiation order of given clabject value is to high"),
+    ])
+)
+def test_ml_instance_of_th_order_violation_reasons(order, given_value, expected_reason):
+    constr = prop_constraint_ml_instance_of_th_order_functional(Meta, instantiation_order=order)
+    constr(given_value)
+    assert constr.violation_reason == expected_reason
+
+
+def test_ml_instance_of_th_order_membership_is_decided_by_ancestor_ids():
+    # MetaMeta and Meta share their name, only MetaMeta is a domain meta of Cl_ss_2
+    assert prop_constraint_ml_instance_of_th_order_functional(MetaMeta, instantiation_order=2)(Cl_ss_2)
+    assert not prop_constraint_ml_instance_of_th_order_functional(Meta, instantiation_order=2)(Cl_ss_2)
+
+
 @pytest.fixture(scope="module")
 def MetaTgtClab():
     return Clabject(name="MetaTgtClab", parents=[], init_props={})
@@ -124,12 +178,281 @@ def test_invalid_src_clabject_state(MetaSrcClab, MetaTgtClab, clab_state_constr)
     state_constr_at_least_4_arr_members_prop = create_clabject_prop(
         n=clab_state_constr.name, t=2, f='*', c=[], i_sc=True, v=clab_state_constr)
     MetaSrcClab.define_props([state_constr_at_least_4_arr_members_prop])
-    TgtClab = MetaTgtClab(name="TgtClab", parents=[], init_props={})
+    TgtClab = MetaTgtClab(name="StateTgtClab", parents=[], init_props={})
     inst_Tgt_Clab = TgtClab(name="inst_Tgt_Clab")
 
-    SrcClab = MetaSrcClab(name="SrcClab", parents=[], init_props={"int_arr": [123],
+    SrcClab = MetaSrcClab(name="StateSrcClab", parents=[], init_props={"int_arr": [123],
                                                                   "tgt_arr": [inst_Tgt_Clab]})
     assert len(SrcClab.check_state_constraints()) == 0
     inst_Src_Clab = SrcClab(name="inst_src_clab", declare_as_instance=True)
     print(inst_Src_Clab.check_state_constraints())
-    assert "AtLeastThreeArrMembers" in inst_Src_Clab.check_state_constraints().keys()
\ No newline at end of file
+    assert "AtLeastThreeArrMembers" in inst_Src_Clab.check_state_constraints().keys()
+
+
+def test_evaluate_calls_eval_func_once_and_leaves_constraint_untouched():
+    calls = []
+
+    def eval_value_func(value):
+        calls.append(value)
+        return "" if value > 0 else "{V} is not positive".format(V=value)
+
+    constr = PropValueConstraint(name="is_positive", eval_value_func=eval_value_func, eval_on_init=True)
+    result = constr.evaluate(-1)
+    assert result == ConstraintResult(constr, "-1 is not positive")
+    assert not result.ok and result.name == "is_positive" and calls == [-1]
+    assert constr.violation_reason == ""
+    assert constr.evaluate(1).ok and calls == [-1, 1]
+
+
+def test_concurrent_validation_reports_the_reasons_of_each_value(MetaSrcClab):
+    values = [[1, 2, "member_" + str(i)] if i % 2 else [1, 2] for i in range(200)]
+
+    def violation_reasons(value):
+        violations = MetaSrcClab.check_prop_constraints(prop_name="int_arr", potential_value=value, init_only=True)
+        return [c.violation_reason for c in violations["int_arr"]]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        all_reasons = list(executor.map(violation_reasons, values))
+    for i, reasons in enumerate(all_reasons):
+        if i % 2:
+            assert len(reasons) == 1 and "member_" + str(i) + " " in reasons[0]
+        else:
+            assert reasons == []
+
+
+@pytest.fixture
+def counted_constraint():
+    calls = []
+
+    def eval_value_func(value):
+        calls.append(value)
+        return "" if value == "valid" else "counted failed"
+
+    return PropValueConstraint(name="counted", eval_value_func=eval_value_func, eval_on_init=True), calls
+
+
+def test_composed_constraints_are_flattened_and_deduplicated(counted_constraint):
+    counted, calls = counted_constraint
+    nested = prop_constraint_and_functional(prop_constraint_and_functional(counted, is_str_constraint), counted)
+    assert nested.operands == (counted, is_str_constraint, counted)
+    assert nested.name == "counted_And_is_of_str_And_counted"
+    assert nested.eval_value_func("valid") == "" and calls == ["valid"]
+    assert nested.eval_value_func("invalid") == "counted failed" * 2 and calls == ["valid", "invalid"]
+
+    # the counted operand is not evaluated on values of another type
+    assert nested.eval_value_func(1) == "1 is not of the expected type str" and calls == ["valid", "invalid"]
+
+    optional = prop_constraint_optional_value_functional(prop_constraint_optional_value_functional(is_str_constraint))
+    assert optional.name == "is_of_str_OR_Empty_OR_Empty" and optional.eval_value_func(EmptyValue) == ""
+    assert optional.eval_value_func(1) == "1 is not of the expected type str or an EmptyValue or an EmptyValue"
+
+
+def test_composed_constraints_short_circuit_cheap_checks_first(counted_constraint):
+    counted, calls = counted_constraint
+    either = prop_constraint_or_functional(counted, is_str_constraint)
+    assert either.eval_value_func("no counted call") == "" and calls == []
+    assert either.eval_value_func(1) == "counted failed1 is not of the expected type str" and calls == [1]
+    # the type check precedes the comparison, which is skipped for values of another type
+    assert is_not_negative_int_constraint.eval_value_func("abc") == "abc is not of the expected type int"
+    assert is_not_negative_int_constraint.eval_value_func(None) == "None is not of the expected type int"
+    assert not any(is_not_negative_int_constraint.evaluate(value).ok for value in ("abc", None))
+    with validation_mode("fail_fast"):
+        assert is_not_negative_int_constraint.eval_value_func("abc") == "abc is not of the expected type int"
+    assert is_not_negative_int_constraint.eval_value_func(-1) == "The value must not be < 0"
+
+
+@pytest.fixture
+def enabled_constraint_memo():
+    constraint_memo.enable(maxsize=3)
+    try:
+        yield constraint_memo
+    finally:
+        constraint_memo.disable()
+
+
+def test_constraint_memo_is_opt_in():
+    assert constraint_memo.info().maxsize == 0
+    assert is_str_constraint.deterministic and not is_not_negative_int_constraint.deterministic
+
+
+def test_memoised_results_are_bounded_and_keyed_by_type_and_value(enabled_constraint_memo):
+    calls = []
+
+    def eval_value_func(value):
+        calls.append(value)
+        return "" if value == 1 else "not one"
+
+    is_one = PropValueConstraint(name="is_one", eval_value_func=eval_value_func, eval_on_init=True,
+                                 deterministic=True)
+    assert is_one.evaluate(1).ok and is_one.evaluate(1).ok and calls == [1]
+    assert is_one.evaluate(True).ok and is_one.evaluate(1.0).ok and calls == [1, True, 1.0]
+    assert not is_one.evaluate([1]).ok and not is_one.evaluate([1]).ok and calls[-2:] == [[1], [1]]
+    is_one.evaluate(2)
+    is_one.evaluate(1)
+    assert calls[-2:] == [2, 1]
+    assert enabled_constraint_memo.info() == (1, 5, 2, 3, 3)
+
+
+def test_memoised_results_follow_parameters_and_clabject_identity(enabled_constraint_memo):
+    in_set = prop_constraint_value_in_set_functional({"kg", "lb"})
+    assert in_set.evaluate("kg").ok
+    in_set.expected_set = {"lb"}
+    assert in_set.evaluate("kg").violation_reason == "The Value kg is not in the expected set {'lb'}"
+    in_set.expected_set.add("kg")
+    assert in_set.evaluate("kg").ok
+    in_set.expected_set.discard("kg")
+    assert not in_set.evaluate("kg").ok
+
+    # equal to Cl_ss by name, but no instance of Meta
+    same_name = Clabject(name="Cl_ss")
+    instance_of_meta = prop_constraint_ml_instance_of_th_order_functional(Meta, instantiation_order=1)
+    assert instance_of_meta.evaluate(Cl_ss).ok
+    assert not instance_of_meta.evaluate(same_name).ok
+
+
+def test_constraints_cheaper_than_a_lookup_are_not_memoised(enabled_constraint_memo):
+    instance_of_meta = prop_constraint_ml_instance_of_th_order_functional(Meta, instantiation_order=1)
+    for constraint in (is_str_constraint, instance_of_meta):
+        assert constraint.deterministic and not constraint.memoised
+        constraint.evaluate(Cl_ss)
+        constraint.evaluate(Cl_ss)
+    assert enabled_constraint_memo.info() == (0, 0, 0, 3, 0)
+
+
+def test_repeated_clabject_set_checks_are_served_from_the_memo(enabled_constraint_memo):
+    in_clabject_set = prop_constraint_is_th_order_instance_of_clabject_set_functional({Meta, Meta_1})
+    assert in_clabject_set.deterministic
+    assert in_clabject_set.evaluate(Cl_ss).ok and enabled_constraint_memo.info()[:2] == (0, 1)
+    assert in_clabject_set.evaluate(Cl_ss).ok and enabled_constraint_memo.info()[:2] == (1, 1)
+    assert not in_clabject_set.evaluate(inst_ce).ok and enabled_constraint_memo.info()[:2] == (1, 2)
+
+
+def test_fail_fast_validators_evaluate_frequently_failing_checks_first(counted_constraint):
+    counted, calls = counted_constraint
+    validate = FailFastValidator([counted, is_str_constraint])
+    assert [r.name for r in validate(1)] == ["counted"] and calls == [1]
+    for _ in range(FailFastValidator.reorder_interval - 2):
+        validate(2)
+    assert validate.constraints == [counted, is_str_constraint]
+    # the next call reorders before evaluating
+    del calls[:]
+    assert [r.name for r in validate(3)] == ["is_of_str"] and calls == []
+    assert validate.constraints == [is_str_constraint, counted]
+    assert counted.stats.evaluations == FailFastValidator.reorder_interval - 1
+    assert is_str_constraint.stats.failures >= 1 and is_str_constraint.stats.timed_evaluations >= 1
+
+
+def test_fail_fast_validators_reorder_by_failure_rate():
+    calls = []
+    counted = PropValueConstraint(name="counted", eval_value_func=lambda value: calls.append(value) or "",
+                                  eval_on_init=True)
+    # a fresh constraint, the statistics of the shared ones depend on the other tests
+    is_str = prop_constraint_py_isinstance_functional(str)
+    validate = FailFastValidator([counted, is_str])
+    assert [r.name for r in validate(1)] == ["is_of_str"] and calls == [1]
+    for _ in range(FailFastValidator.reorder_interval - 2):
+        validate(2)
+    assert validate.constraints == [counted, is_str]
+    # the next call reorders before evaluating
+    del calls[:]
+    assert [r.name for r in validate(3)] == ["is_of_str"] and calls == []
+    assert validate.constraints == [is_str, counted]
+    assert counted.stats.evaluations == FailFastValidator.reorder_interval - 1
+    assert is_str.stats.failures == FailFastValidator.reorder_interval
+    assert counted.stats.failures == 0 and is_str.stats.timed_evaluations >= 1
+    assert validate("valid") == () and calls == ["valid"]
+
+
+def test_fail_fast_prop_checks_report_one_violation():
+    Load = Clabject(name="FailFastLoad")
+    Load.define_props([create_clabject_prop(n='reps', t=1, f='*', c=[is_str_constraint, is_int_constraint]),
+                       create_clabject_prop(n='sets', t=1, f='*', c=[is_int_constraint])])
+    violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0)
+    assert [r.name for r in violations["reps"]] == ["is_of_str", "is_of_int"]
+    with pytest.warns(DeprecationWarning):
+        violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0, fail_fast=True)
+    assert len(violations["reps"]) == 1
+
+
+def test_fail_fast_is_a_deprecated_alias_of_the_validation_mode():
+    Load = Clabject(name="FailFastAliasLoad")
+    Load.define_props([create_clabject_prop(n='reps', t=1, f='*', c=[is_str_constraint, is_int_constraint])])
+    with pytest.warns(DeprecationWarning), validation_mode("fail_fast"):
+        violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0, fail_fast=False)
+    assert len(violations["reps"]) == 2
+    with pytest.warns(DeprecationWarning):
+        violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0, fail_fast=True,
+                                                 validation="fail_fast")
+    assert len(violations["reps"]) == 1
+    with pytest.warns(DeprecationWarning), pytest.raises(ValueError):
+        Load.check_prop_constraints(prop_name="reps", potential_value=1.0, fail_fast=True, validation="collect_all")
+
+
+def test_fail_fast_validation_mode_reports_one_prop_violation():
+    Load = Clabject(name="FailFastModeLoad")
+    Load.define_props([create_clabject_prop(n='reps', t=1, f='*', c=[is_str_constraint, is_int_constraint])])
+    violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0, validation="fail_fast")
+    assert len(violations["reps"]) == 1
+    with validation_mode("fail_fast"):
+        assert len(Load.check_prop_constraints(prop_name="reps", potential_value=1.0)["reps"]) == 1
+        violations = Load.check_prop_constraints(prop_name="reps", potential_value=1.0, validation="collect_all")
+        assert len(violations["reps"]) == 2
+
+
+def test_violation_reasons_are_formatted_when_rendered():
+    rendered = []
+
+    class Load:
+        def __str__(self):
+            rendered.append(self)
+            return "load"
+
+    load = Load()
+    collection_reason = prop_constraint_collection_member_functional(is_str_constraint).eval_value_func(["kg", load])
+    reason = is_int_constraint.eval_value_func(load)
+    assert isinstance(reason, LazyReason) and reason and rendered == []
+    assert reason == "load is not of the expected type int" and rendered == [load]
+    assert "expected type" in reason and reason + "!" == "load is not of the expected type int!"
+    assert collection_reason == "Member load failed for reason: load is not of the expected type str\n"
+    with pytest.raises(ConstraintViolationException, match="for reason 'load is not of the expected type int'"):
+        raise ConstraintViolationException({"load": [is_int_constraint.evaluate(load)]})
+
+
+def eval_even_value_func(value) -> str:
+    return "" if value % 2 == 0 else "The value must be even"
+
+
+is_even_constraint = PropValueConstraint(name="is_even", eval_value_func=eval_even_value_func, eval_on_init=True)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super(RecordingExecutor, self).__init__(max_workers=4)
+        self.chunk_sizes = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.chunk_sizes.append(len(args[-1]))
+        return super(RecordingExecutor, self).submit(fn, *args, **kwargs)
+
+
+def test_chunked_member_evaluation_keeps_the_order_of_the_sequential_report():
+    members = list(range(0, 100, 3))
+    sequential = prop_constraint_collection_member_functional(is_even_constraint)
+    with RecordingExecutor() as executor:
+        chunked = prop_constraint_collection_member_functional(is_even_constraint, executor=executor, chunk_size=10,
+                                                               parallel_threshold=20)
+        assert chunked.evaluate(members).violation_reason == sequential.evaluate(members).violation_reason
+        assert executor.chunk_sizes == [10, 10, 10, 4]
+        # below the threshold, the members are evaluated sequentially
+        assert chunked.evaluate(members[:19]).violation_reason == sequential.evaluate(members[:19]).violation_reason
+        assert executor.chunk_sizes == [10, 10, 10, 4]
+        assert chunked.evaluate(list(range(0, 100, 2))).ok
+
+
+def test_chunked_member_evaluation_on_a_process_pool():
+    members = list(range(50))
+    sequential = prop_constraint_collection_member_functional(is_even_constraint)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        chunked = prop_constraint_collection_member_functional(is_even_constraint, executor=executor, chunk_size=16,
+                                                               parallel_threshold=0)
+        assert chunked.evaluate(members).violation_reason == sequential.evaluate(members).violation_reason
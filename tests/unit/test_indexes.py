@@ -0,0 +1,80 @@
+import gc
+from datetime import timedelta
+
+import pytest
+
+from multilevel_py.constraints import is_float_constraint, is_str_constraint, is_timedelta_constraint
+from multilevel_py.core import Clabject, create_clabject_prop
+from multilevel_py.exceptions import InvalidIndexKindException, InvalidQueryLookupException
+
+
+@pytest.fixture(scope="module")
+def build_weight_loads():
+    def builder(index_kind=None):
+        WeightLoad = Clabject(name="IndexedWeightLoad")
+        WeightLoad.define_props([
+            create_clabject_prop(n='unit', t=1, f='*', i_f=True, c=[is_str_constraint]),
+            create_clabject_prop(n='planned_value', t=1, f='*', i_f=False, c=[is_float_constraint]),
+            create_clabject_prop(n='rest', t=1, f='*', i_f=False, c=[is_timedelta_constraint]),
+            create_clabject_prop(n='actual_value', t=2, f='*', i_f=False, c=[is_float_constraint])])
+        if index_kind:
+            WeightLoad.create_index("planned_value", kind=index_kind)
+            WeightLoad.create_index("unit")
+        loads = [WeightLoad(name="IndexedLoad" + str(i),
+                            init_props={'unit': "kg" if i % 2 else "lb", 'planned_value': 100.0 + 20 * i,
+                                        'rest': timedelta(seconds=60 * i)}) for i in range(5)]
+        return WeightLoad, loads
+    return builder
+
+
+@pytest.mark.parametrize("index_kind", [None, "hash", "sorted"])
+def test_query_finds_the_same_descendants_with_and_without_index(build_weight_loads, index_kind):
+    WeightLoad, loads = build_weight_loads(index_kind)
+    assert WeightLoad.query(unit="kg") == [loads[1], loads[3]]
+    assert WeightLoad.query(planned_value=140.0) == [loads[2]]
+    assert set(WeightLoad.query(planned_value__in=[100.0, 180.0])) == {loads[0], loads[4]}
+    assert sorted(WeightLoad.query(planned_value__gt=130.0, unit="kg"), key=str) == [loads[3]]
+    assert sorted(WeightLoad.query(planned_value__lte=120.0), key=str) == [loads[0], loads[1]]
+    assert WeightLoad.query(planned_value__gt=110.0, planned_value__lt=150.0) == [loads[1], loads[2]]
+    assert WeightLoad.query(rest__gte=timedelta(minutes=3)) == [loads[3], loads[4]]
+    assert WeightLoad.query(unit__in=["kg"], order=2) == []
+
+
+def test_indexes_follow_assignments_and_instantiation(build_weight_loads):
+    WeightLoad, loads = build_weight_loads("sorted")
+    loads[0].planned_value = 300.0
+    assert WeightLoad.query(planned_value__gt=250.0) == [loads[0]]
+    realised = loads[0](name="RealisedIndexedLoad", init_props={'actual_value': 290.0}, lightweight=True)
+    assert WeightLoad.query(planned_value__gt=250.0, order=2) == [realised]
+    assert WeightLoad.query(planned_value__gt=250.0) == [loads[0], realised]
+    assert loads[0].query(actual_value__lt=295.0) == [realised]
+
+    WeightLoad.retain_instances = False
+    transient = WeightLoad(name="TransientIndexedLoad", init_props={'unit': "kg", 'planned_value': 500.0,
+                                                                   'rest': timedelta(0)})
+    assert WeightLoad.query(planned_value__gt=400.0) == [transient]
+    del transient
+    gc.collect()
+    assert WeightLoad.query(planned_value__gt=400.0) == []
+
+
+def test_query_follows_prop_paths():
+    Exercise = Clabject(name="IndexedExercise")
+    Exercise.define_props([create_clabject_prop(n='load', t=1, f='*', i_assoc=True, c=[])])
+    WeightLoad = Clabject(name="PathWeightLoad")
+    WeightLoad.define_props([create_clabject_prop(n='planned_value', t=1, f='*', c=[is_float_constraint])])
+    light = WeightLoad(name="Light", init_props={'planned_value': 50.0})
+    heavy = WeightLoad(name="Heavy", init_props={'planned_value': 200.0})
+    Exercise.create_index("load")
+    squat = Exercise(name="Squat", init_props={'load': heavy})
+    curl = Exercise(name="Curl", init_props={'load': light})
+    assert Exercise.query(load__planned_value__gt=150.0) == [squat]
+    assert Exercise.query(load=light) == [curl]
+
+
+def test_invalid_index_and_lookup(build_weight_loads):
+    WeightLoad, _ = build_weight_loads()
+    with pytest.raises(InvalidIndexKindException):
+        WeightLoad.create_index("unit", kind="btree")
+    with pytest.raises(InvalidQueryLookupException):
+        WeightLoad.query(unit____gt="kg")
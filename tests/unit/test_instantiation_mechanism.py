@@ -1,12 +1,19 @@
-from multilevel_py.core import Clabject
+from multilevel_py.core import Clabject, MetaClabject, is_clabject, create_clabject_prop, delete_subtree, lookup, \
+    name_registry
 from multilevel_py.clabject_prop import SimpleProp, MethodProp
 from types import FunctionType
 from multilevel_py.exceptions import UninitialisedPropException, UnduePropInstantiationException, UndefinedPropsException, \
-    ConstraintViolationException, ChangeFinalPropException, NotAClabjectException, ClabjectDeclaredAsInstanceException
+    ConstraintViolationException, ChangeFinalPropException, NotAClabjectException, ClabjectDeclaredAsInstanceException, \
+    LightweightInstanceParentsException, DuplicateClabjectNameException, InvalidValidationModeException
 from multilevel_py.constraints import is_str_constraint, is_int_constraint, is_function_constraint, \
-    prop_constraint_ml_instance_of_th_order_functional
+    prop_constraint_ml_instance_of_th_order_functional, validation_mode, ClabjectStateConstraint, \
+    is_not_negative_constraint
+from multilevel_py.registry import ClabjectIdSet
 import pytest
 import math
+import gc
+import pickle
+import warnings
 
 # Underlying Schema of First Instantiation Hierarchy
 # Meta_meta
@@ -113,8 +120,8 @@ def test_valid_meta_meta_instantiation(build_Meta_meta):
 
 @pytest.fixture(scope="module")
 def build_Meta(build_Meta_meta):
-    def builder():
-        Meta_meta = build_Meta_meta()
+    def builder(Meta_meta=None):
+        Meta_meta = Meta_meta or build_Meta_meta()
         Meta = Meta_meta(name="Meta", parents=[], init_props={'b': 'valid_string', 'c':123})
         return Meta
     return builder
@@ -173,8 +180,8 @@ def test_valid_meta_instantiation(build_Meta):
 
 @pytest.fixture(scope="module")
 def build_Cl_ss(build_Meta):
-    def builder():
-        Meta = build_Meta()
+    def builder(Meta=None):
+        Meta = Meta or build_Meta()
         Cl_ss = Meta(name="Cl_ss", parents=[], init_props={'d': lambda x: ("Hello " + str(x))})
         return Cl_ss
 
@@ -197,6 +204,15 @@ def test_b_disappeared_in_Cl_ss_props(build_Cl_ss):
         print(Cl_ss.b)
 
 
+def test_structural_exceptions_keep_their_fields():
+    ex = UnduePropInstantiationException(prop_name="c", later_steps_number=2)
+    assert (ex.prop_name, ex.later_steps_number) == ("c", 2)
+    assert str(ex) == "Propery c is not due to be instantiated. It's has to be instantiated at 2."
+    for ex in (ex, UninitialisedPropException(prop_name="c"), ChangeFinalPropException(prop_name="c"),
+               UndefinedPropsException(undefined_props={"c"})):
+        assert str(pickle.loads(pickle.dumps(ex))) == str(ex)
+
+
 @pytest.mark.depends(on=['test_valid_meta_instantiation'])
 @pytest.mark.parametrize(
     ("init_props", "expected_exception"), ([
@@ -223,9 +239,9 @@ def test_valid_cl_ss_instantiation(build_Cl_ss):
 
 @pytest.fixture(scope="module")
 def build_inst_nce(build_Cl_ss):
-    def builder():
-        Cl_ss = build_Cl_ss()
-        inst_nce = Cl_ss(name="Instance",  init_props={'e': 'Finally reached Instance Level'}, declare_as_instance=True)
+    def builder(Cl_ss=None, name="Instance"):
+        Cl_ss = Cl_ss or build_Cl_ss()
+        inst_nce = Cl_ss(name=name,  init_props={'e': 'Finally reached Instance Level'}, declare_as_instance=True)
         return inst_nce
 
     return builder
@@ -239,10 +255,10 @@ def test_instantiate_instance_raise_exception(build_inst_nce):
 
 @pytest.mark.depends(on=['test_valid_cl_ss_instantiation'])
 def test_instance_of_chain(build_Meta_meta, build_Meta, build_Cl_ss, build_inst_nce):
-    inst_nce = build_inst_nce()
-    Cl_ss = build_Cl_ss()
-    Meta = build_Meta()
     Meta_meta = build_Meta_meta()
+    Meta = build_Meta(Meta_meta)
+    Cl_ss = build_Cl_ss(Meta)
+    inst_nce = build_inst_nce(Cl_ss)
 
     # test homogenous use of instance_of
     assert inst_nce.instance_of() == Cl_ss
@@ -298,9 +314,9 @@ def test_instance_of_chain(build_Meta_meta, build_Meta, build_Cl_ss, build_inst_
 #       z = inst_nce
 
 @pytest.fixture(scope="module")
-def build_MM_3(build_Meta_meta, build_Cl_ss):
+def build_MM_3(build_Meta_meta, build_Meta, build_Cl_ss):
     Meta_meta = build_Meta_meta()
-    Cl_ss = build_Cl_ss()
+    Cl_ss = build_Cl_ss(build_Meta(Meta_meta))
 
     def builder(prop_o=Cl_ss):
         MM_3 = Clabject(name="MM_3", parents=[], init_props={})
@@ -337,17 +353,23 @@ def test_build_mm3_with_invalid_prop_o_as_given_value_is_no_member_of_inst_chain
 
 
 def test_build_mm3_with_invalid_prop_o_fails_due_to_too_many_instant_steps(build_MM_3, build_inst_nce):
+    inst_ce = build_inst_nce(build_MM_3().o, name="too_many_steps_instance")
     with pytest.raises(ConstraintViolationException):
-        inst_ce = build_inst_nce()
         MM_3 = build_MM_3(prop_o=inst_ce)
 
 
-def test_build_mm3_with_invalid_prop_o_fails_due_to_too_few_instant_steps(build_MM_3, build_Meta):
+def test_build_mm3_with_invalid_prop_o_fails_due_to_too_few_instant_steps(build_MM_3):
+    Meta = build_MM_3().o.instance_of()
     with pytest.raises(ConstraintViolationException):
-        Meta = build_Meta()
         MM_3 = build_MM_3(prop_o=Meta)
 
 
+def test_build_mm3_with_invalid_prop_o_of_another_hierarchy(build_MM_3, build_Cl_ss):
+    # a clabject of the same name in another hierarchy is no instance of the expected clabject
+    with pytest.raises(ConstraintViolationException):
+        MM_3 = build_MM_3(prop_o=build_Cl_ss())
+
+
 def test_build_valid_mm3(build_MM_3):
     MM_3 = build_MM_3()
     assert MM_3.o.__name__ == "Cl_ss"
@@ -400,7 +422,7 @@ def build_M2_A(build_MM_3, build_Meta_meta):
         def manipulate_i_by_factor_x(obj, x):
             obj.i = obj.i * x
         M2_A = MM_3(name="M2_A", parents=[], init_props={'i': 333, 'm': manipulate_i_by_factor_x})
-        Meta_meta = build_Meta_meta()
+        Meta_meta = MM_3.o.instance_of().instance_of()
         any_order_instance_of_Meta_meta_constraint = prop_constraint_ml_instance_of_th_order_functional(Meta_meta)
         z_prop = SimpleProp(prop_name="z",
                             steps_to_instantiation=2,
@@ -460,7 +482,7 @@ def test_build_i_0_with_invalid_props_fails(build_C1, init_props, expected_excep
 
 def test_build_i_0_with_valid_prop(build_C1, build_inst_nce):
     C1 = build_C1()
-    inst_nce = build_inst_nce()
+    inst_nce = build_inst_nce(C1.o, name="i_0_instance")
     i_0 = C1(name="i_0", init_props={'z': inst_nce})
     assert i_0.i == 100
     assert i_0.z.e == "Finally reached Instance Level"
@@ -541,3 +563,297 @@ def test_build_Meta_C_with_inheritance(build_Meta_meta):
     assert inst_ce.get_probC() == 999
     assert inst_ce.get_probE() == "Finally reached instance level"
 
+
+
+# Lightweight instances
+def test_lightweight_instance_behaves_like_declared_instance(build_C1):
+    C1 = build_C1()
+    Cl_ss = C1.o
+    inst_nce = Cl_ss(name="Lightweight", init_props={'e': "Finally reached Instance Level"}, lightweight=True)
+    assert type(inst_nce) is not MetaClabject and is_clabject(inst_nce)
+    assert inst_nce.instance_of() == Cl_ss
+    assert str(inst_nce) == "lightweight"
+    assert inst_nce.a == "MetaMetaProp"
+    assert inst_nce.d("World") == "Hello World"
+    assert inst_nce.e == "Finally reached Instance Level"
+    with pytest.raises(UndefinedPropsException):
+        print(inst_nce.b)
+    with pytest.raises(ChangeFinalPropException):
+        inst_nce.e = "Changed"
+    with pytest.raises(ClabjectDeclaredAsInstanceException):
+        inst_nce(name="further_instance", init_props={})
+
+    # ml instance of constraints accept lightweight instances
+    i_0 = C1(name="i_0", init_props={'z': inst_nce})
+    assert i_0.z.e == "Finally reached Instance Level"
+
+
+def test_lightweight_instance_binds_method_props(build_C1, build_inst_nce):
+    C1 = build_C1()
+    i_0 = C1(name="i_0", init_props={"z": build_inst_nce(C1.o, name="lightweight_i_0_instance")}, lightweight=True)
+    i_0.m(x=3)
+    assert i_0.i == 300
+    assert C1.i == 100
+    with pytest.raises(ConstraintViolationException):
+        i_0.i = "not an int"
+
+
+def test_lightweight_instance_can_not_inherit(build_Cl_ss):
+    Cl_ss = build_Cl_ss()
+    with pytest.raises(LightweightInstanceParentsException):
+        Cl_ss(name="Lightweight", parents=[AnotherParentClass], init_props={'e': "Instance"}, lightweight=True)
+
+
+# Bulk instantiation
+def test_instantiate_many_creates_a_clabject_per_row(build_Cl_ss):
+    Cl_ss = build_Cl_ss()
+    rows = [{'e': "first"}, {'e': "second"}]
+    instances, violation_report = Cl_ss.instantiate_many(rows, names=["first", "second"], declare_as_instance=True)
+    assert violation_report == {}
+    assert [inst.e for inst in instances] == ["first", "second"]
+    assert [inst.__name__ for inst in instances] == ["first", "second"]
+    assert all(inst.instance_of() == Cl_ss and inst.declared_instance_flag for inst in instances)
+    instances, _ = Cl_ss.instantiate_many(rows, lightweight=True)
+    assert [str(inst) for inst in instances] == ["cl_ss_0", "cl_ss_1"]
+    # default names are not repeated by later calls
+    instances, _ = Cl_ss.instantiate_many(rows, lightweight=True)
+    assert [str(inst) for inst in instances] == ["cl_ss_2", "cl_ss_3"]
+    with pytest.raises(ValueError):
+        Cl_ss.instantiate_many(rows, names=["third"])
+
+
+def test_instantiate_many_aborts_on_first_invalid_row(build_Cl_ss):
+    Cl_ss = build_Cl_ss()
+    number_of_instances = len(Cl_ss.instances)
+    with pytest.raises(UninitialisedPropException):
+        Cl_ss.instantiate_many([{'e': "valid"}, {}, {'e': 123}])
+    assert len(Cl_ss.instances) == number_of_instances
+
+
+def test_instantiate_many_collects_all_invalid_rows(build_Cl_ss):
+    Cl_ss = build_Cl_ss()
+    rows = [{'e': 123}, {'e': "valid"}, {}, {'e': 456}, {'not_existing_prop': 1, 'e': "valid"}]
+    instances, violation_report = Cl_ss.instantiate_many(rows, collect_all=True)
+    assert [inst is not None for inst in instances] == [False, True, False, False, False]
+    assert instances[1].e == "valid"
+    assert list(violation_report) == [0, 2, 3, 4]
+    assert isinstance(violation_report[0], ConstraintViolationException)
+    assert isinstance(violation_report[2], UninitialisedPropException)
+    assert isinstance(violation_report[4], UndefinedPropsException)
+    # each row keeps its own violation reason
+    reasons = [violation_report[i].violated_constraints['e'][0].violation_reason for i in (0, 3)]
+    assert "123" in reasons[0] and "456" in reasons[1]
+
+
+# Instance registry
+def test_instances_are_released_unless_retained(build_Cl_ss):
+    Cl_ss = build_Cl_ss()
+    # hierarchies keep their instances alive unless they opt out
+    assert Cl_ss.retain_instances
+    retained = Cl_ss(name="retained", init_props={'e': "retained"}, speed_adjustments={'e': 0})
+    Cl_ss(name="kept_alive", init_props={'e': "kept alive"})
+    Cl_ss.retain_instances = False
+    transient = Cl_ss(name="transient", init_props={'e': "transient"}, speed_adjustments={'e': 0})
+    # lightweight instances are released as soon as their last reference is gone
+    Cl_ss(name="lightweight", init_props={'e': "transient"}, lightweight=True)
+    assert [inst.__name__ for inst in Cl_ss.instances] == ["retained", "kept_alive", "transient"]
+    assert Cl_ss.instances[0] is retained and Cl_ss.instances[-1] is transient
+    assert [inst.__name__ for inst in Cl_ss.instances[1:]] == ["kept_alive", "transient"]
+    with pytest.raises(IndexError):
+        Cl_ss.instances[3]
+    del transient
+    gc.collect()
+    assert [inst.__name__ for inst in Cl_ss.instances] == ["retained", "kept_alive"]
+    assert list(Cl_ss.speed_adjustments) == ["retained"]
+    assert retained in Cl_ss.instances
+
+
+def test_retaining_instances_is_inherited():
+    Top = Clabject(name="RetainingTop")
+    Top(name="RetainedMiddle")(name="retained_leaf", lightweight=True)
+    ReleasingTop = Clabject(name="ReleasingTop")
+    ReleasingTop.retain_instances = False
+    ReleasingTop(name="ReleasedMiddle")
+    gc.collect()
+    assert [leaf.__name__ for middle in Top.instances for leaf in middle.instances] == ["retained_leaf"]
+    assert len(ReleasingTop.instances) == 0
+
+
+def test_delete_subtree_reports_dangling_associations():
+    Model = Clabject(name="Model")
+    Model.define_props([
+        create_clabject_prop(n="partner", t=1, f='*', i_assoc=True, c=[]),
+        create_clabject_prop(n="members", t=1, f='*', coll_desc=(0, math.inf, None), c=[])])
+    Deleted = Model(name="Deleted", init_props={"partner": Model, "members": []}, speed_adjustments={"partner": 0})
+    deleted_instance = Deleted(name="DeletedInstance", init_props={})
+    Holder = Model(name="Holder", init_props={"partner": Deleted, "members": [deleted_instance, Deleted]})
+
+    dangling = delete_subtree(Deleted)
+    assert list(Model.instances) == [Holder]
+    assert Model.speed_adjustments == {}
+    assert len(Deleted.instances) == 0
+    assert [(d.holder, d.prop_name, d.target) for d in dangling] == [
+        (Holder, "partner", Deleted), (Holder, "members", deleted_instance), (Holder, "members", Deleted)]
+
+
+# Clabject ids
+def test_clabject_ids_are_unique_and_consistent_with_equality(build_Cl_ss):
+    Cl_ss, other_Cl_ss = build_Cl_ss(), build_Cl_ss()
+    assert Cl_ss is not other_Cl_ss and Cl_ss.__clabject_id__ < other_Cl_ss.__clabject_id__
+    # clabjects of the same name are different clabjects, see MetaClabject.__eq__
+    assert Cl_ss != other_Cl_ss and Cl_ss == Cl_ss
+    first = Cl_ss(name="first_id_test_instance", init_props={'e': "first"}, declare_as_instance=True)
+    second = Cl_ss(name="second_id_test_instance", init_props={'e': "second"}, lightweight=True)
+    same_name = other_Cl_ss(name="first_id_test_instance", init_props={'e': "first"}, lightweight=True)
+    assert Cl_ss.__clabject_id__ < first.__clabject_id__ < second.__clabject_id__ < same_name.__clabject_id__
+    assert first != same_name and first != second and hash(first) == hash(first.__clabject_id__)
+
+    id_set = ClabjectIdSet([Cl_ss, first, same_name])
+    assert len(id_set) == 3 and other_Cl_ss not in id_set and second not in id_set and "Cl_ss" not in id_set
+    assert (id_set | ClabjectIdSet([second])).ids == {Cl_ss.__clabject_id__, first.__clabject_id__,
+                                                      same_name.__clabject_id__, second.__clabject_id__}
+    assert list(id_set & ClabjectIdSet([same_name, second])) == [same_name]
+    assert sorted(c.__clabject_id__ for c in id_set - ClabjectIdSet([first])) == [Cl_ss.__clabject_id__,
+                                                                                 same_name.__clabject_id__]
+
+
+# Descendant index
+def test_descendants_by_order():
+    MM_3 = Clabject(name="MM_3_descendants")
+    M2 = MM_3(name="M2_descendants")
+    other_M2 = MM_3(name="other_M2_descendants")
+    C1 = M2(name="C1_descendants")
+    C2 = other_M2(name="C2_descendants")
+    MM_3.retain_instances = M2.retain_instances = other_M2.retain_instances = False
+    transient = other_M2(name="transient_descendant")
+
+    assert MM_3.descendants(order=1) == [M2, other_M2]
+    assert MM_3.descendants(order=2) == [C1, C2, transient]
+    assert MM_3.descendants() == [M2, other_M2, C1, C2, transient]
+    assert MM_3.count_descendants() == 5 and MM_3.count_descendants(order=2) == 3
+    assert MM_3.descendants(order=3) == [] and C1.descendants() == [] and C1.count_descendants() == 0
+
+    del transient
+    gc.collect()
+    assert MM_3.count_descendants(order=2) == 2
+    delete_subtree(other_M2)
+    assert MM_3.descendants() == [M2, C1]
+
+
+# Name registry
+def test_lookup_by_name_and_namespace():
+    Top = Clabject(name="Top_lookup")
+    Middle = Top(name="Middle_lookup")
+    leaf = Middle(name="leaf_lookup", lightweight=True)
+    OtherTop = Clabject(name="OtherTop_lookup")
+    OtherTop.retain_instances = False
+    other_leaf = OtherTop(name="leaf_lookup", lightweight=True)
+    assert lookup("Top_lookup") is Top and lookup("Middle_lookup", namespace=Top) is Middle
+    assert lookup("leaf_lookup", namespace="Top_lookup") is leaf
+    assert lookup("leaf_lookup", namespace=OtherTop) is other_leaf and lookup("leaf_lookup") is other_leaf
+    assert lookup("Middle_lookup", namespace=OtherTop) is None
+
+    delete_subtree(Middle)
+    assert lookup("Middle_lookup") is None and lookup("leaf_lookup", namespace=Top) is None
+    assert lookup("leaf_lookup", namespace=OtherTop) is other_leaf
+    del other_leaf
+    gc.collect()
+    assert lookup("leaf_lookup") is None
+
+
+def test_duplicate_name_policies():
+    Top = Clabject(name="Top_duplicates")
+    taken = Top(name="taken_duplicate")
+    assert name_registry.on_duplicate == "warn"
+    try:
+        with pytest.warns(UserWarning, match="taken_duplicate"):
+            replacement = Top(name="taken_duplicate", lightweight=True)
+        assert lookup("taken_duplicate", namespace=Top) is replacement and taken in Top.instances
+        name_registry.on_duplicate = "raise"
+        with pytest.raises(DuplicateClabjectNameException):
+            Top(name="taken_duplicate")
+        with pytest.raises(DuplicateClabjectNameException):
+            Top.instantiate_many([{}, {}], names=["fresh_duplicate", "fresh_duplicate"])
+        assert lookup("fresh_duplicate") is None
+        Clabject(name="taken_duplicate")
+        with pytest.raises(ValueError):
+            name_registry.on_duplicate = "ignore"
+        name_registry.on_duplicate = "replace"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Top(name="taken_duplicate", lightweight=True)
+    finally:
+        name_registry.on_duplicate = "warn"
+
+
+def test_duplicate_names_ignore_other_and_released_hierarchies():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # the namespaces are the roots themselves, not their names
+        Top, other_Top = Clabject(name="Top_released"), Clabject(name="Top_released")
+        Top.retain_instances = False
+        Top(name="shared_released")
+        kept = other_Top(name="shared_released")
+        assert lookup("shared_released", namespace=Top) is not kept
+        assert lookup("shared_released", namespace="Top_released") is kept
+        # the first instance is released, but part of a reference cycle that is not collected yet
+        Top(name="shared_released")
+
+
+# Validation modes
+@pytest.fixture
+def build_validated_load():
+    Load = Clabject(name="ValidatedLoad")
+    Load.define_props([create_clabject_prop(n='unit', t=1, f='*', c=[is_str_constraint]),
+                       create_clabject_prop(n='reps', t=1, f='*', i_f=False,
+                                            c=[is_int_constraint, is_not_negative_constraint])])
+    return Load
+
+
+def violation_count(ex_info) -> int:
+    return sum(len(violations) for violations in ex_info.value.violated_constraints.values())
+
+
+def test_instantiation_validation_modes(build_validated_load):
+    Load = build_validated_load
+    invalid_props = {'unit': 1, 'reps': -1.5}
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        Load(name="collected_load", init_props=invalid_props)
+    assert violation_count(ex_info) == 3
+    with pytest.raises(ConstraintViolationException) as ex_info:
+        Load(name="failed_load", init_props=invalid_props, validation="fail_fast", lightweight=True)
+    assert violation_count(ex_info) == 1
+    with validation_mode("fail_fast"):
+        with pytest.raises(ConstraintViolationException) as ex_info:
+            Load(name="failed_load", init_props=invalid_props)
+        assert violation_count(ex_info) == 1
+        # explicit modes take precedence over the context
+        with pytest.raises(ConstraintViolationException) as ex_info:
+            Load(name="collected_load", init_props=invalid_props, validation="collect_all")
+        assert violation_count(ex_info) == 3
+        _, report = Load.instantiate_many([invalid_props, {'unit': "kg", 'reps': 8}], collect_all=True)
+        assert list(report) == [0] and sum(len(v) for v in report[0].violated_constraints.values()) == 1
+    with pytest.raises(InvalidValidationModeException):
+        Load(name="invalid_mode_load", init_props=invalid_props, validation="lenient")
+
+
+def test_assignment_and_check_validation_modes(build_validated_load):
+    Load = build_validated_load
+    load = Load(name="assigned_load", init_props={'unit': "kg", 'reps': 8})
+    with validation_mode("fail_fast"):
+        with pytest.raises(ConstraintViolationException) as ex_info:
+            load.reps = -1.5
+        assert violation_count(ex_info) == 1
+        assert len(Load.check_prop_constraints(prop_name="reps", potential_value=-1.5)["reps"]) == 1
+        assert len(Load.check_prop_constraints(prop_name="reps", potential_value=-1.5,
+                                               validation="collect_all")["reps"]) == 2
+        with pytest.raises(ConstraintViolationException) as ex_info:
+            Load.define_props([create_clabject_prop(n='note', t=0, f='*', v=1.5,
+                                                    c=[is_int_constraint, is_str_constraint])])
+        assert violation_count(ex_info) == 1
+
+    never = ClabjectStateConstraint(name="never", eval_clabject_func=lambda clabject: "violated")
+    Load.define_props([create_clabject_prop(n=name, t=0, f='*', i_sc=True, v=never)
+                       for name in ("first_state", "second_state")])
+    assert len(Load.check_state_constraints()) == 2
+    assert len(Load.check_state_constraints(validation="fail_fast")) == 1